@@ -0,0 +1,113 @@
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# =============================================================================
+# COMPILACIÓN POR LOTES
+# =============================================================================
+#
+# Compila muchos ficheros repartiéndolos entre un pool de procesos. Cada
+# proceso importa parser una sola vez (lexer y tablas LALR incluidos) y lo
+# reutiliza para todos los ficheros que le tocan; los diagnósticos de cada
+# fichero se capturan en su CompilerContext y se devuelven al proceso
+# principal, que muestra el progreso y el resumen. Con la caché de
+# compilación, los procesos no importan parser hasta el primer fallo.
+
+SOURCE_EXT = '.lava'
+
+
+def collect_sources(paths):
+    """Expande los directorios (recursivamente, ficheros .lava) y conserva el orden."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(SOURCE_EXT))
+        else:
+            files.append(path)
+    return files
+
+
+def _init_worker():
+    import parser   # noqa: F401  construye lexer y parser una vez por proceso
+
+
+def _internal_error(path, e):
+    return f"Error interno al compilar '{path}': {e}\n"
+
+
+def compile_file(path, opt_level=0, binary=False, cached=False):
+    """
+    Compila un fichero. Devuelve (ruta, ok, diagnósticos, segundos, acierto),
+    donde acierto indica si la salida vino de la caché (None sin caché). Una
+    excepción durante la compilación cuenta como un fichero con errores.
+    """
+    t0 = time.perf_counter()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except OSError as e:
+        return path, False, f"No se pudo leer '{path}': {e.strerror}\n", 0.0, None
+    try:
+        return _compile_source(path, source, opt_level, binary, cached, t0)
+    except Exception as e:
+        return path, False, _internal_error(path, e), time.perf_counter() - t0, None
+
+
+def _compile_source(path, source, opt_level, binary, cached, t0):
+    out = io.StringIO()
+    if cached:
+        from compile_cache import CompileCache
+        cache = CompileCache()
+        ok = cache.analyze(source, path, opt_level, binary, out=out)
+        return path, ok, out.getvalue(), time.perf_counter() - t0, cache.hits == 1
+
+    from parser import compile_source
+    ctx = compile_source(source, path, opt_level, binary, out=out)
+    return path, not ctx.has_errors, out.getvalue(), time.perf_counter() - t0, None
+
+
+def run_batch(paths, jobs=None, opt_level=0, binary=False, out=None, cached=False):
+    """
+    Compila todos los ficheros con 'jobs' procesos (por defecto, uno por CPU).
+    Devuelve la lista de resultados de compile_file en el orden de entrada.
+    cached=True usa la caché de compilación (compile_cache).
+    """
+    out = out or sys.stdout
+    files = collect_sources(paths)
+    if not files:
+        print("No hay ficheros que compilar.", file=out)
+        return []
+
+    t0 = time.perf_counter()
+    ordered = [None] * len(files)
+    initializer = None if cached else _init_worker
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer) as pool:
+        futures = {pool.submit(compile_file, path, opt_level, binary, cached): i
+                   for i, path in enumerate(files)}
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:      # el proceso del pool terminó sin devolver nada
+                result = (files[i], False, _internal_error(files[i], e), 0.0, None)
+            path, ok, diagnostics, elapsed, hit = ordered[i] = result
+            status = 'OK   ' if ok else 'ERROR'
+            origin = ', caché' if hit else ''
+            print(f"[{done}/{len(files)}] {status} {path} ({elapsed * 1000:.1f} ms{origin})",
+                  file=out)
+
+    failed = [r for r in ordered if not r[1]]
+    for path, _, diagnostics, _, _ in failed:
+        print(f"\n---- {path} ----", file=out)
+        out.write(diagnostics)
+    total = time.perf_counter() - t0
+    print(f"\n{len(files) - len(failed)} correctos, {len(failed)} con errores "
+          f"({len(files)} ficheros en {total:.2f} s)", file=out)
+    if cached:
+        hits = sum(1 for r in ordered if r[4])
+        print(f"[CACHÉ] {hits} aciertos, {len(files) - hits} fallos", file=out)
+    return ordered
@@ -0,0 +1,62 @@
+"""
+Benchmark: compilación con la caché vacía frente a la caché llena.
+
+    python benchmarks/bench_cache.py [copias]
+
+Compila inputCorrecto (con 'copias' variantes distintas) con
+'main.py --cache --batch' dos veces sobre una caché nueva: la primera
+compila y guarda, la segunda restaura todas las salidas sin importar el
+parser. Comprueba que las salidas de ambas pasadas son idénticas.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MAIN = os.path.join(ROOT, 'main.py')
+OUTPUTS = ('symbols', 'records', 'functions', 'quartets')
+
+
+def build(src_dir, env):
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, MAIN, '--cache', '--batch', '-j', '1', src_dir],
+                   env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def snapshot(src_dir):
+    outputs = {}
+    for name in sorted(os.listdir(src_dir)):
+        if name.rsplit('.', 1)[-1] in OUTPUTS:
+            with open(os.path.join(src_dir, name), 'rb') as f:
+                outputs[name] = f.read()
+    return outputs
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with open(os.path.join(ROOT, 'inputCorrecto'), encoding='utf-8') as f:
+        source = f.read()
+    with tempfile.TemporaryDirectory() as tmp:
+        src_dir = os.path.join(tmp, 'src')
+        os.makedirs(src_dir)
+        for i in range(n):
+            with open(os.path.join(src_dir, f'p{i}.lava'), 'w', encoding='utf-8') as f:
+                f.write(source + f"\n// variante {i}\n")
+        env = dict(os.environ, LAVA_CACHE_DIR=os.path.join(tmp, 'cache'))
+
+        t_cold = build(src_dir, env)
+        cold = snapshot(src_dir)
+        for name in cold:
+            os.remove(os.path.join(src_dir, name))
+        t_warm = build(src_dir, env)
+        assert snapshot(src_dir) == cold, "salida distinta"
+        print(f"{n} ficheros: caché vacía {t_cold:.2f} s  caché llena {t_warm:.2f} s "
+              f"({t_cold / t_warm:.1f}x)")
+        print("salidas idénticas")
+
+
+if __name__ == '__main__':
+    main()
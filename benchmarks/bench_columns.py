@@ -0,0 +1,66 @@
+"""
+Benchmark: cálculo de columnas en una única línea de 10 MB.
+
+    python benchmarks/bench_columns.py [megabytes]
+
+Con el inicio de línea incremental del lexer cada columna cuesta O(1). La
+versión anterior de find_column() buscaba con rfind el salto de línea previo
+desde la posición del token, lo que en una sola línea es cuadrático; por eso
+solo se mide sobre prefijos pequeños y se extrapola al tamaño completo.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import lexer as lava_lexer    # noqa: E402
+
+STATEMENT = "x = x + 1; "
+OLD_SIZES = (500_000, 1_000_000, 2_000_000)
+
+
+def rfind_column(token, source=None):
+    """find_column() anterior: busca hacia atrás el último '\\n'."""
+    if source is None:
+        source = token.lexer.source
+    last_cr = source.rfind('\n', 0, token.lexpos)
+    return token.lexpos - last_cr - 1
+
+
+def lex_all(source):
+    lexobj = lava_lexer.lexer.clone()
+    lava_lexer.reset_lexer(lexobj, source)
+    count = 0
+    t0 = time.perf_counter()
+    while lexobj.token():
+        count += 1
+    return count, time.perf_counter() - t0
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    size = int(mb * 1024 * 1024)
+    line = STATEMENT * (size // len(STATEMENT))
+
+    count, elapsed = lex_all(line)
+    print(f"línea de {len(line) / 1e6:.1f} MB, {count} tokens")
+    print(f"inicio de línea incremental: {elapsed:.2f} s ({elapsed / count * 1e9:.0f} ns/token)")
+
+    new_times = [lex_all(line[:n])[1] for n in OLD_SIZES]
+    saved = lava_lexer.find_column
+    lava_lexer.find_column = rfind_column
+    try:
+        old_times = [lex_all(line[:n])[1] for n in OLD_SIZES]
+    finally:
+        lava_lexer.find_column = saved
+    print("rfind (versión anterior) sobre prefijos:")
+    for n, t_old, t_new in zip(OLD_SIZES, old_times, new_times):
+        print(f"  {n / 1e3:6.0f} KB: {t_old:.2f} s  (incremental {t_new:.2f} s)")
+    # Lo que añade rfind crece con el cuadrado de la longitud de la línea
+    estimate = elapsed + (old_times[-1] - new_times[-1]) * (len(line) / OLD_SIZES[-1]) ** 2
+    print(f"rfind estimado para {len(line) / 1e6:.1f} MB: ~{estimate:.0f} s")
+
+
+if __name__ == '__main__':
+    main()
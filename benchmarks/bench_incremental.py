@@ -0,0 +1,80 @@
+"""
+Benchmark: recompilación completa frente a incremental tras editar una función.
+
+    python benchmarks/bench_incremental.py [funciones]
+
+Genera un programa con muchas funciones y sentencias de nivel superior,
+construye el estado incremental, cambia el cuerpo de una función del medio
+y compara compile_source con compile_incremental sobre el programa editado.
+Comprueba que las salidas de ambas compilaciones son idénticas.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from incremental import compile_incremental     # noqa: E402
+from parser import compile_source                # noqa: E402
+
+OUTPUTS = ('symbols', 'records', 'functions', 'quartets')
+
+SNIPPET = """\
+int f{i}(int a, float b) {{
+    int s = a * {i};
+    while (s > 10) {{ s = s - 3; }}
+    if (b > 1.5) {{ print(s); }} else {{ print(b); }}
+    return s;
+}}
+int g{i} = {i} + 2 * 3;
+g{i} = g{i} * 2;
+print(g{i});
+"""
+
+
+def program(n, edited=None):
+    parts = []
+    for i in range(n):
+        part = SNIPPET.format(i=i)
+        if i == edited:
+            part = part.replace("s - 3", "s - 4")
+        parts.append(part)
+    return "".join(parts)
+
+
+def read_outputs(base):
+    result = {}
+    for ext in OUTPUTS:
+        with open(f"{base}.{ext}", encoding='utf-8') as f:
+            result[ext] = f.read()
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'p.lava')
+        base = path[:-5]
+        _, state, _, compiled = compile_incremental(program(n), path, out=io.StringIO())
+        print(f"{compiled} elementos de nivel superior")
+
+        edited = program(n, edited=n // 2)
+        t0 = time.perf_counter()
+        compile_source(edited, path, out=io.StringIO())
+        t_full = time.perf_counter() - t0
+        expected = read_outputs(base)
+
+        t0 = time.perf_counter()
+        _, _, reused, compiled = compile_incremental(edited, path, out=io.StringIO(), state=state)
+        t_inc = time.perf_counter() - t0
+        assert read_outputs(base) == expected, "salida distinta"
+
+        print(f"completa {t_full:.2f} s  incremental {t_inc:.2f} s ({t_full / t_inc:.1f}x), "
+              f"{reused} reutilizados, {compiled} recompilados")
+        print("salidas idénticas")
+
+
+if __name__ == '__main__':
+    main()
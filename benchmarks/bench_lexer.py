@@ -0,0 +1,75 @@
+"""
+Benchmark: rendimiento del lexer de PLY frente a fastlex.
+
+    python benchmarks/bench_lexer.py [sentencias]
+
+Mide tokens por segundo de tres recorridos sobre el mismo programa: el
+Lexer de PLY (una función t_ por token), fastlex.scan() y FastLexer.token(),
+que es lo que consume el parser. Comprueba además que la salida .token de
+ambos motores es idéntica.
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import fastlex                                # noqa: E402
+import lexer as lava_lexer                    # noqa: E402
+from tokenfile import iter_tokens             # noqa: E402
+
+SNIPPET = """\
+/* bloque
+   de comentario */
+int v{i} = 0x1F + 07 * v{j}; // comentario
+float f{i} = 1.5e3 / 2.0;
+boolean b{i} = true && v{j} >= 3 || !false;
+char c{i} = 'a';
+if (v{i} == 10) {{ print(f{i}); }}
+"""
+
+
+def program(n):
+    return "".join(SNIPPET.format(i=i, j=i % 50) for i in range(n))
+
+
+def timed(label, fn, count=None):
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    count = count or result
+    print(f"{label:22s} {elapsed:6.2f} s  {count / elapsed / 1e6:5.2f} Mtok/s")
+    return result, elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    source = program(n)
+    print(f"{len(source) / 1e6:.1f} MB de código")
+
+    def ply_tokens():
+        lexobj = lava_lexer.lexer.clone()
+        lava_lexer.reset_lexer(lexobj, source)
+        return sum(1 for _ in iter(lexobj.token, None))
+
+    def fast_scan():
+        return sum(1 for _ in fastlex.scan(source))
+
+    def fast_tokens():
+        lexobj = fastlex.FastLexer()
+        lexobj.input(source)
+        return sum(1 for _ in iter(lexobj.token, None))
+
+    count, t_ply = timed("PLY Lexer.token()", ply_tokens)
+    _, t_scan = timed("fastlex.scan()", fast_scan, count)
+    _, t_fast = timed("FastLexer.token()", fast_tokens, count)
+    print(f"aceleración: scan {t_ply / t_scan:.1f}x, FastLexer {t_ply / t_fast:.1f}x")
+
+    lexobj = lava_lexer.lexer.clone()
+    lava_lexer.reset_lexer(lexobj, source)
+    assert list(iter_tokens(lexobj)) == list(fastlex.iter_tokens(source)), "salida distinta"
+    print("salida .token idéntica")
+
+
+if __name__ == '__main__':
+    main()
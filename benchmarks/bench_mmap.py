@@ -0,0 +1,68 @@
+"""
+Benchmark: memoria máxima de main.py leyendo el fuente con read() o con mmap.
+
+    python benchmarks/bench_mmap.py [sentencias]
+
+Genera un fichero grande (con comentarios y texto no ASCII) y ejecuta en
+procesos aparte 'main.py --fast --token' y 'main.py --mmap --token', y lo
+mismo con el análisis completo. Muestra el tiempo y el pico de memoria
+residente (ru_maxrss) de cada proceso, y comprueba que los .token coinciden.
+"""
+import filecmp
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MAIN = os.path.join(ROOT, 'main.py')
+
+SNIPPET = """\
+/* año {i}: comentario con acentos, ñ y € */
+int v{i} = {i} + 07 * 2; // cálculo
+char c{i} = 'é';
+"""
+
+
+def write_program(path, n):
+    # Por partes: el proceso hijo hereda la memoria del padre al arrancar,
+    # así que el padre no debe tener el programa entero en memoria
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(n):
+            f.write(SNIPPET.format(i=i))
+
+
+def measure(args, cwd):
+    """Ejecuta main.py y devuelve (segundos, pico de memoria en MB)."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, MAIN, *args], cwd=cwd, stdout=subprocess.DEVNULL)
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - t0
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return elapsed, usage.ru_maxrss * 1024 / scale / 1024
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'big.lava')
+        write_program(path, n)
+        print(f"{os.path.getsize(path) / 1e6:.1f} MB de código")
+
+        for label, mode in (('--token', ['--token']), ('análisis', [])):
+            for flag in ('--fast', '--mmap'):
+                elapsed, peak = measure([flag, *mode, 'big.lava'], tmp)
+                print(f"{label:9s} {flag:7s} {elapsed:6.2f} s  pico {peak:7.1f} MB")
+            if mode:
+                shutil.copy(os.path.join(tmp, 'big.token'), os.path.join(tmp, 'mmap.token'))
+                measure(['--fast', '--token', 'big.lava'], tmp)
+                assert filecmp.cmp(os.path.join(tmp, 'big.token'),
+                                   os.path.join(tmp, 'mmap.token'), shallow=False)
+                print(".token idéntico")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: coste de cerrar bloques anidados según la profundidad.
+
+    python benchmarks/bench_nesting.py [sentencias_por_nivel]
+
+Genera programas con el mismo número total de sentencias pero distinta
+profundidad de 'if' anidados. Con buffers que se copian al cerrar cada bloque
+el coste crece con n·profundidad; con los tramos enlazados de QuartetBuffer
+el cierre es O(1) y el aplanado se hace una sola vez al escribir.
+"""
+import os
+import sys
+import tempfile
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser                             # noqa: E402
+from quartet_store import OperandTable, QuartetBuffer    # noqa: E402
+
+TOTAL = 40000
+DEPTHS = (1, 10, 50, 200, 800)
+
+
+class CopyingBuffer(QuartetBuffer):
+    """Comportamiento anterior: extend() copia las columnas del hijo."""
+
+    def __init__(self, table):
+        super().__init__(table)
+        self._cols = (array('B'), array('i'), array('i'), array('i'))
+
+    def append(self, op, arg1='_', arg2='_', result='_'):
+        intern = self.table.intern
+        ops, a1, a2, r = self._cols
+        ops.append(0)
+        a1.append(intern(arg1)); a2.append(intern(arg2)); r.append(intern(result))
+        self._count += 1
+
+    def extend(self, other):
+        for mine, theirs in zip(self._cols, other._cols):
+            mine.extend(theirs)
+        self._count += other._count
+
+
+def nested_program(depth, total):
+    per_level = max(1, total // depth)
+    lines = ["int x = 0;"]
+    for d in range(depth):
+        lines.append("  " * d + "if (x < 10) {")
+        lines.extend("  " * (d + 1) + f"x = x + {i};" for i in range(per_level))
+    for d in reversed(range(depth)):
+        lines.append("  " * d + "}")
+    return "\n".join(lines) + "\n"
+
+
+def simulate(buffer_cls, depth, total):
+    """Solo la mecánica de buffers: tiempo de cerrar depth bloques ya llenos."""
+    table = OperandTable()
+    stack = [buffer_cls(table)]
+    per_level = max(1, total // depth)
+    for _ in range(depth):
+        stack.append(buffer_cls(table))
+        for i in range(per_level):
+            stack[-1].append('ADD', 'x', i, '@T1')
+    t0 = time.perf_counter()
+    while len(stack) > 1:
+        body = stack.pop()
+        stack[-1].extend(body)
+    return time.perf_counter() - t0
+
+
+def compile_time(depth, total, tmp):
+    source = nested_program(depth, total)
+    t0 = time.perf_counter()
+    ok = lava_parser.analyze(source, os.path.join(tmp, f"nest{depth}.lava"))
+    elapsed = time.perf_counter() - t0
+    assert ok, "el programa generado no compila"
+    return elapsed
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL
+    print(f"{total} cuartetos repartidos en d niveles")
+    print(f"{'prof.':>6} {'cierre copia (ms)':>18} {'cierre tramos (ms)':>19} {'analyze (s)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for depth in DEPTHS:
+            t_copy = simulate(CopyingBuffer, depth, total)
+            t_link = simulate(QuartetBuffer, depth, total)
+            t_full = compile_time(depth, total // 4, tmp)
+            print(f"{depth:6d} {t_copy * 1000:18.3f} {t_link * 1000:19.3f} {t_full:12.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: resolución de sobrecargas en llamadas repetidas.
+
+    python benchmarks/bench_overloads.py [llamadas]
+
+Declara una función con todas las firmas de 1 a 6 parámetros float/boolean
+(126 sobrecargas) y la llama muchas veces con argumentos int, que solo se
+resuelven por conversión. Compila con la búsqueda lineal anterior y con el
+índice por aridad y tipos exactos con resultados memorizados, y comprueba
+que las salidas son idénticas.
+"""
+import filecmp
+import io
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser       # noqa: E402
+from parser import can_convert, report_error   # noqa: E402
+
+CALLS = 20000
+MAX_ARITY = 6
+OUTPUTS = ('symbols', 'records', 'functions', 'quartets')
+
+indexed = lava_parser._resolve_overload
+
+
+def scan_overload(ctx, fname, arg_types, lineno):
+    """Comportamiento anterior: recorre todas las firmas en cada llamada."""
+    sigs = ctx.function_table[fname]
+    for sig in sigs:
+        if [p['type'] for p in sig['params']] == arg_types:
+            return sig
+    candidates = [
+        sig for sig in sigs
+        if len(sig['params']) == len(arg_types)
+        and all(can_convert(at, pt)
+                for at, pt in zip(arg_types, [p['type'] for p in sig['params']]))
+    ]
+    if len(candidates) == 1:
+        return candidates[0]
+    if len(candidates) > 1:
+        report_error(ctx, f"Llamada ambigua a '{fname}' con argumentos {arg_types}.", lineno)
+        return candidates[0]
+    report_error(ctx, f"No hay firma de '{fname}' compatible con argumentos {arg_types}.", lineno)
+    return None
+
+
+def program(calls):
+    lines = []
+    for arity in range(1, MAX_ARITY + 1):
+        for types in itertools.product(('float', 'boolean'), repeat=arity):
+            params = ", ".join(f"{t} p{i}" for i, t in enumerate(types))
+            lines.append(f"int f({params}) {{ return {arity}; }}")
+    lines.append("int x = 0;")
+    for i in range(calls):
+        arity = i % MAX_ARITY + 1
+        args = ", ".join(str(i + k) for k in range(arity))
+        lines.append(f"x = f({args});")
+    return "\n".join(lines) + "\n"
+
+
+def compile_with(resolve, source, path):
+    lava_parser._resolve_overload = resolve
+    try:
+        t0 = time.perf_counter()
+        ok = lava_parser.analyze(source, path, out=io.StringIO())
+        elapsed = time.perf_counter() - t0
+    finally:
+        lava_parser._resolve_overload = indexed
+    assert ok, "el programa generado no compila"
+    return elapsed
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else CALLS
+    source = program(calls)
+    print(f"{2 ** (MAX_ARITY + 1) - 2} sobrecargas, {calls} llamadas por conversión")
+    with tempfile.TemporaryDirectory() as tmp:
+        old_path = os.path.join(tmp, 'old', 'calls.lava')
+        new_path = os.path.join(tmp, 'new', 'calls.lava')
+        os.makedirs(os.path.dirname(old_path))
+        os.makedirs(os.path.dirname(new_path))
+        t_old = compile_with(scan_overload, source, old_path)
+        t_new = compile_with(indexed, source, new_path)
+        for ext in OUTPUTS:
+            assert filecmp.cmp(old_path[:-4] + ext, new_path[:-4] + ext, shallow=False), \
+                f"salida .{ext} distinta"
+    print(f"recorrido lineal {t_old:.2f} s  índice {t_new:.2f} s ({t_old / t_new:.1f}x)")
+    print("salidas idénticas")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: volcado .token secuencial frente al reparto en trozos.
+
+    python benchmarks/bench_parallel_lex.py [sentencias] [procesos]
+
+Genera un programa grande con comentarios de varias líneas y literales de
+carácter, escribe el .token con el camino secuencial de main.py --token y
+con write_text_parallel, y comprueba que ambos ficheros son idénticos.
+"""
+import filecmp
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import lexer as lava_lexer                        # noqa: E402
+from parallel_lex import write_text_parallel      # noqa: E402
+from tokenfile import iter_tokens, write_text     # noqa: E402
+
+SNIPPET = """\
+/* bloque
+   de comentario */
+int v{i} = 0x1F + 07 * v{j}; // comentario
+char c{i} = '\n';
+if (v{i} == 10) {{ print(v{i}); }}
+"""
+
+
+def program(n):
+    return "".join(SNIPPET.format(i=i, j=i % 50) for i in range(n))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    jobs = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    source = program(n)
+    print(f"{len(source) / 1e6:.1f} MB de código, {jobs} procesos")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seq_path = os.path.join(tmp, 'seq.token')
+        par_path = os.path.join(tmp, 'par.token')
+
+        t0 = time.perf_counter()
+        lexobj = lava_lexer.lexer.clone()
+        lava_lexer.reset_lexer(lexobj, source)
+        write_text(iter_tokens(lexobj), seq_path)
+        t_seq = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        write_text_parallel(source, par_path, jobs)
+        t_par = time.perf_counter() - t0
+
+        assert filecmp.cmp(seq_path, par_path, shallow=False), "salida distinta"
+        print(f"secuencial {t_seq:.2f} s  en trozos {t_par:.2f} s  ({t_seq / t_par:.1f}x)")
+        print(".token idéntico")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark: memoria de 1M cuartetos como tuplas de cadenas frente a QuartetBuffer.
+
+    python benchmarks/bench_quartet_memory.py [num_cuartetos]
+
+Reproduce el patrón que genera el compilador para 'v = v + k;' (una operación
+sobre un temporal nuevo seguida de su ASSIGN) y mide con tracemalloc la
+memoria retenida y el pico de cada representación.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from quartet_store import OperandTable, QuartetBuffer   # noqa: E402
+
+VARIABLES = [f"v{i}" for i in range(200)]
+
+
+def stream(n):
+    """Genera n cuartetos con los mismos valores que recibiría emit()."""
+    temp = 0
+    for i in range(n // 2):
+        temp += 1
+        t = f"@T{temp}"
+        var = VARIABLES[i % len(VARIABLES)]
+        yield ('ADD', var, i % 1000, t)
+        yield ('ASSIGN', t, '_', var)
+
+
+def build_tuples(n):
+    """Representación anterior: emit() guardaba str() de cada campo."""
+    def fmt(v):
+        if v is True:  return 'true'
+        if v is False: return 'false'
+        return str(v)
+    out = []
+    for op, a, b, r in stream(n):
+        out.append((fmt(op), fmt(a), fmt(b), fmt(r)))
+    return out
+
+
+def build_store(n):
+    buf = QuartetBuffer(OperandTable())
+    for q in stream(n):
+        buf.append(*q)
+    return buf
+
+
+def measure(builder, n):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = builder(n)
+    elapsed = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return current, peak, elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    mb = 1024 * 1024
+    rows = []
+    for name, builder in (('tuplas de str', build_tuples), ('QuartetBuffer', build_store)):
+        current, peak, elapsed = measure(builder, n)
+        rows.append((name, current, peak, elapsed))
+        print(f"{name:14s}: retenida {current / mb:8.1f} MB  pico {peak / mb:8.1f} MB  ({elapsed:.2f} s)")
+    print(f"reducción     : retenida {rows[0][1] / rows[1][1]:.1f}x  pico {rows[0][2] / rows[1][2]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark: memoria de valores de registro como diccionarios frente a RecordValue.
+
+    python benchmarks/bench_record_memory.py [instancias]
+
+Crea muchas instancias de Planet(int id, Vector pos, Vector vel, float mass)
+con Vector(float x, float y, float z) en la representación anterior
+(diccionarios anidados) y con RecordLayout.new_value(), mide con tracemalloc
+la memoria retenida, cronometra actualizaciones 'p.pos.x = v' con cada una y
+comprueba que los valores son idénticos. Por último mide el pico de memoria
+de analyze sobre un programa que declara las instancias.
+
+Cada actualización hace el trabajo que hace el parser por cada 'p.pos.x' del
+fuente: resolver la ruta campo a campo (p_lvalue_dot) y recorrer el valor.
+Con diccionarios se recorre por nombre; con RecordValue, por la cadena de
+posiciones que p_lvalue_dot va construyendo. El acceso por posiciones no es
+más rápido (construir la cadena cuesta algo más que recorrer por nombre): la
+ganancia de RecordValue es de memoria.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser       # noqa: E402
+from records import RecordLayout, RecordValue   # noqa: E402
+
+INSTANCES = 100_000
+UPDATES = 200_000
+
+VECTOR = [{'name': 'x', 'type': 'float'}, {'name': 'y', 'type': 'float'},
+          {'name': 'z', 'type': 'float'}]
+PLANET = [{'name': 'id', 'type': 'int'}, {'name': 'pos', 'type': 'Vector'},
+          {'name': 'vel', 'type': 'Vector'}, {'name': 'mass', 'type': 'float'}]
+TABLE = {'Vector': VECTOR, 'Planet': PLANET}
+
+
+def dict_value(t):
+    """Representación anterior (default_value con diccionarios)."""
+    if t in TABLE:
+        return {f['name']: dict_value(f['type']) for f in TABLE[t]}
+    return 0 if t == 'int' else 0.0
+
+
+def dict_update(layouts, rtype, value, fields, v):
+    """Representación anterior: tipos por RecordLayout, valor por nombre."""
+    for fname in fields:
+        rtype = layouts[rtype].field(fname)
+    for fname in fields[:-1]:
+        value = value[fname]
+    value[fields[-1]] = v
+
+
+def layout_update(layouts, rtype, value, fields, v):
+    """p_lvalue_dot + _update_record_value: cadena de posiciones."""
+    chain = ()
+    for fname in fields:
+        layout = layouts[rtype]
+        rtype = layout.field(fname)
+        chain = chain + (layout.index[fname],)
+    for i in chain[:-1]:
+        value = value[i]
+    value[chain[-1]] = v
+
+
+def as_dict(value):
+    if isinstance(value, RecordValue):
+        return {fname: as_dict(inner) for fname, inner in value.items()}
+    return value
+
+
+def measure(build, n):
+    tracemalloc.start()
+    values = [build() for _ in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return values, current
+
+
+def program(n):
+    lines = ["record Vector(float x, float y, float z);",
+             "record Planet(int id, Vector pos, Vector vel, float mass);"]
+    for i in range(n):
+        lines.append(f"Planet p{i} = new Planet({i}, new Vector(1.0, 2.0, 3.0), "
+                     f"new Vector(0.5, 0.5, 0.5), 5.0);")
+        lines.append(f"p{i}.pos.x = {i}.5;")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else INSTANCES
+    layouts = {}
+    layouts['Vector'] = RecordLayout('Vector', VECTOR, layouts)
+    layouts['Planet'] = RecordLayout('Planet', PLANET, layouts)
+    planet = layouts['Planet']
+
+    dicts, dict_bytes = measure(lambda: dict_value('Planet'), n)
+    slots, slot_bytes = measure(planet.new_value, n)
+    print(f"{n} instancias de Planet (2 Vector anidados)")
+    print(f"  diccionarios  {dict_bytes / 1e6:7.1f} MB ({dict_bytes / n:.0f} B/instancia)")
+    print(f"  RecordValue   {slot_bytes / 1e6:7.1f} MB ({slot_bytes / n:.0f} B/instancia)"
+          f"  {dict_bytes / slot_bytes:.1f}x menos")
+
+    paths = (('pos', 'x'), ('vel', 'z'), ('mass',))
+    t0 = time.perf_counter()
+    for i in range(UPDATES):
+        dict_update(layouts, 'Planet', dicts[i % n], paths[i % 3], float(i))
+    t_dict = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for i in range(UPDATES):
+        layout_update(layouts, 'Planet', slots[i % n], paths[i % 3], float(i))
+    t_slot = time.perf_counter() - t0
+    print(f"  {UPDATES} actualizaciones: diccionarios {t_dict:.2f} s, "
+          f"posiciones {t_slot:.2f} s")
+
+    assert all(a == as_dict(b) for a, b in zip(dicts, slots)), "valores distintos"
+    print("valores idénticos")
+
+    del dicts, slots
+    decls = min(n, 20_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        tracemalloc.start()
+        ok = lava_parser.analyze(program(decls), os.path.join(tmp, 'planets.lava'),
+                                 out=io.StringIO())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    assert ok, "el programa generado no compila"
+    print(f"analyze con {decls} instancias declaradas: pico {peak / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark: acceso a campos y declaración de registros según su anchura.
+
+    python benchmarks/bench_records.py [variables]
+
+Para registros de distinta anchura (con un registro anidado de la misma
+anchura) mide por separado las dos operaciones que hacía el análisis
+semántico en cada uso: buscar un campo recorriendo la lista de campos y
+construir el valor por defecto recursivamente, frente a la consulta a
+RecordLayout y la copia de su plantilla. Después compila un programa que
+declara y accede a los registros y comprueba que el valor por defecto es
+idéntico con ambos métodos.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser       # noqa: E402
+from records import RecordLayout, RecordValue   # noqa: E402
+
+VARIABLES = 2000
+WIDTHS = (4, 16, 64, 256)
+TYPES = ('int', 'float', 'char', 'boolean')
+
+
+def record_tables(width):
+    inner = [{'name': f"f{i}", 'type': TYPES[i % 4]} for i in range(width)]
+    outer = [{'name': f"g{i}", 'type': TYPES[i % 4]} for i in range(width - 1)]
+    outer.append({'name': 'inner', 'type': 'Inner'})
+    return {'Inner': inner, 'Outer': outer}
+
+
+def scan_default(table, t):
+    """Comportamiento anterior de default_value."""
+    if t == 'int':     return 0
+    if t == 'float':   return 0.0
+    if t == 'char':    return ''
+    if t == 'boolean': return False
+    if t in table:
+        return {f['name']: scan_default(table, f['type']) for f in table[t]}
+    return None
+
+
+def scan_field(table, rtype, fname):
+    """Comportamiento anterior de p_lvalue_dot."""
+    matched = next((f for f in table[rtype] if f['name'] == fname), None)
+    return matched and matched['type']
+
+
+def as_dict(value):
+    if isinstance(value, RecordValue):
+        return {fname: as_dict(inner) for fname, inner in value.items()}
+    return value
+
+
+def time_ops(width, n):
+    table = record_tables(width)
+    layouts = {}
+    for name in table:
+        layouts[name] = RecordLayout(name, table[name], layouts)
+    last = f"f{width - 1}"
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        scan_default(table, 'Outer')
+        scan_field(table, 'Outer', 'inner')
+        scan_field(table, 'Inner', last)
+    t_scan = time.perf_counter() - t0
+
+    outer, inner = layouts['Outer'], layouts['Inner']
+    t0 = time.perf_counter()
+    for _ in range(n):
+        outer.new_value()
+        outer.field('inner')
+        inner.field(last)
+    t_layout = time.perf_counter() - t0
+
+    assert as_dict(outer.new_value()) == scan_default(table, 'Outer'), \
+        "valores por defecto distintos"
+    return t_scan, t_layout
+
+
+def program(width, n):
+    inner = ", ".join(f"{TYPES[i % 4]} f{i}" for i in range(width))
+    outer = ", ".join([f"{TYPES[i % 4]} g{i}" for i in range(width - 1)] + ["Inner inner"])
+    lines = [f"record Inner({inner});", f"record Outer({outer});"]
+    last = f"f{width - 1}"
+    for i in range(n):
+        lines.append(f"Outer v{i};")
+        lines.append(f"v{i}.inner.{last} = v{i}.inner.{last};")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else VARIABLES
+    print(f"{n} declaraciones y accesos por anchura (registro con uno anidado)")
+    print(f"{'campos':>7} {'recorrido (ms)':>15} {'disposición (ms)':>17} {'analyze (s)':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for width in WIDTHS:
+            t_scan, t_layout = time_ops(width, n)
+            t0 = time.perf_counter()
+            ok = lava_parser.analyze(program(width, n), os.path.join(tmp, f"w{width}.lava"),
+                                     out=io.StringIO())
+            t_full = time.perf_counter() - t0
+            assert ok, "el programa generado no compila"
+            print(f"{width:7d} {t_scan * 1000:15.1f} {t_layout * 1000:17.1f} {t_full:12.3f}")
+    print("valores por defecto idénticos")
+
+
+if __name__ == '__main__':
+    main()
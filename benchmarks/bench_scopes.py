@@ -0,0 +1,102 @@
+"""
+Benchmark: búsqueda de identificadores según la profundidad de anidamiento.
+
+    python benchmarks/bench_scopes.py [referencias_por_nivel]
+
+Genera programas con 'if' anidados a distintas profundidades en los que
+cada nivel usa variables globales (el peor caso de la pila de scopes:
+recorrer todos los diccionarios antes de llegar a symbol_table). Compila
+cada uno con la pila de diccionarios anterior y con ScopeMap, y comprueba
+que las salidas son idénticas.
+"""
+import filecmp
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser       # noqa: E402
+from scopes import ScopeMap        # noqa: E402
+
+REFS = 40
+DEPTHS = (1, 10, 100, 400, 1000)
+OUTPUTS = ('symbols', 'records', 'functions', 'quartets')
+
+
+class StackScopes:
+    """Comportamiento anterior: un diccionario por scope, buscados de dentro afuera."""
+
+    def __init__(self):
+        self.stack = []
+
+    def __len__(self):
+        return len(self.stack)
+
+    def push(self):
+        self.stack.append({})
+
+    def pop(self):
+        if self.stack:
+            self.stack.pop()
+
+    def get(self, name):
+        for scope in reversed(self.stack):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def declared_here(self, name):
+        return name in self.stack[-1]
+
+    def declare(self, name, info):
+        self.stack[-1][name] = info
+
+
+def nested_program(depth, refs):
+    lines = ["int g = 0;", "int h = 1;"]
+    for d in range(depth):
+        # Sin sangría: con miles de espacios por línea dominaría el lexer
+        lines.append("if (g < 10) {")
+        lines.append(f"int v{d} = h;")
+        lines.extend(f"g = g + h * v{d};" for _ in range(refs))
+    lines.extend("}" * depth)
+    return "\n".join(lines) + "\n"
+
+
+def compile_with(scopes_cls, source, path):
+    lava_parser.ScopeMap = scopes_cls
+    try:
+        t0 = time.perf_counter()
+        ok = lava_parser.analyze(source, path, out=io.StringIO())
+        elapsed = time.perf_counter() - t0
+    finally:
+        lava_parser.ScopeMap = ScopeMap
+    assert ok, "el programa generado no compila"
+    return elapsed
+
+
+def main():
+    refs = int(sys.argv[1]) if len(sys.argv) > 1 else REFS
+    print(f"{refs} sentencias por nivel, 3 referencias cada una")
+    print(f"{'prof.':>6} {'pila (s)':>10} {'ScopeMap (s)':>13} {'mejora':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for depth in DEPTHS:
+            source = nested_program(depth, refs)
+            old_path = os.path.join(tmp, 'old', f"n{depth}.lava")
+            new_path = os.path.join(tmp, 'new', f"n{depth}.lava")
+            os.makedirs(os.path.dirname(old_path), exist_ok=True)
+            os.makedirs(os.path.dirname(new_path), exist_ok=True)
+            t_old = compile_with(StackScopes, source, old_path)
+            t_new = compile_with(ScopeMap, source, new_path)
+            for ext in OUTPUTS:
+                assert filecmp.cmp(old_path[:-4] + ext, new_path[:-4] + ext, shallow=False), \
+                    f"salida .{ext} distinta a profundidad {depth}"
+            print(f"{depth:6d} {t_old:10.3f} {t_new:13.3f} {t_old / t_new:6.1f}x")
+    print("salidas idénticas")
+
+
+if __name__ == '__main__':
+    main()
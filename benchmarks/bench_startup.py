@@ -0,0 +1,69 @@
+"""
+Benchmark: latencia en frío de 'python main.py' con un programa mínimo.
+
+    python benchmarks/bench_startup.py [repeticiones]
+
+Cada medida lanza un intérprete nuevo. Se compara el arranque normal (tablas
+de lextab.py y parsetab.py ya generadas, sin parser.out) con el modo
+LAVA_GRAMMAR_DEBUG=1, que reconstruye lexer y parser por reflexión, valida la
+gramática y escribe parser.out como hacía yacc.yacc() por defecto. La
+referencia es un intérprete que no hace nada.
+"""
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MAIN = os.path.join(ROOT, 'main.py')
+TABLES = ('lextab.py', 'parsetab.py', 'parser.out')
+
+PROGRAM = "int x = 1;\nprint(x);\n"
+
+
+def time_command(cmd, env, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    base_env = dict(os.environ)
+    base_env.pop('LAVA_GRAMMAR_DEBUG', None)
+    debug_env = dict(base_env, LAVA_GRAMMAR_DEBUG='1')
+
+    # El modo depuración reescribe las tablas: se guardan y se restauran
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in TABLES:
+            if os.path.exists(os.path.join(ROOT, name)):
+                shutil.copy2(os.path.join(ROOT, name), os.path.join(tmp, name))
+        source = os.path.join(tmp, 'prog.lava')
+        with open(source, 'w', encoding='utf-8') as f:
+            f.write(PROGRAM)
+        cases = (
+            ('python -c pass', [sys.executable, '-c', 'pass'], base_env),
+            ('main.py --token', [sys.executable, MAIN, '--token', source], base_env),
+            ('main.py', [sys.executable, MAIN, source], base_env),
+            ('main.py (debug)', [sys.executable, MAIN, source], debug_env),
+        )
+        try:
+            print(f"{'caso':18s} {'mediana (ms)':>13} {'mínimo (ms)':>12}")
+            for name, cmd, env in cases:
+                median, best = time_command(cmd, env, repeat)
+                print(f"{name:18s} {median * 1000:13.1f} {best * 1000:12.1f}")
+        finally:
+            for name in TABLES:
+                saved = os.path.join(tmp, name)
+                if os.path.exists(saved):
+                    shutil.copy2(saved, os.path.join(ROOT, name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: pico de memoria de analyze() con y sin --stream.
+
+    python benchmarks/bench_stream.py [sentencias]
+
+Compila programas de tamaño creciente formados por sentencias de nivel
+superior y mide con tracemalloc el pico de memoria. Sin streaming todos los
+cuartetos se quedan en memoria hasta el final; con streaming se escriben
+según se generan y el pico apenas depende del tamaño del programa.
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser    # noqa: E402
+
+SIZES = (10000, 50000, 200000)
+
+
+def flat_program(n):
+    lines = ["int x = 0;"]
+    lines.extend(f"x = x + {i % 100};" for i in range(n))
+    return "\n".join(lines) + "\n"
+
+
+def measure(source, path, stream):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    ok = lava_parser.analyze(source, path, stream=stream)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert ok, "el programa generado no compila"
+    return peak, elapsed
+
+
+def main():
+    sizes = (int(sys.argv[1]),) if len(sys.argv) > 1 else SIZES
+    mb = 1024 * 1024
+    print(f"{'sentencias':>10} {'pico normal (MB)':>17} {'pico stream (MB)':>17} {'normal (s)':>11} {'stream (s)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            source = flat_program(n)
+            path = os.path.join(tmp, f"flat{n}.lava")
+            peak_full, t_full = measure(source, path, False)
+            peak_stream, t_stream = measure(source, path, True)
+            print(f"{n:10d} {peak_full / mb:17.1f} {peak_stream / mb:17.1f} {t_full:11.2f} {t_stream:11.2f}")
+
+
+if __name__ == '__main__':
+    main()
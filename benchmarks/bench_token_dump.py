@@ -0,0 +1,73 @@
+"""
+Benchmark: volcado y carga de tokens en .token frente a .token.bin.
+
+    python benchmarks/bench_token_dump.py [sentencias]
+
+Los tokens se obtienen una sola vez para medir solo el volcado: la escritura
+línea a línea anterior, el escritor de texto por bloques y el binario. Para
+la carga se compara analizar el .token (split por comas) con TokenFile.
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import lexer as lava_lexer                                             # noqa: E402
+from tokenfile import TokenFile, iter_tokens, write_binary, write_text  # noqa: E402
+
+
+def program(n):
+    return "".join(f"int v{i} = v{i % 50} * 2 + 'c';\nprint(v{i});\n" for i in range(n))
+
+
+def write_lines(tokens, path):
+    """Volcado anterior: un write por token."""
+    with open(path, 'w', encoding='utf-8') as f:
+        for tok_type, lexeme, line, col_start, col_end in tokens:
+            f.write(f"{tok_type}, {lexeme}, {line}, {col_start}, {col_end}\n")
+
+
+def load_text(path):
+    tokens = []
+    with open(path, encoding='utf-8') as f:
+        for row in f:
+            tok_type, rest = row.split(', ', 1)
+            lexeme, line, start, end = rest.rsplit(', ', 3)
+            tokens.append((tok_type, lexeme, int(line), int(start), int(end)))
+    return tokens
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - t0, result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lexobj = lava_lexer.lexer.clone()
+    lava_lexer.reset_lexer(lexobj, program(n))
+    tokens = list(iter_tokens(lexobj))
+    print(f"{len(tokens)} tokens")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, 'p.token')
+        bin_path = os.path.join(tmp, 'p.token.bin')
+        t_lines, _ = timed(write_lines, tokens, text_path)
+        t_text, _ = timed(write_text, tokens, text_path)
+        t_bin, _ = timed(write_binary, tokens, bin_path)
+        print(f"escritura  línea a línea {t_lines:.2f} s  por bloques {t_text:.2f} s  "
+              f"binaria {t_bin:.2f} s")
+        print(f"tamaño     .token {os.path.getsize(text_path) / 1e6:.1f} MB  "
+              f".token.bin {os.path.getsize(bin_path) / 1e6:.1f} MB")
+
+        t_load_text, loaded = timed(load_text, text_path)
+        t_load_bin, tf = timed(TokenFile, bin_path)
+        assert loaded == list(tf) == tokens
+        print(f"carga      .token {t_load_text:.2f} s  TokenFile {t_load_bin:.3f} s (columnas)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: memoria y tiempo de un flujo de tokens con LexToken frente a Token.
+
+    python benchmarks/bench_tokens.py [sentencias]
+
+Tokeniza un programa sintético y conserva todos los tokens en una lista
+(como haría una herramienta que los reutiliza). El lexer de PLY crea
+LexToken con __dict__; LavaLexer crea Token con __slots__.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import ply.lex as lex
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import lexer as lava_lexer    # noqa: E402
+
+
+def program(n):
+    return "".join(f"int v{i} = v{i % 50} * 2 + 'c';\nprint(v{i});\n" for i in range(n))
+
+
+def collect(lexobj, source):
+    lava_lexer.reset_lexer(lexobj, source)
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    tokens = list(iter(lexobj.token, None))
+    elapsed = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(tokens), current, peak, elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    source = program(n)
+
+    plain = lava_lexer.lexer.clone()
+    plain.__class__ = lex.Lexer         # token() original de PLY: LexToken
+    slotted = lava_lexer.lexer.clone()
+
+    mb = 1024 * 1024
+    rows = []
+    for name, lexobj in (('LexToken', plain), ('Token', slotted)):
+        count, current, peak, elapsed = collect(lexobj, source)
+        rows.append((current, elapsed))
+        print(f"{name:9s}: {count} tokens  retenida {current / mb:7.1f} MB "
+              f"({current / count:5.0f} B/token)  pico {peak / mb:7.1f} MB  {elapsed:.2f} s")
+    print(f"reducción: {rows[0][0] / rows[1][0]:.2f}x memoria, {rows[0][1] / rows[1][1]:.2f}x tiempo")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: QuartetVM frente a un intérprete ingenuo línea a línea.
+
+    python benchmarks/bench_vm.py [iteraciones]
+
+El intérprete ingenuo vuelve a dividir y decodificar el texto del cuarteto en
+cada paso, como hacían los intérpretes de usar y tirar; la VM decodifica una
+sola vez al cargar.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from parser import analyze                  # noqa: E402
+from vm import QuartetVM, load_quartets     # noqa: E402
+
+PROGRAM = """
+int i = 0;
+int s = 0;
+float acc = 0.0;
+while (i < {n}) {{
+    i = i + 1;
+    s = s + i * 2 - 1;
+    if (s > 1000000) {{
+        s = s - 1000000;
+    }}
+    acc = acc + i / 3;
+}}
+print(s);
+print(acc);
+"""
+
+
+def naive_run(lines, out):
+    """Intérprete de referencia: re-analiza el texto en cada paso."""
+    labels = {}
+    for i, line in enumerate(lines):
+        if line.startswith('LABEL,'):
+            labels[line.split(',')[1]] = i
+    env = {}
+
+    def value(tok):
+        if tok == 'true':  return True
+        if tok == 'false': return False
+        try:
+            return int(tok)
+        except ValueError:
+            pass
+        try:
+            return float(tok)
+        except ValueError:
+            return env.get(tok, tok)
+
+    pc = 0
+    while pc < len(lines):
+        op, a, b, r = lines[pc].split(',')
+        pc += 1
+        if op == 'ASSIGN':         env[r] = value(a)
+        elif op == 'ADD':          env[r] = value(a) + value(b)
+        elif op == 'SUB':          env[r] = value(a) - value(b)
+        elif op == 'MUL':          env[r] = value(a) * value(b)
+        elif op == 'DIV':
+            x, y = value(a), value(b)
+            env[r] = x // y if isinstance(x, int) and isinstance(y, int) else x / y
+        elif op == 'GT':           env[r] = value(a) > value(b)
+        elif op == 'LT':           env[r] = value(a) < value(b)
+        elif op == 'EQ':           env[r] = value(a) == value(b)
+        elif op == 'INT_TO_FLOAT': env[r] = float(value(a))
+        elif op == 'JUMP':         pc = labels[a]
+        elif op == 'JUMPF':
+            if not value(a): pc = labels[b]
+        elif op == 'JUMPT':
+            if value(a): pc = labels[b]
+        elif op == 'PRINT':        out.write(str(value(a)) + '\n')
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'bench.lava')
+        if not analyze(PROGRAM.format(n=n), src):
+            sys.exit("El programa de prueba no compila")
+        path = os.path.join(tmp, 'bench.quartets')
+        with open(path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+
+        out_naive = io.StringIO()
+        t0 = time.perf_counter()
+        naive_run(lines, out_naive)
+        t_naive = time.perf_counter() - t0
+
+        out_vm = io.StringIO()
+        t0 = time.perf_counter()
+        vm = QuartetVM(load_quartets(path), out=out_vm)
+        t_load = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        vm.run()
+        t_vm = time.perf_counter() - t0
+
+    assert out_naive.getvalue() == out_vm.getvalue(), "las salidas no coinciden"
+    print(f"iteraciones: {n}  cuartetos: {len(lines)}")
+    print(f"ingenuo : {t_naive:8.3f} s")
+    print(f"VM      : {t_vm:8.3f} s  (+{t_load * 1000:.2f} ms de carga)")
+    print(f"speedup : {t_naive / t_vm:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+
+# =============================================================================
+# GRAFO DE FLUJO DE CONTROL SOBRE CUARTETOS
+# =============================================================================
+#
+# Divide una lista de cuartetos en bloques básicos y construye las aristas
+# sucesor/predecesor, los dominadores inmediatos y los bucles naturales.
+# Todo se indexa por número de bloque y se guarda en array('i'):
+#   - block_start[b]                 primer cuarteto del bloque b
+#   - block_start[b + 1]             uno más allá del último (centinela final)
+#   - succ_offsets / succ_targets    sucesores en formato CSR
+#   - pred_offsets / pred_targets    predecesores en formato CSR
+#   - idom[b]                        dominador inmediato (-1: entrada o inalcanzable)
+#   - dom_pre[b] / dom_last[b]       intervalo en preorden del subárbol de b en el
+#                                    árbol de dominadores (-1: inalcanzable); a domina
+#                                    a b si pre(b) cae en el intervalo de a, en O(1)
+# El bloque 0 es siempre la entrada.
+
+BRANCH_OPS = ('JUMP', 'JUMPF', 'JUMPT')
+
+# Bucle natural: bloque cabecera y array ordenado de bloques del cuerpo
+Loop = namedtuple('Loop', ['header', 'blocks'])
+
+
+def jump_target(q):
+    """Etiqueta destino de un cuarteto de salto."""
+    return q[1] if q[0] == 'JUMP' else q[2]
+
+
+class ControlFlowGraph:
+
+    def __init__(self, quartets):
+        self.quartets = quartets
+        self._build_blocks()
+        self._build_edges()
+        self._compute_dominators()
+        self._find_loops()
+
+    def __len__(self):
+        return len(self.block_start) - 1
+
+    # ---- Bloques básicos ----
+
+    def _build_blocks(self):
+        quartets = self.quartets
+        n = len(quartets)
+        is_leader = bytearray(n + 1)
+        if n:
+            is_leader[0] = 1
+        for i, q in enumerate(quartets):
+            if q[0] == 'LABEL':
+                is_leader[i] = 1
+            elif q[0] in BRANCH_OPS:
+                is_leader[i + 1] = 1
+        starts = array('i', (i for i in range(n) if is_leader[i]))
+        starts.append(n)
+        self.block_start = starts
+
+        self.label_block = {}
+        for b in range(len(starts) - 1):
+            q = quartets[starts[b]]
+            if q[0] == 'LABEL':
+                self.label_block[q[1]] = b
+
+    def block_of(self, index):
+        """Bloque que contiene el cuarteto 'index'."""
+        return bisect_right(self.block_start, index, 0, len(self)) - 1
+
+    def block_range(self, b):
+        return range(self.block_start[b], self.block_start[b + 1])
+
+    # ---- Aristas ----
+
+    def _build_edges(self):
+        nblocks = len(self)
+        quartets = self.quartets
+        succ_offsets = array('i', [0])
+        succ_targets = array('i')
+        for b in range(nblocks):
+            last = quartets[self.block_start[b + 1] - 1]
+            op = last[0]
+            fallthrough = b + 1 if b + 1 < nblocks else -1
+            if op in BRANCH_OPS:
+                target = self.label_block.get(jump_target(last), -1)
+                if op != 'JUMP' and fallthrough >= 0:
+                    succ_targets.append(fallthrough)
+                if target >= 0 and (op == 'JUMP' or target != fallthrough):
+                    succ_targets.append(target)
+            elif fallthrough >= 0:
+                succ_targets.append(fallthrough)
+            succ_offsets.append(len(succ_targets))
+        self.succ_offsets = succ_offsets
+        self.succ_targets = succ_targets
+
+        counts = array('i', bytes(4 * (nblocks + 1)))
+        for t in succ_targets:
+            counts[t + 1] += 1
+        for b in range(nblocks):
+            counts[b + 1] += counts[b]
+        pred_targets = array('i', bytes(4 * len(succ_targets)))
+        fill = array('i', counts)
+        for b in range(nblocks):
+            for i in range(succ_offsets[b], succ_offsets[b + 1]):
+                t = succ_targets[i]
+                pred_targets[fill[t]] = b
+                fill[t] += 1
+        self.pred_offsets = counts
+        self.pred_targets = pred_targets
+
+    def successors(self, b):
+        return self.succ_targets[self.succ_offsets[b]:self.succ_offsets[b + 1]]
+
+    def predecessors(self, b):
+        return self.pred_targets[self.pred_offsets[b]:self.pred_offsets[b + 1]]
+
+    # ---- Dominadores (Cooper, Harvey y Kennedy) ----
+
+    def _reverse_postorder(self):
+        nblocks = len(self)
+        if not nblocks:
+            return array('i')
+        offsets, targets = self.succ_offsets, self.succ_targets
+        visited = bytearray(nblocks)
+        post = array('i')
+        visited[0] = 1
+        stack = [(0, offsets[0])]
+        while stack:
+            b, i = stack[-1]
+            if i < offsets[b + 1]:
+                stack[-1] = (b, i + 1)
+                s = targets[i]
+                if not visited[s]:
+                    visited[s] = 1
+                    stack.append((s, offsets[s]))
+            else:
+                stack.pop()
+                post.append(b)
+        post.reverse()
+        return post
+
+    def _compute_dominators(self):
+        nblocks = len(self)
+        self.rpo = rpo = self._reverse_postorder()
+        order = array('i', [-1]) * nblocks
+        for i, b in enumerate(rpo):
+            order[b] = i
+        idom = array('i', [-1]) * nblocks
+        if nblocks:
+            idom[0] = 0
+
+        def intersect(a, b):
+            while a != b:
+                while order[a] > order[b]:
+                    a = idom[a]
+                while order[b] > order[a]:
+                    b = idom[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for b in rpo[1:]:
+                new = -1
+                for p in self.predecessors(b):
+                    if idom[p] < 0:
+                        continue
+                    new = p if new < 0 else intersect(p, new)
+                if idom[b] != new:
+                    idom[b] = new
+                    changed = True
+        if nblocks:
+            idom[0] = -1
+        self.idom = idom
+        self._number_dominator_tree()
+
+    def _number_dominator_tree(self):
+        """Numera el árbol de dominadores en preorden (recorrido iterativo)."""
+        nblocks = len(self)
+        idom = self.idom
+        offsets = array('i', bytes(4 * (nblocks + 1)))
+        for b in range(nblocks):
+            if idom[b] >= 0:
+                offsets[idom[b] + 1] += 1
+        for b in range(nblocks):
+            offsets[b + 1] += offsets[b]
+        children = array('i', bytes(4 * offsets[nblocks]))
+        fill = array('i', offsets)
+        for b in range(nblocks):
+            d = idom[b]
+            if d >= 0:
+                children[fill[d]] = b
+                fill[d] += 1
+
+        pre = array('i', [-1]) * nblocks
+        last = array('i', [-1]) * nblocks
+        if nblocks:
+            counter = 0
+            pre[0] = 0
+            stack = [(0, offsets[0])]
+            while stack:
+                b, i = stack[-1]
+                if i < offsets[b + 1]:
+                    stack[-1] = (b, i + 1)
+                    c = children[i]
+                    counter += 1
+                    pre[c] = counter
+                    stack.append((c, offsets[c]))
+                else:
+                    stack.pop()
+                    last[b] = counter
+        self.dom_pre = pre
+        self.dom_last = last
+
+    def dominates(self, a, b):
+        """True si el bloque a domina al bloque b."""
+        if a == b:
+            return True
+        pa, pb = self.dom_pre[a], self.dom_pre[b]
+        return pa >= 0 and pb >= 0 and pa <= pb <= self.dom_last[a]
+
+    # ---- Bucles naturales ----
+
+    def _find_loops(self):
+        bodies = {}
+        for u in self.rpo:
+            for h in self.successors(u):
+                if self.dominates(h, u):
+                    body = bodies.setdefault(h, {h})
+                    stack = [u]
+                    while stack:
+                        x = stack.pop()
+                        if x in body:
+                            continue
+                        body.add(x)
+                        stack.extend(self.predecessors(x))
+        self.loops = [Loop(h, array('i', sorted(body))) for h, body in sorted(bodies.items())]
@@ -0,0 +1,338 @@
+import hashlib
+import io
+import json
+import os
+import pickle
+import shutil
+import sys
+import uuid
+from contextlib import contextmanager
+
+# =============================================================================
+# CACHÉ DE COMPILACIÓN DIRECCIONADA POR CONTENIDO
+# =============================================================================
+#
+# La clave de una compilación es el sha256 de:
+#   - la versión del compilador: el contenido de los módulos que influyen en
+#     la salida, incluidos parsetab.py (con _lr_signature, la firma de la
+#     gramática), lextab.py (con _lexsignature) y los propios incremental.py
+#     y compile_cache.py, que producen y reutilizan el estado por elementos;
+#   - las opciones que cambian la salida (nivel de optimización y binario);
+#   - el código fuente, en bytes UTF-8.
+# Cada entrada es un directorio <raíz>/<2 primeros>/<clave> con las salidas
+# (symbols, records, functions, quartets y, si se pidió, quartets.bin) y
+# result.json con el resultado y los diagnósticos, que se repiten tal cual
+# en un acierto. Los análisis con errores también se guardan (solo con sus
+# diagnósticos). En un acierto no se importa parser: ni lexer ni tablas.
+#
+# Con incremental=True, un fallo no compila el fichero entero sino con
+# incremental.compile_incremental, a partir del estado por elementos de la
+# compilación anterior del mismo fichero (y nivel de optimización), que se
+# guarda en <raíz>/incremental/<huella>.pickle.
+#
+# Expulsión LRU: un acierto actualiza la fecha de modificación de la
+# entrada, y al guardar una nueva, si el total supera el límite, se borran
+# las entradas más antiguas (los estados incrementales cuentan igual).
+# El total se lleva en <raíz>/size, que cada guardado actualiza con el
+# tamaño de lo que añade (con <raíz>/size.lock bloqueado: los procesos de
+# --batch guardan a la vez). Solo cuando el total pasa del límite, o si
+# falta el índice, se recorren y ordenan las entradas, y el recorrido deja
+# en el índice el total exacto.
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+COMPILER_FILES = ('lexer.py', 'lextab.py', 'fastlex.py', 'parser.py', 'parsetab.py',
+                  'scopes.py', 'records.py', 'quartet_store.py', 'quartet_binary.py',
+                  'peephole.py', 'liveness.py', 'cfg.py', 'incremental.py', 'compile_cache.py')
+OUTPUTS = ('symbols', 'records', 'functions', 'quartets')
+RESULT = 'result.json'
+INCREMENTAL_DIR = 'incremental'
+SIZE_INDEX = 'size'
+SIZE_LOCK = 'size.lock'
+
+_compiler_version = None
+
+
+def compiler_version():
+    """Huella de los módulos del compilador (se calcula una vez por proceso)."""
+    global _compiler_version
+    if _compiler_version is None:
+        h = hashlib.sha256(b'lava-cache %d\0' % CACHE_FORMAT)
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in COMPILER_FILES:
+            h.update(name.encode('ascii') + b'\0')
+            with open(os.path.join(here, name), 'rb') as f:
+                h.update(f.read())
+        _compiler_version = h.digest()
+    return _compiler_version
+
+
+def default_cache_dir():
+    """LAVA_CACHE_DIR, o lava/ bajo XDG_CACHE_HOME (~/.cache por defecto)."""
+    path = os.environ.get('LAVA_CACHE_DIR')
+    if path:
+        return path
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'lava')
+
+
+def default_max_bytes():
+    """LAVA_CACHE_SIZE en MB, o DEFAULT_MAX_BYTES."""
+    size = os.environ.get('LAVA_CACHE_SIZE')
+    return int(size) * 1024 * 1024 if size and size.isdigit() else DEFAULT_MAX_BYTES
+
+
+class CompileCache:
+    """
+    Caché en disco de compilaciones completas. analyze() tiene la misma
+    interfaz que parser.analyze; hits, misses y evictions acumulan las
+    estadísticas de esta instancia.
+    """
+
+    def __init__(self, root=None, max_bytes=None):
+        self.root = root or default_cache_dir()
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reused = 0
+        self.recompiled = 0
+        self.incremental_runs = 0
+
+    # ---- claves y entradas ----
+
+    def key(self, source, opt_level=0, binary=False):
+        h = hashlib.sha256(compiler_version())
+        h.update(b'O%d b%d\0' % (opt_level, bool(binary)))
+        h.update(source.encode('utf-8') if isinstance(source, str) else source)
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.root, key[:2], key)
+
+    def lookup(self, key):
+        """Directorio de la entrada (y la marca como usada) o None."""
+        entry = self._entry(key)
+        try:
+            os.utime(entry)
+        except OSError:
+            return None
+        return entry
+
+    def restore(self, entry, input_filename, out=None):
+        """Copia las salidas de la entrada junto a input_filename. Devuelve ok."""
+        with open(os.path.join(entry, RESULT), encoding='utf-8') as f:
+            result = json.load(f)
+        base = input_filename.rsplit('.', 1)[0]
+        for ext in result['outputs']:
+            shutil.copyfile(os.path.join(entry, ext), base + '.' + ext)
+        (out or sys.stdout).write(result['diagnostics'])
+        return result['ok']
+
+    def store(self, key, input_filename, ok, diagnostics, binary=False):
+        """Guarda las salidas recién escritas de input_filename bajo 'key'."""
+        base = input_filename.rsplit('.', 1)[0]
+        outputs = (OUTPUTS + ('quartets.bin',) if binary else OUTPUTS) if ok else ()
+        entry = self._entry(key)
+        tmp = os.path.join(self.root, f"tmp-{uuid.uuid4().hex}")
+        os.makedirs(tmp)
+        try:
+            for ext in outputs:
+                shutil.copyfile(base + '.' + ext, os.path.join(tmp, ext))
+            with open(os.path.join(tmp, RESULT), 'w', encoding='utf-8') as f:
+                json.dump({'ok': ok, 'diagnostics': diagnostics, 'outputs': list(outputs)}, f)
+            size = sum(f.stat().st_size for f in os.scandir(tmp))
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            os.rename(tmp, entry)
+        except OSError:
+            # Otro proceso guardó la misma clave, o no se pudo escribir: la
+            # compilación ya está hecha, así que basta con no guardarla
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self._account(size)
+
+    # ---- estado incremental ----
+
+    def state_path(self, input_filename, opt_level=0):
+        h = hashlib.sha256(compiler_version())
+        h.update(b'O%d\0' % opt_level)
+        h.update(os.path.abspath(input_filename).encode('utf-8'))
+        return os.path.join(self.root, INCREMENTAL_DIR, h.hexdigest() + '.pickle')
+
+    def load_state(self, path):
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+            os.utime(path)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        return state
+
+    def save_state(self, path, state):
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, 'wb') as f:
+                pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+            size = os.path.getsize(tmp)
+            try:
+                size -= os.path.getsize(path)       # reemplaza el estado anterior
+            except OSError:
+                pass
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        self._account(size)
+
+    # ---- expulsión ----
+
+    def _entries(self):
+        """(mtime, bytes, ruta) de cada entrada y de cada estado incremental."""
+        entries = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir() or shard.name.startswith('tmp-'):
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    if shard.name == INCREMENTAL_DIR:
+                        if entry.name.endswith('.pickle'):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        continue
+                    size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                    entries.append((entry.stat().st_mtime, size, entry.path))
+                except OSError:
+                    continue        # borrada por otro proceso
+        return entries
+
+    @contextmanager
+    def _size_lock(self):
+        """Bloqueo exclusivo entre procesos del índice de tamaño."""
+        with open(os.path.join(self.root, SIZE_LOCK), 'a+b') as f:
+            if os.name == 'nt':
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _read_total(self):
+        try:
+            with open(os.path.join(self.root, SIZE_INDEX), encoding='ascii') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_total(self, total):
+        try:
+            with open(os.path.join(self.root, SIZE_INDEX), 'w', encoding='ascii') as f:
+                f.write(str(total))
+        except OSError:
+            pass                    # sin índice, el próximo guardado recorre
+
+    def _account(self, added):
+        """Suma 'added' bytes al total y expulsa solo si pasa del límite."""
+        try:
+            with self._size_lock():
+                total = self._read_total()
+                if total is None:
+                    # Sin índice: el recorrido ya incluye lo recién guardado
+                    total = self._evict()
+                else:
+                    total += added
+                    if total > self.max_bytes:
+                        total = self._evict()
+                self._write_total(total)
+        except OSError:
+            pass                    # no se pudo bloquear: se expulsará en otro guardado
+
+    def evict(self):
+        """Borra las entradas usadas hace más tiempo hasta caber en max_bytes."""
+        with self._size_lock():
+            self._write_total(self._evict())
+
+    def _evict(self):
+        """evict() con el índice ya bloqueado; devuelve el total resultante."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path.endswith('.pickle'):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            else:
+                shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            self.evictions += 1
+        return total
+
+    # ---- compilación ----
+
+    def analyze(self, source, input_filename, opt_level=0, binary=False, stream=False,
+                out=None, fast_lexer=False, incremental=False):
+        """
+        Como parser.analyze, pero restaurando la salida de la caché si existe.
+        incremental=True compila los fallos con incremental (no admite stream).
+        """
+        out = out or sys.stdout
+        key = self.key(source, opt_level, binary)
+        entry = self.lookup(key)
+        if entry is not None:
+            try:
+                ok = self.restore(entry, input_filename, out)
+            except (OSError, ValueError, KeyError):
+                pass                # entrada incompleta o expulsada: compilar
+            else:
+                self.hits += 1
+                return ok
+
+        self.misses += 1
+        captured = io.StringIO()
+        if incremental and not stream:
+            ok = self._compile_incremental(source, input_filename, opt_level, binary, captured)
+        else:
+            from parser import analyze
+            ok = analyze(source, input_filename, opt_level, binary, stream, captured, fast_lexer)
+        diagnostics = captured.getvalue()
+        out.write(diagnostics)
+        self.store(key, input_filename, ok, diagnostics, binary)
+        return ok
+
+    def _compile_incremental(self, source, input_filename, opt_level, binary, out):
+        from incremental import compile_incremental
+        path = self.state_path(input_filename, opt_level)
+        ctx, state, reused, compiled = compile_incremental(
+            source, input_filename, opt_level, binary, out, self.load_state(path))
+        if state is not None:
+            self.save_state(path, state)
+            self.incremental_runs += 1
+        self.reused += reused
+        self.recompiled += compiled
+        return not ctx.has_errors
+
+    def stats(self):
+        line = (f"[CACHÉ] {self.hits} aciertos, {self.misses} fallos, "
+                f"{self.evictions} expulsiones ({self.root})")
+        if self.incremental_runs:
+            line += (f"\n[INCREMENTAL] {self.reused} elementos reutilizados, "
+                     f"{self.recompiled} recompilados")
+        return line
@@ -0,0 +1,123 @@
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import time
+
+# =============================================================================
+# SERVICIO DE COMPILACIÓN PERSISTENTE
+# =============================================================================
+#
+# Mantiene el lexer y las tablas del parser cargados y atiende peticiones de
+# compilación en formato JSON, una por línea:
+#
+#   petición   {"id": ..., "source": "<código>", "output": "dir/prog.lava",
+#               "opt_level": 0, "binary": false}
+#   respuesta  {"id": ..., "ok": true, "diagnostics": ["..."], "elapsed_ms": 1.2}
+#
+# "output" es el nombre del fichero fuente: las salidas (.symbols, .quartets,
+# ...) se escriben junto a él con el mismo nombre base. Si falta "source" se
+# lee el propio "output". Una petición inválida, o una compilación que falla
+# con una excepción, recibe {"id", "ok": false, "error": "..."}. El canal es
+# la entrada/salida estándar o un socket Unix, donde cada conexión puede
+# enviar tantas peticiones como quiera.
+
+
+def handle_request(line):
+    """Atiende una línea de petición y devuelve la respuesta como dict."""
+    from parser import compile_source
+
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("la petición debe ser un objeto JSON")
+    except ValueError as e:
+        return {'id': None, 'ok': False, 'error': f"Petición inválida: {e}"}
+
+    rid = request.get('id')
+    output = request.get('output')
+    opt_level = request.get('opt_level', 0)
+    if not isinstance(output, str) or not output:
+        return {'id': rid, 'ok': False, 'error': "Falta el campo 'output'."}
+    if type(opt_level) is not int or opt_level not in (0, 1, 2):
+        return {'id': rid, 'ok': False, 'error': f"Nivel de optimización no válido: {opt_level!r}."}
+
+    t0 = time.perf_counter()
+    source = request.get('source')
+    try:
+        if source is None:
+            with open(output, 'r', encoding='utf-8') as f:
+                source = f.read()
+        out = io.StringIO()
+        ctx = compile_source(source, output, opt_level, bool(request.get('binary')), out=out)
+    except OSError as e:
+        return {'id': rid, 'ok': False, 'error': f"{output}: {e.strerror}"}
+    except Exception as e:
+        # Un fallo del compilador solo afecta a esta petición, no al servicio
+        return {'id': rid, 'ok': False, 'error': str(e)}
+    return {
+        'id': rid,
+        'ok': not ctx.has_errors,
+        'diagnostics': out.getvalue().splitlines(),
+        'elapsed_ms': round((time.perf_counter() - t0) * 1000, 3),
+    }
+
+
+def _reply(f, line):
+    f.write(json.dumps(handle_request(line), ensure_ascii=False) + '\n')
+    f.flush()
+
+
+# ---- Canal de entrada/salida estándar ----
+
+def serve_stdio(infile=None, outfile=None):
+    infile = infile or sys.stdin
+    outfile = outfile or sys.stdout
+    for line in infile:
+        if line.strip():
+            _reply(outfile, line)
+
+
+# ---- Socket Unix ----
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        writer = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+        for raw in self.rfile:
+            line = raw.decode('utf-8', errors='replace')
+            if line.strip():
+                _reply(writer, line)
+        writer.detach()
+
+
+class CompileServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_socket(path):
+    if os.path.exists(path):
+        os.remove(path)
+    # SIGTERM termina igual que Ctrl+C, borrando el socket
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with CompileServer(path, _Handler) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(path)
+
+
+def main(args):
+    import parser   # noqa: F401  carga lexer y tablas antes de la primera petición
+    if not args:
+        serve_stdio()
+    elif len(args) == 2 and args[0] == '--socket':
+        print(f"Escuchando en {args[1]}", file=sys.stderr)
+        serve_socket(args[1])
+    else:
+        return False
+    return True
@@ -0,0 +1,223 @@
+import re
+
+from lexer import Token, int_literal, lexer as ply_lexer, reserved
+
+# =============================================================================
+# LEXER RÁPIDO: UNA EXPRESIÓN REGULAR MAESTRA RECORRIDA CON finditer
+# =============================================================================
+#
+# Alternativa al Lexer de PLY con la misma interfaz (input/token) y los mismos
+# tokens. La expresión maestra es la que PLY ya construye a partir de las
+# reglas de lexer.py (funciones en orden de definición y después cadenas de
+# mayor a menor longitud), más un grupo para los caracteres ignorados y otro
+# final que captura cualquier carácter ilegal. En lugar de llamar a una
+# función t_ por token, el bucle de scan() resuelve palabras reservadas,
+# literales numéricos, columnas y saltos de línea en línea.
+#
+# scan_bytes() recorre la misma expresión compilada sobre bytes UTF-8 (por
+# ejemplo, un mmap del fichero) sin decodificar el texto completo: los
+# lexemas se decodifican al reconocerse (con una caché acotada para los que
+# se repiten), lexpos es un desplazamiento en bytes y las columnas se
+# siguen contando en caracteres. Los literales de carácter y los caracteres
+# ilegales abarcan una secuencia UTF-8 completa. A diferencia del texto, \d
+# solo acepta dígitos ASCII.
+
+_IGNORE = ' \t\r'
+
+
+def _master_regex():
+    alternatives = [f"(?P<_ignore>[{re.escape(_IGNORE)}]+)"]
+    alternatives += [lexre.pattern for lexre, _ in ply_lexer.lexre]
+    alternatives.append("(?P<_error>.)")
+    return re.compile('|'.join(alternatives))
+
+
+MASTER = _master_regex()
+
+_UTF8_CHAR = r"[\xc0-\xff][\x80-\xbf]*"
+
+
+def _master_regex_bytes():
+    pattern = MASTER.pattern
+    pattern = pattern.replace("(?P<t_CHAR_VALUE>'[^']')",
+                              f"(?P<t_CHAR_VALUE>'(?:[^'\\x80-\\xff]|{_UTF8_CHAR})')")
+    pattern = pattern.replace("(?P<_error>.)", f"(?P<_error>{_UTF8_CHAR}|[\\x00-\\xbf])")
+    return re.compile(pattern.encode('ascii'))
+
+
+MASTER_BYTES = _master_regex_bytes()
+
+# Grupo de la expresión maestra -> tipo de token, para las reglas de cadena
+SIMPLE_TOKENS = {f"t_{entry[1]}": entry[1]
+                 for _, index in ply_lexer.lexre
+                 for entry in index if entry and entry[0] is None}
+
+
+def scan(data, out=None, lineno=1):
+    """
+    Recorre 'data' y produce (tipo, valor, lexema, línea, lexpos, columna)
+    por token, con el mismo valor que darían las reglas de lexer.py. Los
+    caracteres ilegales se notifican en 'out' y se saltan, como t_error.
+    'lineno' es el número de la primera línea de 'data'.
+    """
+    line_start = 0
+    simple = SIMPLE_TOKENS
+    keywords = reserved
+    for m in MASTER.finditer(data):
+        kind = m.lastgroup
+        if kind == '_ignore':
+            continue
+        lexeme = m.group()
+        pos = m.start()
+        if kind == 't_ID':
+            tok_type = keywords.get(lexeme, 'ID')
+            if tok_type == 'TRUE':
+                value = True
+            elif tok_type == 'FALSE':
+                value = False
+            else:
+                value = lexeme
+            yield tok_type, value, lexeme, lineno, pos, pos - line_start
+        elif kind in simple:
+            yield simple[kind], lexeme, lexeme, lineno, pos, pos - line_start
+        elif kind == 't_newline':
+            lineno += len(lexeme)
+            line_start = m.end()
+        elif kind == 't_INT_VALUE':
+            yield 'INT_VALUE', int_literal(lexeme), lexeme, lineno, pos, pos - line_start
+        elif kind == 't_FLOAT_VALUE':
+            yield 'FLOAT_VALUE', float(lexeme), lexeme, lineno, pos, pos - line_start
+        elif kind == 't_CHAR_VALUE':
+            yield 'CHAR_VALUE', lexeme[1:-1], lexeme, lineno, pos, pos - line_start
+            if lexeme == "'\n'":
+                line_start = pos + 2        # como t_CHAR_VALUE
+        elif kind == 't_COMMENT_MULTILINE':
+            newlines = lexeme.count('\n')
+            if newlines:
+                lineno += newlines
+                line_start = pos + lexeme.rfind('\n') + 1
+        elif kind == 't_COMMENT_SINGLELINE':
+            continue
+        else:
+            print(f"Carácter ilegal '{lexeme}' en la línea {lineno}", file=out)
+
+
+NON_ASCII = re.compile(rb'[\x80-\xff]')
+LEXEME_CACHE = 4096
+
+
+def scan_bytes(data, out=None, lineno=1):
+    """
+    Como scan(), pero sobre bytes UTF-8 o un objeto compatible (mmap). Los
+    lexemas se devuelven como str y lexpos es la posición en bytes.
+    """
+    size = len(data)
+    # Columnas: hasta el siguiente byte no ASCII (wide) la columna avanza
+    # igual que la posición; a partir de él se decodifica solo el tramo
+    # desde el último punto conocido (anchor, con su columna).
+    anchor = anchor_col = 0
+    wide = -1
+    lexemes = {}
+    simple = SIMPLE_TOKENS
+    keywords = reserved
+    for m in MASTER_BYTES.finditer(data):
+        kind = m.lastgroup
+        if kind == '_ignore':
+            continue
+        raw = m.group()
+        if kind == 't_newline':
+            lineno += len(raw)
+            anchor, anchor_col = m.end(), 0
+            continue
+        if kind == 't_COMMENT_MULTILINE':
+            newlines = raw.count(b'\n')
+            if newlines:
+                lineno += newlines
+                anchor, anchor_col = m.start() + raw.rfind(b'\n') + 1, 0
+            continue
+        if kind == 't_COMMENT_SINGLELINE':
+            continue
+        pos = m.start()
+        if wide < anchor:
+            found = NON_ASCII.search(data, anchor)
+            wide = found.start() if found else size
+        if pos <= wide:
+            col = anchor_col + pos - anchor
+        else:
+            col = anchor_col + len(data[anchor:pos].decode('utf-8'))
+            anchor, anchor_col = pos, col
+        lexeme = lexemes.get(raw)
+        if lexeme is None:
+            if len(lexemes) >= LEXEME_CACHE:
+                lexemes.clear()
+            lexeme = lexemes[raw] = raw.decode('utf-8')
+        if kind == 't_ID':
+            tok_type = keywords.get(lexeme, 'ID')
+            if tok_type == 'TRUE':
+                value = True
+            elif tok_type == 'FALSE':
+                value = False
+            else:
+                value = lexeme
+            yield tok_type, value, lexeme, lineno, pos, col
+        elif kind in simple:
+            yield simple[kind], lexeme, lexeme, lineno, pos, col
+        elif kind == 't_INT_VALUE':
+            yield 'INT_VALUE', int_literal(lexeme), lexeme, lineno, pos, col
+        elif kind == 't_FLOAT_VALUE':
+            yield 'FLOAT_VALUE', float(lexeme), lexeme, lineno, pos, col
+        elif kind == 't_CHAR_VALUE':
+            yield 'CHAR_VALUE', lexeme[1:-1], lexeme, lineno, pos, col
+            if raw == b"'\n'":
+                anchor, anchor_col = pos + 2, 0
+        else:
+            print(f"Carácter ilegal '{lexeme}' en la línea {lineno}", file=out)
+
+
+def _scanner(data):
+    return scan if isinstance(data, str) else scan_bytes
+
+
+def iter_tokens(data, out=None, lineno=1):
+    """
+    Como tokenfile.iter_tokens, pero sobre el texto con scan() (o sobre
+    bytes con scan_bytes()).
+    """
+    for tok_type, _, lexeme, lineno, _, col in _scanner(data)(data, out, lineno):
+        yield tok_type, lexeme, lineno, col, col + len(lexeme)
+
+
+class FastLexer:
+    """
+    Lexer con la interfaz que usa el parser de PLY (input, token, lineno,
+    lexpos) sobre scan(), o sobre scan_bytes() si la entrada son bytes.
+    Produce Token con raw_value y columnas en todos los tokens.
+    """
+
+    def __init__(self, out=None):
+        self.out = out
+        self.source = ''
+        self.lineno = 1
+        self.lexpos = 0
+        self._tokens = iter(())
+
+    def input(self, data):
+        self.source = data
+        self._tokens = _scanner(data)(data, self.out)
+
+    def token(self):
+        for tok_type, value, lexeme, lineno, pos, col in self._tokens:
+            tok = Token()
+            tok.type = tok_type
+            tok.value = value
+            tok.raw_value = lexeme
+            tok.lineno = self.lineno = lineno
+            tok.lexpos = self.lexpos = pos
+            tok.col_start = col
+            tok.col_end = col + len(lexeme)
+            tok.lexer = self
+            return tok
+        return None
+
+    def __iter__(self):
+        return iter(self.token, None)
@@ -0,0 +1,302 @@
+import hashlib
+import io
+import pickle
+import sys
+from collections import namedtuple
+from itertools import islice
+
+import fastlex
+from parser import (CompilerContext, compile_source, finish_compilation, new_parser,
+                    reindex_function, reindex_record)
+from lexer import reserved, reset_lexer
+from quartet_store import QuartetBuffer
+from records import RecordValue
+
+# =============================================================================
+# RECOMPILACIÓN INCREMENTAL POR ELEMENTOS DE NIVEL SUPERIOR
+# =============================================================================
+#
+# El programa se divide en elementos de nivel superior (record_def,
+# function_def, sentencias, if/while/do-while completos) y cada uno se
+# compila por separado sobre el mismo CompilerContext, en orden. De cada
+# elemento compilado se guarda su efecto sobre el contexto:
+#   - las entradas finales de symbol_table y function_table de los nombres
+#     que aparecen en su texto (solo puede leer o escribir esas) y los
+#     registros que declara;
+#   - los cuartetos que emite y cuántos temporales y etiquetas consume.
+# junto con la huella del estado que podía leer antes de compilarse: esas
+# mismas entradas y la tabla de registros completa (los tipos de registro
+# se alcanzan a través de los tipos de las variables, no solo por nombre).
+#
+# En la siguiente compilación, un elemento sin cambios (misma secuencia de
+# tokens) cuyo estado de entrada tiene la misma huella no se analiza: se
+# aplica su efecto, renumerando @Tn y @Ln a partir de los contadores
+# actuales. Si cambia un elemento, o algo que lee, se recompila; los
+# elementos que dependen de él lo notan en su huella y se recompilan también.
+#
+# Los valores de registro (RecordValue) son mutables y una asignación entre
+# registros comparte el mismo objeto. Un efecto aplicado usa copias nuevas,
+# así que los elementos que crean o tocan objetos compartidos no se
+# reutilizan nunca.
+#
+# Cualquier error (léxico, sintáctico o semántico) descarta el trabajo
+# incremental y compila el fichero entero de la forma normal, para que los
+# diagnósticos sean exactamente los mismos.
+
+STATE_FORMAT = 1
+
+Item = namedtuple('Item', 'key text names')
+
+
+_SKIP = frozenset(('_ignore', 't_newline', 't_COMMENT_MULTILINE', 't_COMMENT_SINGLELINE'))
+
+
+def split_items(source):
+    """
+    Elementos de nivel superior de 'source' (lista de Item), o None si no
+    se puede dividir con seguridad (caracteres ilegales o llaves
+    desequilibradas). key es la huella de los tokens del elemento: sus
+    lexemas, que determinan cada uno su tipo.
+    """
+    items = []
+    lexemes = []
+    names = set()
+    start = 0
+    depth = 0
+    is_do = False
+    closed = False          # '}' de nivel 0: termina el elemento salvo con else
+    end = 0
+    for m in fastlex.MASTER.finditer(source):
+        kind = m.lastgroup
+        if kind in _SKIP:
+            continue
+        if kind == '_error':
+            return None
+        lexeme = m.group()
+        if closed:
+            closed = False
+            if lexeme != 'else':
+                items.append(_item(source, start, end, lexemes, names))
+                lexemes, names = [], set()
+        if not lexemes:
+            start = m.start()
+            is_do = lexeme == 'do'
+        lexemes.append(lexeme)
+        end = m.end()
+        if kind == 't_ID':
+            if lexeme not in reserved:
+                names.add(lexeme)
+        elif lexeme == '{':
+            depth += 1
+        elif lexeme == '}':
+            depth -= 1
+            if depth < 0:
+                return None
+            if depth == 0 and not is_do:
+                closed = True
+        elif lexeme == ';' and depth == 0:
+            items.append(_item(source, start, end, lexemes, names))
+            lexemes, names = [], set()
+    if depth:
+        return None
+    if lexemes:
+        items.append(_item(source, start, end, lexemes, names))
+    return items
+
+
+def _item(source, start, end, lexemes, names):
+    key = hashlib.sha256('\0'.join(lexemes).encode('utf-8')).hexdigest()
+    return Item(key, source[start:end], frozenset(names))
+
+
+# =============================================================================
+# ESTADO DE ENTRADA Y EFECTOS
+# =============================================================================
+
+def _snapshot(ctx, names):
+    """Entradas de las tablas que un elemento con estos nombres puede leer."""
+    symbols, functions = ctx.symbol_table, ctx.function_table
+    return [(n, symbols.get(n), functions.get(n)) for n in sorted(names)]
+
+
+def _record_values(snapshot):
+    """
+    id -> (valor, posiciones) de cada valor de registro alcanzable desde
+    snapshot. Se guarda el propio valor para que su id no se reutilice
+    mientras se compara.
+    """
+    found = {}
+
+    def walk(value, where):
+        if isinstance(value, RecordValue):
+            found.setdefault(id(value), (value, []))[1].append(where)
+            for i, inner in enumerate(value):
+                walk(inner, where + (i,))
+
+    for name, info, _ in snapshot:
+        if info is not None:
+            walk(info.get('value'), (name,))
+    return found
+
+
+def _last_keys(table, count):
+    """Las 'count' últimas claves de un dict, en orden de inserción."""
+    return list(islice(reversed(table), count))[::-1]
+
+
+class _Build:
+    """Estado de una compilación incremental sobre un CompilerContext."""
+
+    def __init__(self, ctx, previous):
+        self.ctx = ctx
+        self.previous = previous        # {(huella, n): (huella de entrada, efecto)}
+        self.current = {}
+        self.shared = set()             # ids de valores de registro compartidos
+        self.reused = 0
+        self.compiled = 0
+        self._records = (-1, None)
+
+    def records_digest(self):
+        count, digest = self._records
+        if count != len(self.ctx.record_table):
+            count = len(self.ctx.record_table)
+            digest = hashlib.sha256(pickle.dumps(self.ctx.record_table)).digest()
+            self._records = (count, digest)
+        return digest
+
+    def input_digest(self, snapshot):
+        return hashlib.sha256(pickle.dumps(snapshot) + self.records_digest()).digest()
+
+    # ---- un elemento ----
+
+    def run(self, cparser, clexer, item, slot):
+        snapshot = _snapshot(self.ctx, item.names)
+        digest = self.input_digest(snapshot)
+        old_values = _record_values(snapshot)
+        touches_shared = any(oid in self.shared for oid in old_values)
+
+        cached = self.previous.get(slot)
+        if cached is not None and cached[0] == digest and cached[1] is not None \
+                and not touches_shared:
+            self.replay(cached[1])
+            self.current[slot] = cached
+            self.reused += 1
+            return
+
+        effect = self.compile(cparser, clexer, item, old_values, touches_shared)
+        self.current[slot] = (digest, effect)
+        self.compiled += 1
+
+    def compile(self, cparser, clexer, item, old_values, touches_shared):
+        """Compila el elemento y devuelve su efecto (None si no es reutilizable)."""
+        ctx = self.ctx
+        nsymbols, nfunctions, nrecords = (len(ctx.symbol_table), len(ctx.function_table),
+                                          len(ctx.record_table))
+        temp_base, label_base = ctx.temp_counter, ctx.label_counter
+        item_quartets = QuartetBuffer(ctx.operand_table)
+        ctx.quartet_buffers[0] = item_quartets
+        try:
+            reset_lexer(clexer, item.text)
+            cparser.parse(item.text, lexer=clexer)
+        finally:
+            ctx.quartet_buffers[0] = ctx.quartets
+        rows = item_quartets.rows()
+        ctx.quartets.extend(item_quartets)
+        if ctx.has_errors:
+            return None
+
+        after = _snapshot(ctx, item.names)
+        new_values = _record_values(after)
+        aliased = [oid for oid, (_, where) in new_values.items()
+                   if len(where) > 1 or old_values.get(oid, (None, where))[1] != where]
+        self.shared.update(aliased)
+        if aliased or touches_shared or any(oid in self.shared for oid in new_values):
+            return None
+
+        new_symbols = set(_last_keys(ctx.symbol_table, len(ctx.symbol_table) - nsymbols))
+        new_functions = set(_last_keys(ctx.function_table, len(ctx.function_table) - nfunctions))
+        symbols = [(n, info) for n, info, _ in after if info is not None and n not in new_symbols]
+        symbols += [(n, ctx.symbol_table[n])
+                    for n in _last_keys(ctx.symbol_table, len(new_symbols))]
+        functions = [(n, sigs) for n, _, sigs in after if sigs is not None and n not in new_functions]
+        functions += [(n, ctx.function_table[n])
+                      for n in _last_keys(ctx.function_table, len(new_functions))]
+        records = [(n, ctx.record_table[n])
+                   for n in _last_keys(ctx.record_table, len(ctx.record_table) - nrecords)]
+        return pickle.dumps({
+            'symbols': symbols, 'functions': functions, 'records': records,
+            'quartets': rows,
+            'temp_base': temp_base, 'temps': ctx.temp_counter - temp_base,
+            'label_base': label_base, 'labels': ctx.label_counter - label_base,
+        }, pickle.HIGHEST_PROTOCOL)
+
+    def replay(self, blob):
+        """Aplica un efecto guardado, renumerando temporales y etiquetas."""
+        ctx = self.ctx
+        effect = pickle.loads(blob)
+        for name, info in effect['symbols']:
+            ctx.symbol_table[name] = info
+        for name, sigs in effect['functions']:
+            ctx.function_table[name] = sigs
+            reindex_function(ctx, name)
+        for name, fields in effect['records']:
+            ctx.record_table[name] = fields
+            reindex_record(ctx, name)
+
+        temp_shift = ctx.temp_counter - effect['temp_base']
+        label_shift = ctx.label_counter - effect['label_base']
+
+        def rebase(operand):
+            if operand.__class__ is str:
+                if operand.startswith('@T'):
+                    return f"@T{int(operand[2:]) + temp_shift}"
+                if operand.startswith('@L'):
+                    return f"@L{int(operand[2:]) + label_shift}"
+            return operand
+
+        append = ctx.quartets.append
+        if temp_shift or label_shift:
+            for op, arg1, arg2, result in effect['quartets']:
+                append(op, rebase(arg1), rebase(arg2), rebase(result))
+        else:
+            for row in effect['quartets']:
+                append(*row)
+        ctx.temp_counter += effect['temps']
+        ctx.label_counter += effect['labels']
+
+
+# =============================================================================
+# COMPILACIÓN
+# =============================================================================
+
+def compile_incremental(source, input_filename, opt_level=0, binary=False, out=None,
+                        state=None):
+    """
+    Como parser.compile_source, reutilizando los elementos de 'state' (el
+    estado devuelto por la compilación anterior del mismo fichero, o None).
+    Devuelve (ctx, nuevo estado o None si hubo que compilar entero,
+    reutilizados, compilados).
+    """
+    out = out or sys.stdout
+    if not isinstance(source, str):
+        source = bytes(source).decode('utf-8')
+    items = split_items(source)
+    if items is None:
+        return compile_source(source, input_filename, opt_level, binary, out=out), None, 0, 0
+
+    previous = state.get('items', {}) if state and state.get('format') == STATE_FORMAT else {}
+    ctx = CompilerContext(opt_level, None, io.StringIO())
+    cparser, clexer = new_parser(ctx, fast_lexer=True)
+    build = _Build(ctx, previous)
+    seen = {}
+    for item in items:
+        n = seen[item.key] = seen.get(item.key, -1) + 1
+        build.run(cparser, clexer, item, (item.key, n))
+        if ctx.has_errors:
+            # Diagnósticos idénticos a los de una compilación normal
+            return compile_source(source, input_filename, opt_level, binary, out=out), None, 0, 0
+
+    ctx.out = clexer.out = out
+    finish_compilation(ctx, input_filename, binary)
+    new_state = {'format': STATE_FORMAT, 'items': build.current}
+    return ctx, new_state, build.reused, build.compiled
@@ -1,3 +1,6 @@
+import hashlib
+import os
+
 import ply.lex as lex
 
 # -----------------------------
@@ -54,14 +57,32 @@ t_DOT       = r'\.'
 # -----------------------------
 # Función auxiliar para calcular columnas
 # -----------------------------
+# El lexer guarda en line_start la posición donde empieza la línea actual y
+# t_newline / t_COMMENT_MULTILINE la avanzan junto con lineno, así que la
+# columna del token recién reconocido se obtiene en O(1) sin buscar hacia
+# atrás el último salto de línea (cuadrático en líneas muy largas). Un
+# literal '\n' también la avanza (sin cambiar lineno): la columna siempre se
+# ha contado desde el último '\n' del texto, esté donde esté.
 def find_column(token, source=None):
+    """
+    Columna de un token. Sin 'source' usa el inicio de línea del lexer, que
+    solo es válido para el último token reconocido; con 'source' busca el
+    salto de línea anterior en el texto (sirve para cualquier token).
+    """
     if source is None:
-        source = token.lexer.source
+        return token.lexpos - token.lexer.line_start
     last_cr = source.rfind('\n', 0, token.lexpos)
     if last_cr < 0:
         last_cr = -1
     return token.lexpos - last_cr - 1
 
+def reset_lexer(lexobj, source):
+    """Prepara el lexer para analizar 'source' desde el principio."""
+    lexobj.input(source)
+    lexobj.source = source
+    lexobj.lineno = 1
+    lexobj.line_start = 0
+
 def set_columns(t, lexeme=None):
     if lexeme is None:
         lexeme = t.value
@@ -84,21 +105,28 @@ def t_INT_VALUE(t):
     lexeme = t.value
     t.raw_value = lexeme
     set_columns(t, lexeme)
-    if lexeme.startswith('0b'):
-        t.value = int(lexeme[2:], 2)
-    elif lexeme.startswith('0x'):
-        t.value = int(lexeme[2:], 16)
-    elif lexeme.startswith('0') and len(lexeme) > 1:
-        t.value = int(lexeme[1:], 8)
-    else:
-        t.value = int(lexeme)
+    t.value = int_literal(lexeme)
     return t
 
+def int_literal(lexeme):
+    """Valor de un literal entero: binario (0b), hexadecimal (0x), octal (0...) o decimal."""
+    if lexeme.startswith('0b'):
+        return int(lexeme[2:], 2)
+    if lexeme.startswith('0x'):
+        return int(lexeme[2:], 16)
+    if lexeme.startswith('0') and len(lexeme) > 1:
+        return int(lexeme[1:], 8)
+    return int(lexeme)
+
 def t_CHAR_VALUE(t):
     r"'[^']'"
     t.raw_value = t.value
     set_columns(t, t.raw_value)
     t.value = t.value[1:-1]
+    if t.value == '\n':
+        # La línea no avanza, pero las columnas siguientes se cuentan desde
+        # este salto, como al buscar hacia atrás el último '\n' del texto
+        t.lexer.line_start = t.lexpos + 2
     return t
 
 def t_ID(t):
@@ -117,8 +145,10 @@ def t_ID(t):
 # -----------------------------
 def t_COMMENT_MULTILINE(t):
     r'/\*[\s\S]*?\*/'
-    t.lexer.lineno += t.value.count('\n')
-    pass
+    newlines = t.value.count('\n')
+    if newlines:
+        t.lexer.lineno += newlines
+        t.lexer.line_start = t.lexpos + t.value.rfind('\n') + 1
 
 def t_COMMENT_SINGLELINE(t):
     r'//[^\n]*'
@@ -130,6 +160,7 @@ def t_COMMENT_SINGLELINE(t):
 def t_newline(t):
     r'\n+'
     t.lexer.lineno += len(t.value)
+    t.lexer.line_start = t.lexpos + len(t.value)
 
 # -----------------------------
 # Espacios, tabulaciones y retorno de carro
@@ -140,8 +171,139 @@ t_ignore = ' \t\r'
 # Errores
 # -----------------------------
 def t_error(t):
-    print(f"Carácter ilegal '{t.value[0]}' en la línea {t.lineno}")
+    print(f"Carácter ilegal '{t.value[0]}' en la línea {t.lineno}", file=t.lexer.out)
     t.lexer.skip(1)
 
+# Tokens compactos
+# -----------------------------
+# LexToken de PLY guarda sus atributos en un __dict__ por instancia, que con
+# type, value, lineno, lexpos, lexer, raw_value y las columnas es la mayor
+# parte de la memoria de un flujo de tokens. Token usa __slots__ y LavaLexer
+# es el Lexer de PLY con token() produciendo Token en lugar de LexToken.
+class Token:
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer', 'raw_value', 'col_start', 'col_end')
+
+    def __str__(self):
+        return f"LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+    __repr__ = __str__
+
+class LavaLexer(lex.Lexer):
+
+    def token(self):
+        # Igual que Lexer.token() de PLY 3.11, pero creando Token (sin el
+        # soporte de t_eof, que este lexer no define)
+        lexpos    = self.lexpos
+        lexlen    = self.lexlen
+        lexignore = self.lexignore
+        lexdata   = self.lexdata
+
+        while lexpos < lexlen:
+            if lexdata[lexpos] in lexignore:
+                lexpos += 1
+                continue
+
+            for lexre, lexindexfunc in self.lexre:
+                m = lexre.match(lexdata, lexpos)
+                if not m:
+                    continue
+
+                tok = Token()
+                tok.value = m.group()
+                tok.lineno = self.lineno
+                tok.lexpos = lexpos
+                func, tok.type = lexindexfunc[m.lastindex]
+
+                if not func:
+                    if tok.type:
+                        self.lexpos = m.end()
+                        return tok
+                    lexpos = m.end()
+                    break
+
+                lexpos = m.end()
+                tok.lexer = self
+                self.lexmatch = m
+                self.lexpos = lexpos
+                newtok = func(tok)
+                if not newtok:
+                    # La regla puede haber movido lexpos o cambiado de estado
+                    lexpos    = self.lexpos
+                    lexignore = self.lexignore
+                    break
+                if not self.lexoptimize and newtok.type not in self.lextokens_all:
+                    raise lex.LexError(f"{func.__code__.co_filename}:{func.__code__.co_firstlineno}: "
+                                       f"Rule '{func.__name__}' returned an unknown token type "
+                                       f"'{newtok.type}'", lexdata[lexpos:])
+                return newtok
+            else:
+                if lexdata[lexpos] in self.lexliterals:
+                    tok = Token()
+                    tok.value = tok.type = lexdata[lexpos]
+                    tok.lineno = self.lineno
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos + 1
+                    return tok
+
+                if self.lexerrorf:
+                    tok = Token()
+                    tok.value = self.lexdata[lexpos:]
+                    tok.lineno = self.lineno
+                    tok.type = 'error'
+                    tok.lexer = self
+                    tok.lexpos = lexpos
+                    self.lexpos = lexpos
+                    newtok = self.lexerrorf(tok)
+                    if lexpos == self.lexpos:
+                        raise lex.LexError(f"Scanning error. Illegal character '{lexdata[lexpos]}'",
+                                           lexdata[lexpos:])
+                    lexpos = self.lexpos
+                    if not newtok:
+                        continue
+                    return newtok
+
+                self.lexpos = lexpos
+                raise lex.LexError(f"Illegal character '{lexdata[lexpos]}' at index {lexpos}",
+                                   lexdata[lexpos:])
+
+        self.lexpos = lexpos + 1
+        if self.lexdata is None:
+            raise RuntimeError('No input string given with input()')
+        return None
+
+# -----------------------------
 # Construir el lexer
-lexer = lex.lex()
+# -----------------------------
+# Arranque rápido: las expresiones regulares ya compiladas se guardan en
+# lextab.py junto con un hash de este fichero, y se cargan sin reflexión
+# mientras el hash coincida. Si se ha tocado el lexer (o con
+# LAVA_GRAMMAR_DEBUG=1) se reconstruye por reflexión y se reescribe la tabla.
+LEXTAB = 'lextab'
+GRAMMAR_DEBUG = bool(os.environ.get('LAVA_GRAMMAR_DEBUG'))
+
+def _build_lexer():
+    here = os.path.dirname(os.path.abspath(__file__))
+    with open(os.path.abspath(__file__), 'rb') as f:
+        signature = hashlib.sha1(f.read()).hexdigest()
+    if not GRAMMAR_DEBUG:
+        try:
+            import lextab
+            if getattr(lextab, '_lexsignature', None) == signature:
+                lexobj = lex.lex(optimize=True, lextab=LEXTAB)
+                lexobj.__class__ = LavaLexer
+                return lexobj
+        except ImportError:
+            pass
+    lexobj = lex.lex()
+    lexobj.__class__ = LavaLexer
+    try:
+        lexobj.writetab(LEXTAB, here)
+        with open(os.path.join(here, LEXTAB + '.py'), 'a', encoding='utf-8') as f:
+            f.write(f"_lexsignature = {signature!r}\n")
+    except OSError:
+        pass
+    return lexobj
+
+lexer = _build_lexer()
+lexer.line_start = 0
+lexer.out = None   # destino de los diagnósticos (None: la salida estándar)
@@ -0,0 +1,11 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'ASSIGN', 'BOOLEAN', 'BREAK', 'CHAR', 'CHAR_VALUE', 'COMMA', 'DIV', 'DO', 'DOT', 'ELSE', 'EQ', 'FALSE', 'FLOAT', 'FLOAT_VALUE', 'GE', 'GT', 'ID', 'IF', 'INT', 'INT_VALUE', 'LBRACE', 'LE', 'LPAREN', 'LT', 'MINUS', 'MULT', 'NEW', 'NOT', 'OR', 'PLUS', 'PRINT', 'RBRACE', 'RECORD', 'RETURN', 'RPAREN', 'SEMICOLON', 'TRUE', 'VOID', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [("(?P<t_FLOAT_VALUE>\\d+\\.\\d+([e][+-]?\\d+)?|\\d+[e][+-]?\\d+)|(?P<t_INT_VALUE>0b[01]+|0x[0-9A-F]+|0[0-7]*|0|[1-9][0-9]*)|(?P<t_CHAR_VALUE>'[^']')|(?P<t_ID>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_COMMENT_MULTILINE>/\\*[\\s\\S]*?\\*/)|(?P<t_COMMENT_SINGLELINE>//[^\\n]*)|(?P<t_newline>\\n+)|(?P<t_OR>\\|\\|)|(?P<t_GE>>=)|(?P<t_LE><=)|(?P<t_EQ>==)|(?P<t_AND>&&)|(?P<t_PLUS>\\+)|(?P<t_MULT>\\*)|(?P<t_LPAREN>\\()|(?P<t_RPAREN>\\))|(?P<t_LBRACE>\\{)|(?P<t_RBRACE>\\})|(?P<t_DOT>\\.)|(?P<t_MINUS>-)|(?P<t_DIV>/)|(?P<t_NOT>!)|(?P<t_GT>>)|(?P<t_LT><)|(?P<t_ASSIGN>=)|(?P<t_SEMICOLON>;)|(?P<t_COMMA>,)", [None, ('t_FLOAT_VALUE', 'FLOAT_VALUE'), None, ('t_INT_VALUE', 'INT_VALUE'), ('t_CHAR_VALUE', 'CHAR_VALUE'), ('t_ID', 'ID'), ('t_COMMENT_MULTILINE', 'COMMENT_MULTILINE'), ('t_COMMENT_SINGLELINE', 'COMMENT_SINGLELINE'), ('t_newline', 'newline'), (None, 'OR'), (None, 'GE'), (None, 'LE'), (None, 'EQ'), (None, 'AND'), (None, 'PLUS'), (None, 'MULT'), (None, 'LPAREN'), (None, 'RPAREN'), (None, 'LBRACE'), (None, 'RBRACE'), (None, 'DOT'), (None, 'MINUS'), (None, 'DIV'), (None, 'NOT'), (None, 'GT'), (None, 'LT'), (None, 'ASSIGN'), (None, 'SEMICOLON'), (None, 'COMMA')])]}
+_lexstateignore = {'INITIAL': ' \t\r'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
+_lexsignature = 'f847a2f0714a8c6e3036b4edcc2979ef7cfd5b84'
@@ -0,0 +1,129 @@
+import heapq
+
+from cfg import ControlFlowGraph
+from peephole import is_temp
+
+# =============================================================================
+# ANÁLISIS DE VIDA DE TEMPORALES Y REUTILIZACIÓN DE NOMBRES @T
+# =============================================================================
+#
+# Los conjuntos de temporales vivos se representan como vectores de bits
+# (enteros de Python, un bit por temporal). Con el análisis por bloques del
+# grafo de flujo se calcula, para cada temporal, el intervalo que cubre todos
+# los puntos donde está vivo. Después, un barrido lineal (como un asignador
+# de registros linear-scan) reparte los intervalos disjuntos en los mismos
+# slots, de modo que el número de temporales depende del máximo de valores
+# vivos a la vez y no de la longitud del programa.
+#
+# Puntos dentro de la instrucción i: 2*i lectura de operandos, 2*i+1 escritura
+# del resultado. Así un temporal que muere al leerse en i puede compartir slot
+# con el que se escribe en i (la VM lee los operandos antes de escribir).
+
+
+def _bits(x):
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+def _number_temps(quartets):
+    index = {}
+    for q in quartets:
+        for operand in (q[1], q[2], q[3]):
+            if is_temp(operand) and operand not in index:
+                index[operand] = len(index)
+    return index
+
+
+def live_intervals(quartets, graph=None):
+    """
+    Devuelve {temporal: (inicio, fin)} en puntos 2*i / 2*i+1.
+    'graph' permite reutilizar un ControlFlowGraph ya construido.
+    """
+    if graph is None:
+        graph = ControlFlowGraph(quartets)
+    index = _number_temps(quartets)
+    names = list(index)
+    nblocks = len(graph)
+    starts = [1 << 62] * len(names)
+    ends = [-1] * len(names)
+
+    # Uso/definición por bloque y puntos de lectura/escritura
+    use = [0] * nblocks
+    defs = [0] * nblocks
+    for b in range(nblocks):
+        u = d = 0
+        for i in graph.block_range(b):
+            _, arg1, arg2, result = quartets[i]
+            for operand in (arg1, arg2):
+                if is_temp(operand):
+                    t = index[operand]
+                    bit = 1 << t
+                    if not d & bit:
+                        u |= bit
+                    point = 2 * i
+                    if point < starts[t]: starts[t] = point
+                    if point > ends[t]:   ends[t] = point
+            if is_temp(result):
+                t = index[result]
+                d |= 1 << t
+                point = 2 * i + 1
+                if point < starts[t]: starts[t] = point
+                if point > ends[t]:   ends[t] = point
+        use[b], defs[b] = u, d
+
+    # Flujo de datos hacia atrás hasta el punto fijo
+    live_in = [0] * nblocks
+    live_out = [0] * nblocks
+    changed = True
+    while changed:
+        changed = False
+        for b in range(nblocks - 1, -1, -1):
+            out = 0
+            for s in graph.successors(b):
+                out |= live_in[s]
+            new_in = use[b] | (out & ~defs[b])
+            if out != live_out[b] or new_in != live_in[b]:
+                live_out[b], live_in[b] = out, new_in
+                changed = True
+
+    # Extender los intervalos a través de las fronteras de bloque
+    for b in range(nblocks):
+        first = 2 * graph.block_start[b]
+        after = 2 * graph.block_start[b + 1]
+        for t in _bits(live_in[b]):
+            if first < starts[t]: starts[t] = first
+        for t in _bits(live_out[b]):
+            if after > ends[t]: ends[t] = after
+
+    return {names[t]: (starts[t], ends[t]) for t in range(len(names))}
+
+
+def recycle_temps(quartets):
+    """
+    Renombra los temporales para que los de vida disjunta compartan nombre.
+    Devuelve (nuevos_cuartetos, número_de_temporales).
+    """
+    intervals = live_intervals(quartets)
+    order = sorted(intervals.items(), key=lambda item: item[1])
+    active = []          # (fin, slot)
+    free = []            # slots libres (montículo: siempre el menor)
+    mapping = {}
+    nslots = 0
+    for name, (start, end) in order:
+        while active and active[0][0] < start:
+            heapq.heappush(free, heapq.heappop(active)[1])
+        if free:
+            slot = heapq.heappop(free)
+        else:
+            slot = nslots
+            nslots += 1
+        mapping[name] = f"@T{slot + 1}"
+        heapq.heappush(active, (end, slot))
+
+    def rename(operand):
+        return mapping.get(operand, operand)
+
+    renamed = [(op, rename(a1), rename(a2), rename(res)) for op, a1, a2, res in quartets]
+    return renamed, nslots
@@ -1,51 +1,222 @@
+import os
+import re
 import sys
+from contextlib import contextmanager
 
-def run_lexer(filename):
-    from lexer import lexer, find_column
+# Lo que la lectura en modo texto (saltos de línea universales) cambia al
+# traducir '\r': un '\r' suelto es un salto de línea y un '\r\n' entre
+# comillas, el literal '\n'. Un '\r\n' corriente se lexea igual en bytes.
+_TEXT_ONLY_NEWLINES = re.compile(rb"\r(?!\n)|'\r\n'")
+
+def _read_source(filename):
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            data = f.read()
+            return f.read()
+    except FileNotFoundError:
+        print(f"No se encontró el archivo '{filename}'")
+        sys.exit(1)
+
+@contextmanager
+def _open_source(filename, mapped=False):
+    """
+    Código fuente como str o, con mapped, como mmap de solo lectura del
+    fichero (bytes UTF-8 sin copiar, que solo analiza fastlex). Si el fichero
+    tiene saltos de línea que solo el modo texto interpreta, se lee como str
+    para que las líneas y los literales sean los mismos.
+    """
+    if not mapped:
+        yield _read_source(filename)
+        return
+    import mmap
+    try:
+        f = open(filename, 'rb')
     except FileNotFoundError:
         print(f"No se encontró el archivo '{filename}'")
         sys.exit(1)
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''               # mmap no admite ficheros vacíos
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _TEXT_ONLY_NEWLINES.search(data):
+                yield _read_source(filename)
+            else:
+                yield data
+
+def run_lexer(filename, binary=False, fast_lexer=False, jobs=None, mapped=False):
+    from tokenfile import write_binary, write_text
+
+    base = filename.rsplit('.', 1)[0]
+    if jobs and not binary:
+        from parallel_lex import write_text_parallel
+        write_text_parallel(_read_source(filename), base + '.token', jobs, fast_lexer)
+        return
+    with _open_source(filename, mapped) as data:
+        if fast_lexer or mapped:
+            from fastlex import iter_tokens
+            tokens = iter_tokens(data)
+        else:
+            from lexer import lexer, reset_lexer
+            from tokenfile import iter_tokens
+            reset_lexer(lexer, data)
+            tokens = iter_tokens(lexer)
+
+        if binary:
+            write_binary(tokens, base + '.token.bin')
+        else:
+            write_text(tokens, base + '.token')
+
+def run_analysis(filename, opt_level=0, binary=False, stream=False, fast_lexer=False,
+                 mapped=False, cached=False, incremental=False):
+    if cached or incremental:
+        from compile_cache import CompileCache
+        cache = CompileCache()
+        with _open_source(filename, mapped) as data:
+            ok = cache.analyze(data, filename, opt_level, binary, stream,
+                               fast_lexer=fast_lexer or mapped, incremental=incremental)
+        print(cache.stats())
+        return ok
 
-    lexer.input(data)
-    lexer.source = data
-
-    output_file = filename.rsplit('.', 1)[0] + '.token'
-    with open(output_file, 'w', encoding='utf-8') as f_out:
-        while True:
-            tok = lexer.token()
-            if not tok:
-                break
-            raw_value = getattr(tok, 'raw_value', tok.value)
-            if not hasattr(tok, 'col_start'):
-                tok.col_start = find_column(tok, data)
-                tok.col_end = tok.col_start + len(str(raw_value))
-            f_out.write(f"{tok.type}, {raw_value}, {tok.lineno}, {tok.col_start}, {tok.col_end}\n")
-
-def run_analysis(filename):
     from parser import analyze
 
+    with _open_source(filename, mapped) as data:
+        return analyze(data, filename, opt_level, binary, stream, fast_lexer=fast_lexer or mapped)
+
+def run_program(filename, opt_level=0, fast_lexer=False, mapped=False):
+    from vm import QuartetVM, VMError, load_quartets
+
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = f.read()
+        if filename.endswith('.quartets.bin'):
+            from quartet_binary import QuartetFile, QuartetFileError
+            try:
+                with QuartetFile(filename) as qf:
+                    vm = QuartetVM(qf, typed=True)
+            except QuartetFileError as e:
+                print(f"[ERROR DE EJECUCIÓN] {e}")
+                sys.exit(1)
+        elif filename.endswith('.quartets'):
+            vm = QuartetVM(load_quartets(filename))
+        else:
+            from parser import compile_source
+            with _open_source(filename, mapped) as data:
+                # Se compila en memoria, sin ficheros de salida. Los
+                # diagnósticos van a stderr: stdout es solo la salida de PRINT
+                ctx = compile_source(data, filename, opt_level, out=sys.stderr,
+                                     fast_lexer=fast_lexer or mapped, write_outputs=False)
+            if ctx.has_errors:
+                sys.exit(1)
+            vm = QuartetVM(ctx.quartets.rows(), typed=True)
+        vm.run()
     except FileNotFoundError:
         print(f"No se encontró el archivo '{filename}'")
         sys.exit(1)
+    except VMError as e:
+        print(f"[ERROR DE EJECUCIÓN] {e}")
+        sys.exit(1)
+
+def _parse_jobs(args):
+    """Extrae un '-j N' inicial. Devuelve (N o None, resto de argumentos)."""
+    if len(args) >= 2 and args[0] == '-j':
+        if not args[1].isdigit() or int(args[1]) < 1:
+            usage()
+        return int(args[1]), args[2:]
+    return None, args
+
+def run_batch_mode(args, opt_level=0, cached=False):
+    from batch import run_batch
+
+    jobs, args = _parse_jobs(args)
+    if not args:
+        usage()
+    results = run_batch(args, jobs, opt_level, cached=cached)
+    if not results or not all(ok for _, ok, _, _, _ in results):
+        sys.exit(1)
+
+OPT_FLAGS = ('-O0', '-O1', '-O2')
 
-    analyze(data, filename)
+def usage():
+    print("Uso:")
+    print("  python main.py [-O<n>] <archivo.lava>       -> análisis completo (léxico + sintáctico + semántico)")
+    print("  python main.py --token <archivo.lava>       -> solo análisis léxico (.token)")
+    print("  python main.py --token -j N <archivo.lava>  -> ídem, repartiendo el fichero en trozos entre N procesos")
+    print("  python main.py --token-bin <archivo.lava>   -> ídem, en formato binario (.token.bin)")
+    print("  python main.py [-O<n>] --run <archivo.lava> -> compila en memoria (sin ficheros de salida,")
+    print("                                                 diagnósticos en stderr) y ejecuta los cuartetos")
+    print("  python main.py --run <archivo.quartets>     -> ejecuta un fichero de cuartetos ya generado")
+    print("  python main.py --run <archivo.quartets.bin> -> ídem, desde el formato binario")
+    print("  python main.py --bin <archivo.lava>         -> análisis completo + .quartets.bin")
+    print("  python main.py [-O<n>] --stream <archivo.lava> -> ídem, escribiendo los cuartetos según se generan")
+    print("  python main.py [-O<n>] --batch [-j N] <ficheros o directorios...>")
+    print("                                              -> compila muchos ficheros en paralelo (.lava en directorios)")
+    print("  python main.py --daemon [--socket <ruta>]   -> servicio de compilación (JSON por líneas)")
+    print("Opciones:")
+    print("  --fast  usa el lexer de expresión maestra (fastlex) en lugar del de PLY")
+    print("  --mmap  lee el fuente con mmap y lo analiza como bytes (implica --fast; no se combina con -j)")
+    print("  --cache reutiliza la salida de compilaciones anteriores idénticas (análisis, --bin, --stream")
+    print("          y --batch); directorio en LAVA_CACHE_DIR, límite en MB en LAVA_CACHE_SIZE")
+    print("  --incremental  como --cache, pero si el fichero cambió solo recompila los elementos de")
+    print("          nivel superior modificados y los que dependen de ellos (análisis y --bin;")
+    print("          no admite --stream)")
+    print("Niveles de optimización:")
+    print("  -O0  sin optimizar (por defecto)")
+    print("  -O1  plegado de constantes")
+    print("  -O2  -O1 + optimización de mirilla y reutilización de temporales (no admite --stream)")
+    sys.exit(1)
 
 def main():
-    if len(sys.argv) == 3 and sys.argv[1] == '--token':
-        run_lexer(sys.argv[2])
-    elif len(sys.argv) == 2:
-        run_analysis(sys.argv[1])
+    args = sys.argv[1:]
+    opt_level = 0
+    fast = False
+    mapped = False
+    cached = False
+    incremental = False
+    while args and (args[0] in OPT_FLAGS or
+                    args[0] in ('--fast', '--mmap', '--cache', '--incremental')):
+        flag = args.pop(0)
+        if flag == '--fast':
+            fast = True
+        elif flag == '--mmap':
+            mapped = True
+        elif flag == '--cache':
+            cached = True
+        elif flag == '--incremental':
+            incremental = True
+        else:
+            opt_level = int(flag[2:])
+
+    if args and args[0] == '--daemon':
+        import daemon
+        if not daemon.main(args[1:]):
+            usage()
+    elif args and args[0] == '--batch':
+        run_batch_mode(args[1:], opt_level, cached)
+    elif args and args[0] == '--token':
+        jobs, rest = _parse_jobs(args[1:])
+        if len(rest) != 1 or (jobs and mapped):
+            usage()
+        run_lexer(rest[0], fast_lexer=fast, jobs=jobs, mapped=mapped)
+    elif len(args) == 2 and args[0] == '--token-bin':
+        run_lexer(args[1], binary=True, fast_lexer=fast, mapped=mapped)
+    elif len(args) == 2 and args[0] == '--run':
+        run_program(args[1], opt_level, fast, mapped)
+    elif len(args) == 2 and args[0] == '--bin':
+        run_analysis(args[1], opt_level, binary=True, fast_lexer=fast, mapped=mapped,
+                     cached=cached, incremental=incremental)
+    elif len(args) == 2 and args[0] == '--stream':
+        if opt_level >= 2:
+            print("El modo --stream no admite -O2: la mirilla necesita el programa completo.")
+            sys.exit(1)
+        if incremental:
+            print("El modo --stream no admite --incremental: los cuartetos se escriben según se "
+                  "generan y no quedan elementos que reutilizar.")
+            sys.exit(1)
+        run_analysis(args[1], opt_level, stream=True, fast_lexer=fast, mapped=mapped,
+                     cached=cached)
+    elif len(args) == 1 and not args[0].startswith('--'):
+        run_analysis(args[0], opt_level, fast_lexer=fast, mapped=mapped, cached=cached,
+                     incremental=incremental)
     else:
-        print("Uso:")
-        print("  python main.py <archivo.lava>          -> análisis completo (léxico + sintáctico + semántico)")
-        print("  python main.py --token <archivo.lava>  -> solo análisis léxico (.token)")
-        sys.exit(1)
+        usage()
 
 if __name__ == '__main__':
     main()
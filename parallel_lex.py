@@ -0,0 +1,115 @@
+import io
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from tokenfile import TEXT_LINE
+
+# =============================================================================
+# ANÁLISIS LÉXICO EN PARALELO POR TROZOS
+# =============================================================================
+#
+# Para fuentes muy grandes, el texto se corta en saltos de línea que no
+# pueden estar dentro de un token y cada trozo se tokeniza en un proceso
+# distinto. Los únicos tokens que pueden contener '\n' son los comentarios
+# /* */ y los literales de carácter ('\n' entre comillas); ningún otro token
+# contiene '/' ni comillas simples, así que recorrer el texto con SPANS de
+# izquierda a derecha encuentra exactamente los mismos comentarios y
+# literales que el lexer. Cualquier salto de línea fuera de ellos es un
+# límite seguro: tras él empieza una línea nueva (columnas relativas a su
+# inicio) y solo hay que desplazar el número de línea, que se calcula en
+# la misma pasada y se le pasa a cada proceso. Los trozos se escriben en
+# orden, así que el .token es idéntico byte a byte al secuencial.
+
+SPANS = re.compile(r"/\*[\s\S]*?\*/|//[^\n]*|'[^']'")
+
+MIN_CHUNK = 1 << 18        # por debajo de esto no compensa repartir
+CHUNKS_PER_JOB = 4
+
+
+def split_points(data, parts):
+    """
+    Cortes de 'data' en unos 'parts' trozos, cada uno tras un '\n' seguro.
+    Devuelve (posiciones, líneas): las posiciones empiezan en 0 y terminan
+    en len(data); líneas[i] es el número de línea del lexer al empezar el
+    trozo i. Un literal '\n' no avanza la línea del lexer, así que esos
+    saltos no se cuentan.
+    """
+    size = len(data)
+    points, linenos = [0], [1]
+    char_newlines = 0
+    spans = SPANS.finditer(data)
+    span = next(spans, None)
+    for k in range(1, parts):
+        target = max(size * k // parts, points[-1])
+        while True:
+            nl = data.find('\n', target)
+            if nl < 0:
+                break
+            while span is not None and span.end() <= nl:
+                if span.group() == "'\n'":
+                    char_newlines += 1
+                span = next(spans, None)
+            if span is not None and span.start() <= nl:
+                target = span.end()     # el salto cae dentro de un comentario o literal
+                continue
+            break
+        if nl < 0:
+            break
+        if nl + 1 > points[-1]:
+            linenos.append(linenos[-1] + data.count('\n', points[-1], nl + 1))
+            points.append(nl + 1)
+            linenos[-1] -= char_newlines
+            char_newlines = 0
+    if points[-1] != size:
+        points.append(size)
+    else:
+        linenos.pop()
+    return points, linenos
+
+
+def lex_chunk(chunk, lineno, fast_lexer=False):
+    """
+    Tokeniza un trozo que empieza en la línea 'lineno'. Devuelve las líneas
+    del .token ya formateadas y los mensajes de caracteres ilegales.
+    """
+    out = io.StringIO()
+    if fast_lexer:
+        from fastlex import iter_tokens
+        tokens = iter_tokens(chunk, out, lineno)
+    else:
+        from lexer import lexer, reset_lexer
+        from tokenfile import iter_tokens
+        lexobj = lexer.clone()
+        lexobj.out = out
+        reset_lexer(lexobj, chunk)
+        lexobj.lineno = lineno
+        tokens = iter_tokens(lexobj)
+    return ''.join(map(TEXT_LINE.__mod__, tokens)), out.getvalue()
+
+
+def write_text_parallel(data, path, jobs=None, fast_lexer=False, out=None):
+    """
+    Como write_text(iter_tokens(...)) pero repartiendo 'data' entre 'jobs'
+    procesos (por defecto, uno por CPU). Los mensajes de los trozos se
+    escriben en 'out' en el orden del fichero.
+    """
+    out = out or sys.stdout
+    jobs = jobs or os.cpu_count() or 1
+    parts = max(1, min(jobs * CHUNKS_PER_JOB, len(data) // MIN_CHUNK))
+    points, linenos = split_points(data, parts)
+    chunks = [data[a:b] for a, b in zip(points, points[1:])]
+
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if len(chunks) <= 1 or jobs == 1:
+            results = map(lex_chunk, chunks, linenos, [fast_lexer] * len(chunks))
+            for text, messages in results:
+                out.write(messages)
+                f.write(text)
+            return
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for text, messages in pool.map(lex_chunk, chunks, linenos,
+                                           [fast_lexer] * len(chunks)):
+                out.write(messages)
+                f.write(text)
@@ -1,77 +1,116 @@
+import copy
+import sys
+from functools import partial
+
 import ply.yacc as yacc
-from lexer import tokens
+from lexer import GRAMMAR_DEBUG, lexer as base_lexer, reset_lexer, tokens
+from quartet_store import Char, OperandTable, QuartetBuffer, QuartetStream
+from records import RecordLayout, RecordValue
+from scopes import ScopeMap
 
 # =============================================================================
-# ESTRUCTURAS DE DATOS SEMÁNTICAS
+# CONTEXTO DE COMPILACIÓN
 # =============================================================================
 
-# Tabla de símbolos GLOBAL: { nombre: {'type': str, 'value': any} }
-symbol_table = {}
+class CompilerContext:
+    """
+    Todo el estado de una compilación. Las acciones de la gramática lo
+    obtienen del parser (p.parser.ctx) y lo pasan a las utilidades, de modo
+    que varias compilaciones pueden ejecutarse a la vez en hilos distintos o
+    intercalarse en un mismo proceso sin compartir nada.
+    """
+
+    def __init__(self, opt_level=0, stream_path=None, out=None):
+        # Tabla de símbolos GLOBAL: { nombre: {'type': str, 'value': any} }
+        self.symbol_table = {}
+
+        # Scopes locales anidados (parámetros y bloques abiertos)
+        self.scopes = ScopeMap()
 
-# Pila de scopes locales (parámetros de función activa)
-scope_stack = []
+        # Tabla de registros: { nombre: [{'name': str, 'type': str}, ...] }
+        self.record_table = {}
 
-# Tabla de registros: { nombre: [{'name': str, 'type': str}, ...] }
-record_table = {}
+        # Disposición precalculada de cada registro (records.RecordLayout)
+        self.record_layouts = {}
 
-# Tabla de funciones con sobrecarga:
-#   { nombre: [ {'params': [...], 'return_type': str}, ... ] }
-function_table = {}
+        # Tabla de funciones con sobrecarga:
+        #   { nombre: [ {'params': [...], 'return_type': str}, ... ] }
+        self.function_table = {}
 
-# Tipo de retorno de la función que se está parseando (para validar return)
-current_return_type = None
-pending_function_return_type = None
-current_function_has_return = False
+        # Índice de sobrecargas por función (ver _index_overload):
+        #   { nombre: {'exact': {tipos: firma}, 'arity': {n: [firmas]},
+        #              'memo': {tipos de argumentos: (firma, nº de candidatas)}} }
+        self.overload_index = {}
+
+        # Tipo de retorno de la función que se está parseando (para validar return)
+        self.current_return_type = None
+        self.pending_function_return_type = None
+        self.current_function_has_return = False
+
+        # Parámetros pendientes de empujar al scope cuando se abre '{' de función
+        self.pending_params = []
+
+        # Cuartetos generados: columnas de enteros sobre una tabla de operandos.
+        # Con stream_path los de nivel superior se escriben según se generan.
+        self.operand_table = OperandTable()
+        if stream_path is None:
+            self.quartets = QuartetBuffer(self.operand_table)
+        else:
+            self.quartets = QuartetStream(self.operand_table, stream_path)
+        self.quartet_buffers = [self.quartets]
+        self.emit_enabled_stack = [True]
 
-# Parámetros pendientes de empujar al scope cuando se abre '{' de función
-_pending_params = []
+        # Contadores de temporales y etiquetas
+        self.temp_counter  = 0
+        self.label_counter = 0
 
-# Lista de cuartetos generados
-quartets = []
-quartet_buffers = []
-emit_enabled_stack = [True]
+        # Acumulador de errores y flag global
+        self.semantic_errors = []
+        self.has_errors = False
+        self.loop_depth = 0
+        self.loop_end_label_stack = []
 
-# Contadores de temporales y etiquetas
-_temp_counter  = 0
-_label_counter = 0
+        # Nivel de optimización (0: ninguna, 1: plegado de constantes,
+        #                         2: + mirilla y reutilización de temporales)
+        self.optimization_level = opt_level
 
-# Acumulador de errores y flag global
-semantic_errors = []
-has_errors = False
-loop_depth = 0
-loop_end_label_stack = []
+        # Destino de los diagnósticos (None: la salida estándar actual)
+        self.out = out
 
 
 # =============================================================================
 # UTILIDADES DE SCOPES
 # =============================================================================
 
-def lookup_symbol(name):
+def lookup_symbol(ctx, name):
     """Busca un símbolo: scope local primero, luego global."""
-    for scope in reversed(scope_stack):
-        if name in scope:
-            return scope[name]
-    return symbol_table.get(name)
+    info = ctx.scopes.get(name)
+    return info if info is not None else ctx.symbol_table.get(name)
 
-def declare_in_current_scope(name, info, lineno=None):
+def declare_in_current_scope(ctx, name, info, lineno=None):
     """Declara en el scope más interno disponible."""
-    target = scope_stack[-1] if scope_stack else symbol_table
-    if name in target:
-        report_error(f"La variable '{name}' ya ha sido declarada.", lineno)
+    scopes = ctx.scopes
+    declared = scopes.declared_here(name) if scopes else name in ctx.symbol_table
+    if declared:
+        report_error(ctx, f"La variable '{name}' ya ha sido declarada.", lineno)
         return False
     if 'quad' not in info:
         info['quad'] = False
-    target[name] = info
+    if scopes:
+        scopes.declare(name, info)
+    else:
+        ctx.symbol_table[name] = info
     return True
 
-def push_scope(params):
-    scope = {p['name']: {'type': p['type'], 'value': default_value(p['type']), 'quad': p['type'] in BASIC_TYPES}
-             for p in params}
-    scope_stack.append(scope)
+def push_scope(ctx, params):
+    scopes = ctx.scopes
+    scopes.push()
+    for p in params:
+        scopes.declare(p['name'], {'type': p['type'], 'value': default_value(ctx, p['type']),
+                                   'quad': p['type'] in BASIC_TYPES})
 
-def pop_scope():
-    if scope_stack:
-        scope_stack.pop()
+def pop_scope(ctx):
+    ctx.scopes.pop()
 
 
 # =============================================================================
@@ -81,17 +120,18 @@ def pop_scope():
 BASIC_TYPES = {'int', 'float', 'char', 'boolean'}
 
 
-def is_known_type(t):
-    return t in BASIC_TYPES or t in record_table or t == 'void'
+def is_known_type(ctx, t):
+    return t in BASIC_TYPES or t in ctx.record_table or t == 'void'
 
 
-def default_value(t):
+def default_value(ctx, t):
     if t == 'int':     return 0
     if t == 'float':   return 0.0
     if t == 'char':    return ''
     if t == 'boolean': return False
-    if t in record_table:
-        return {f['name']: default_value(f['type']) for f in record_table[t]}
+    layout = ctx.record_layouts.get(t)
+    if layout is not None:
+        return layout.new_value()
     return None
 
 
@@ -116,68 +156,61 @@ def unify_types(t1, t2):
 # UTILIDADES DE ERRORES
 # =============================================================================
 
-def report_error(msg, lineno=None):
-    global has_errors
-    has_errors = True
+def report_error(ctx, msg, lineno=None):
+    ctx.has_errors = True
     prefix = f"[ERROR SEMÁNTICO] Línea {lineno}: " if lineno else "[ERROR SEMÁNTICO] "
     full = prefix + msg
-    print(full)
-    semantic_errors.append(full)
+    print(full, file=ctx.out)
+    ctx.semantic_errors.append(full)
 
 
 # =============================================================================
 # GENERACIÓN DE CÓDIGO INTERMEDIO (CUARTETOS)
 # =============================================================================
 
-def new_temp():
-    global _temp_counter
-    _temp_counter += 1
-    return f"@T{_temp_counter}"
+def new_temp(ctx):
+    ctx.temp_counter += 1
+    return f"@T{ctx.temp_counter}"
 
 
-def new_label():
-    global _label_counter
-    _label_counter += 1
-    return f"@L{_label_counter}"
+def new_label(ctx):
+    ctx.label_counter += 1
+    return f"@L{ctx.label_counter}"
 
 
-def emit(op, arg1="_", arg2="_", result="_"):
-    if not emit_enabled_stack[-1]:
+def emit(ctx, op, arg1="_", arg2="_", result="_"):
+    if not ctx.emit_enabled_stack[-1]:
         return
-    def fmt(v):
-        if v is True:  return 'true'
-        if v is False: return 'false'
-        return str(v)
-    quartet_buffers[-1].append((fmt(op), fmt(arg1), fmt(arg2), fmt(result)))
+    ctx.quartet_buffers[-1].append(op, arg1, arg2, result)
 
 
-def push_quartet_buffer():
-    quartet_buffers.append([])
+def push_quartet_buffer(ctx):
+    ctx.quartet_buffers.append(QuartetBuffer(ctx.operand_table))
 
 
-def pop_quartet_buffer():
-    if len(quartet_buffers) > 1:
-        return quartet_buffers.pop()
-    return quartet_buffers[0]
+def pop_quartet_buffer(ctx):
+    if len(ctx.quartet_buffers) > 1:
+        return ctx.quartet_buffers.pop()
+    return ctx.quartet_buffers[0]
 
 
-def append_quartets(items):
-    if not emit_enabled_stack[-1]:
+def append_quartets(ctx, items):
+    if not ctx.emit_enabled_stack[-1]:
         return
-    quartet_buffers[-1].extend(items)
+    ctx.quartet_buffers[-1].extend(items)
 
 
-def push_emit_enabled(enabled):
-    inherited = emit_enabled_stack[-1]
-    emit_enabled_stack.append(inherited and enabled)
+def push_emit_enabled(ctx, enabled):
+    inherited = ctx.emit_enabled_stack[-1]
+    ctx.emit_enabled_stack.append(inherited and enabled)
 
 
-def pop_emit_enabled():
-    if len(emit_enabled_stack) > 1:
-        emit_enabled_stack.pop()
+def pop_emit_enabled(ctx):
+    if len(ctx.emit_enabled_stack) > 1:
+        ctx.emit_enabled_stack.pop()
 
 
-def apply_cast(val, src, dst):
+def apply_cast(ctx, val, src, dst):
     """
     Emite instrucciones de casting si src != dst.
     Devuelve (nuevo_val, dst).
@@ -185,25 +218,75 @@ def apply_cast(val, src, dst):
     if src == dst:
         return val, dst
     if src == 'char' and dst == 'int':
-        t = new_temp(); emit('CHAR_TO_INT', val, '_', t); return t, 'int'
+        t = new_temp(ctx); emit(ctx, 'CHAR_TO_INT', val, '_', t); return t, 'int'
     if src == 'char' and dst == 'float':
-        t1 = new_temp(); emit('CHAR_TO_INT',   val, '_', t1)
-        t2 = new_temp(); emit('INT_TO_FLOAT',  t1,  '_', t2); return t2, 'float'
+        t1 = new_temp(ctx); emit(ctx, 'CHAR_TO_INT',   val, '_', t1)
+        t2 = new_temp(ctx); emit(ctx, 'INT_TO_FLOAT',  t1,  '_', t2); return t2, 'float'
     if src == 'int' and dst == 'float':
-        t = new_temp(); emit('INT_TO_FLOAT', val, '_', t); return t, 'float'
+        t = new_temp(ctx); emit(ctx, 'INT_TO_FLOAT', val, '_', t); return t, 'float'
     return val, src   # No debería llegar aquí si se llamó después de can_convert
 
 
 def _literal(value, vtype):
-    if vtype == 'boolean': return 'true' if value else 'false'
-    if vtype == 'char':    return repr(value) if value else "''"
-    return str(value)
+    """Operando constante tipado para un valor por defecto."""
+    if vtype == 'char': return Char(value)
+    return value
 
 
 def _expr_result(expr_type, quad_ref, quad_ok, actual_value):
     return (expr_type, quad_ref, quad_ok, actual_value)
 
 
+# ---- Plegado de constantes (nivel >= 1) ----
+
+def _in_control_flow(ctx):
+    """True dentro de una condición, bloque de control o cuerpo de función."""
+    return len(ctx.quartet_buffers) > 1
+
+
+def _is_stable(ctx, path):
+    """El valor conocido de una variable solo es fiable fuera del control de
+    flujo, si nunca se ha reasignado dentro de él y si la última asignación
+    era plegable."""
+    if _in_control_flow(ctx):
+        return False
+    root = lookup_symbol(ctx, path.split('.')[0])
+    return root is not None and root.get('stable', True) and root.get('foldable', True)
+
+
+def _is_foldable(ctx, operand):
+    """Un operando se puede sustituir por su valor conocido si es una
+    constante o una variable estable. Un temporal con valor conocido es
+    una operación que ya se dejó sin plegar."""
+    if not isinstance(operand, str) or isinstance(operand, Char):
+        return True
+    return not operand.startswith('@') and _is_stable(ctx, operand)
+
+
+def _can_fold(ctx, actual, vtype, *operands):
+    """El valor 'actual' se sigue calculando siempre (es el que muestra
+    .symbols); solo se pliega si todos los operandos son plegables."""
+    if ctx.optimization_level < 1 or actual is None:
+        return False
+    if vtype == 'char' and len(actual) > 1:
+        return False
+    return all(_is_foldable(ctx, operand) for operand in operands)
+
+
+def _fold_operand(value, vtype):
+    if vtype == 'char':
+        return Char(value)
+    return value
+
+
+def _cast_operand(ctx, val, src, dst, actual):
+    """Como apply_cast, pero con un valor conocido pliega el cast a constante."""
+    if _can_fold(ctx, actual, src, val):
+        return _fold_operand(_convert_actual_value(actual, src, dst), dst)
+    cval, _ = apply_cast(ctx, val, src, dst)
+    return cval
+
+
 def _convert_actual_value(value, src, dst):
     if value is None:
         return None
@@ -218,31 +301,42 @@ def _convert_actual_value(value, src, dst):
     return value
 
 
-def _update_record_value(path, value, value_type):
-    parts = path.split('.')
-    root = lookup_symbol(parts[0])
-    if root is None or not isinstance(root.get('value'), dict):
-        return
-    converted = _convert_actual_value(value, value_type, value_type)
-    target = root['value']
-    for part in parts[1:-1]:
-        if part not in target or not isinstance(target[part], dict):
-            return
-        target = target[part]
-    target[parts[-1]] = converted
-
-
-def _get_lvalue_actual(path):
-    parts = path.split('.')
-    root = lookup_symbol(parts[0])
-    if root is None:
+def _record_field(ctx, path, chain):
+    """
+    (valor de registro, posición) del último campo de 'a.b.c', siguiendo la
+    cadena de posiciones que p_lvalue_dot resolvió al analizar la ruta; None
+    si algún registro intermedio no tiene valor conocido.
+    """
+    root = lookup_symbol(ctx, path.partition('.')[0])
+    if root is None or not chain:
         return None
-    value = root.get('value')
-    for part in parts[1:]:
-        if not isinstance(value, dict) or part not in value:
+    target = root.get('value')
+    for i in chain[:-1]:
+        if not isinstance(target, RecordValue) or i >= len(target):
             return None
-        value = value[part]
-    return value
+        target = target[i]
+    last = chain[-1]
+    if not isinstance(target, RecordValue) or last >= len(target):
+        return None
+    return target, last
+
+
+def _update_record_value(ctx, path, chain, value, value_type):
+    field = _record_field(ctx, path, chain)
+    if field is not None:
+        target, i = field
+        target[i] = _convert_actual_value(value, value_type, value_type)
+
+
+def _get_lvalue_actual(ctx, path, chain):
+    if '.' not in path:
+        root = lookup_symbol(ctx, path)
+        return None if root is None else root.get('value')
+    field = _record_field(ctx, path, chain)
+    if field is None:
+        return None
+    target, i = field
+    return target[i]
 
 
 # =============================================================================
@@ -306,12 +400,18 @@ def p_statement_list_empty(p):
 
 def p_record_def(p):
     '''record_def : RECORD ID LPAREN field_list RPAREN SEMICOLON'''
+    ctx = p.parser.ctx
     name   = p[2]
     fields = p[4]
-    if name in record_table:
-        report_error(f"El registro '{name}' ya ha sido declarado.", p.lineno(2))
+    if name in ctx.record_table:
+        report_error(ctx, f"El registro '{name}' ya ha sido declarado.", p.lineno(2))
     else:
-        record_table[name] = fields
+        ctx.record_table[name] = fields
+        reindex_record(ctx, name)
+
+def reindex_record(ctx, name):
+    """Calcula la disposición del registro 'name' a partir de record_table."""
+    ctx.record_layouts[name] = RecordLayout(name, ctx.record_table[name], ctx.record_layouts)
 
 def p_field_list_multi(p):
     '''field_list : field_list COMMA field'''
@@ -327,90 +427,94 @@ def p_field_basic(p):
 
 def p_field_record(p):
     '''field : ID ID'''
-    if p[1] not in record_table:
-        report_error(f"El tipo de registro '{p[1]}' no ha sido declarado.", p.lineno(1))
+    ctx = p.parser.ctx
+    if p[1] not in ctx.record_table:
+        report_error(ctx, f"El tipo de registro '{p[1]}' no ha sido declarado.", p.lineno(1))
     p[0] = {'name': p[2], 'type': p[1]}
 
 # ---- Función ----
 
 def p_function_def_basic(p):
     '''function_def : type ID LPAREN param_list RPAREN function_prep_basic func_open stmt_block RBRACE'''
-    _finalize_function(p[2], p[1], p.lineno(2))
-    pop_quartet_buffer()
-    pop_emit_enabled()
-    pop_scope()
-    _register_function(p[1], p[2], p[4], p.lineno(2))
+    ctx = p.parser.ctx
+    _finalize_function(ctx, p[2], p[1], p.lineno(2))
+    pop_quartet_buffer(ctx)
+    pop_emit_enabled(ctx)
+    pop_scope(ctx)
+    _register_function(ctx, p[1], p[2], p[4], p.lineno(2))
 
 def p_function_def_void(p):
     '''function_def : VOID ID LPAREN param_list RPAREN function_prep_void func_open stmt_block RBRACE'''
-    _finalize_function(p[2], 'void', p.lineno(2))
-    pop_quartet_buffer()
-    pop_emit_enabled()
-    pop_scope()
-    _register_function('void', p[2], p[4], p.lineno(2))
+    ctx = p.parser.ctx
+    _finalize_function(ctx, p[2], 'void', p.lineno(2))
+    pop_quartet_buffer(ctx)
+    pop_emit_enabled(ctx)
+    pop_scope(ctx)
+    _register_function(ctx, 'void', p[2], p[4], p.lineno(2))
 
 def p_function_def_record(p):
     '''function_def : ID ID LPAREN param_list RPAREN function_prep_record func_open stmt_block RBRACE'''
-    _finalize_function(p[2], p[1], p.lineno(2))
-    pop_quartet_buffer()
-    pop_emit_enabled()
-    pop_scope()
+    ctx = p.parser.ctx
+    _finalize_function(ctx, p[2], p[1], p.lineno(2))
+    pop_quartet_buffer(ctx)
+    pop_emit_enabled(ctx)
+    pop_scope(ctx)
     ret_type = p[1]
-    if not is_known_type(ret_type):
-        report_error(f"Tipo de retorno desconocido '{ret_type}'.", p.lineno(1))
-    _register_function(ret_type, p[2], p[4], p.lineno(2))
+    if not is_known_type(ctx, ret_type):
+        report_error(ctx, f"Tipo de retorno desconocido '{ret_type}'.", p.lineno(1))
+    _register_function(ctx, ret_type, p[2], p[4], p.lineno(2))
 
 def p_function_prep_basic(p):
     '''function_prep_basic : '''
-    global pending_function_return_type
-    pending_function_return_type = p[-5]
+    ctx = p.parser.ctx
+    ctx.pending_function_return_type = p[-5]
 
 def p_function_prep_void(p):
     '''function_prep_void : '''
-    global pending_function_return_type
-    pending_function_return_type = 'void'
+    ctx = p.parser.ctx
+    ctx.pending_function_return_type = 'void'
 
 def p_function_prep_record(p):
     '''function_prep_record : '''
-    global pending_function_return_type
-    pending_function_return_type = p[-5]
+    ctx = p.parser.ctx
+    ctx.pending_function_return_type = p[-5]
 
 def p_func_open(p):
     '''func_open : LBRACE'''
+    ctx = p.parser.ctx
     # Abrimos el scope con los parámetros pendientes ANTES de parsear el cuerpo
-    global _pending_params, current_return_type, pending_function_return_type
-    global current_function_has_return
-    push_scope(_pending_params)
-    push_quartet_buffer()
-    push_emit_enabled(False)
-    current_return_type = pending_function_return_type
-    pending_function_return_type = None
-    current_function_has_return = False
-    _pending_params = []
+    push_scope(ctx, ctx.pending_params)
+    push_quartet_buffer(ctx)
+    push_emit_enabled(ctx, False)
+    ctx.current_return_type = ctx.pending_function_return_type
+    ctx.pending_function_return_type = None
+    ctx.current_function_has_return = False
+    ctx.pending_params = []
 
 def p_block_open(p):
     '''block_open : LBRACE'''
+    ctx = p.parser.ctx
     # Abrimos un scope vacío para bloques if/else/while/do-while
-    push_scope([])
-    push_quartet_buffer()
+    push_scope(ctx, [])
+    push_quartet_buffer(ctx)
 
 def p_param_list_multi(p):
     '''param_list : param_list COMMA param'''
-    global _pending_params
+    ctx = p.parser.ctx
     p[0] = p[1] + [p[3]]
-    _pending_params = p[0]
+    ctx.pending_params = p[0]
 
 def p_param_list_single(p):
     '''param_list : param'''
-    global _pending_params
+    ctx = p.parser.ctx
     p[0] = [p[1]]
-    _pending_params = p[0]
+    ctx.pending_params = p[0]
 
 def p_param_list_empty(p):
     '''param_list : '''
-    global _pending_params
+    ctx = p.parser.ctx
     p[0] = []
-    _pending_params = []
+    ctx.pending_params = []
 
 def p_param_basic(p):
     '''param : type ID'''
@@ -418,32 +522,50 @@ def p_param_basic(p):
 
 def p_param_record(p):
     '''param : ID ID'''
-    if p[1] not in record_table:
-        report_error(f"El tipo '{p[1]}' no ha sido declarado como registro.", p.lineno(1))
+    ctx = p.parser.ctx
+    if p[1] not in ctx.record_table:
+        report_error(ctx, f"El tipo '{p[1]}' no ha sido declarado como registro.", p.lineno(1))
     p[0] = {'name': p[2], 'type': p[1]}
 
-def _register_function(ret_type, name, params, lineno):
-    global current_return_type
-    current_return_type = None
-    if name not in function_table:
-        function_table[name] = []
-    param_types = [p['type'] for p in (params or [])]
-    for sig in function_table[name]:
-        if [pp['type'] for pp in sig['params']] == param_types:
-            if sig['return_type'] != ret_type:
-                report_error(
-                    f"Función '{name}' ya declarada con la misma firma pero distinto retorno.", lineno)
-            else:
-                report_error(f"Función '{name}' ya declarada con la misma firma.", lineno)
-            return
-    function_table[name].append({'params': params or [], 'return_type': ret_type})
-
-def _finalize_function(name, ret_type, lineno):
-    global current_return_type, current_function_has_return
-    if ret_type != 'void' and not current_function_has_return:
-        report_error(f"La función '{name}' debe incluir una sentencia return de tipo '{ret_type}'.", lineno)
-    current_return_type = None
-    current_function_has_return = False
+def _register_function(ctx, ret_type, name, params, lineno):
+    ctx.current_return_type = None
+    if name not in ctx.function_table:
+        ctx.function_table[name] = []
+    param_types = tuple(p['type'] for p in (params or []))
+    entry = ctx.overload_index.get(name)
+    sig = entry['exact'].get(param_types) if entry else None
+    if sig is not None:
+        if sig['return_type'] != ret_type:
+            report_error(ctx, 
+                f"Función '{name}' ya declarada con la misma firma pero distinto retorno.", lineno)
+        else:
+            report_error(ctx, f"Función '{name}' ya declarada con la misma firma.", lineno)
+        return
+    sig = {'params': params or [], 'return_type': ret_type}
+    ctx.function_table[name].append(sig)
+    _index_overload(ctx, name, sig)
+
+def _index_overload(ctx, name, sig):
+    """Añade una firma al índice de 'name' e invalida sus resoluciones memorizadas."""
+    entry = ctx.overload_index.get(name)
+    if entry is None:
+        entry = ctx.overload_index[name] = {'exact': {}, 'arity': {}, 'memo': {}}
+    param_types = tuple(p['type'] for p in sig['params'])
+    entry['exact'][param_types] = sig
+    entry['arity'].setdefault(len(param_types), []).append(sig)
+    entry['memo'].clear()
+
+def reindex_function(ctx, name):
+    """Reconstruye el índice de sobrecargas de 'name' a partir de function_table."""
+    ctx.overload_index.pop(name, None)
+    for sig in ctx.function_table.get(name, ()):
+        _index_overload(ctx, name, sig)
+
+def _finalize_function(ctx, name, ret_type, lineno):
+    if ret_type != 'void' and not ctx.current_function_has_return:
+        report_error(ctx, f"La función '{name}' debe incluir una sentencia return de tipo '{ret_type}'.", lineno)
+    ctx.current_return_type = None
+    ctx.current_function_has_return = False
 
 # ---- Bloque de sentencias ----
 
@@ -487,53 +609,61 @@ def p_statement_semi(p):
 
 def p_decl_type_assign(p):
     '''decl_stmt : type ID ASSIGN expr'''
+    ctx = p.parser.ctx
     vtype, vname = p[1], p[2]
     etype, eval_, equad, eactual = p[4]
     if not can_convert(etype, vtype):
-        report_error(f"No se puede asignar '{etype}' a variable de tipo '{vtype}'.", p.lineno(3))
-        declare_in_current_scope(vname, {'type': vtype, 'value': default_value(vtype), 'quad': True}, p.lineno(2))
+        report_error(ctx, f"No se puede asignar '{etype}' a variable de tipo '{vtype}'.", p.lineno(3))
+        declare_in_current_scope(ctx, vname, {'type': vtype, 'value': default_value(ctx, vtype), 'quad': True}, p.lineno(2))
         return
-    cval, _ = apply_cast(eval_, etype, vtype)
+    cval = _cast_operand(ctx, eval_, etype, vtype, eactual)
     actual = _convert_actual_value(eactual, etype, vtype)
     if equad:
-        emit('ASSIGN', cval, '_', vname)
-    declare_in_current_scope(vname, {'type': vtype, 'value': actual, 'quad': equad}, p.lineno(2))
+        emit(ctx, 'ASSIGN', cval, '_', vname)
+    info = {'type': vtype, 'value': actual, 'quad': equad}
+    if not _is_foldable(ctx, eval_):
+        info['foldable'] = False
+    declare_in_current_scope(ctx, vname, info, p.lineno(2))
 
 def p_decl_type_only(p):
     '''decl_stmt : type ID'''
+    ctx = p.parser.ctx
     vtype, vname = p[1], p[2]
-    default = default_value(vtype)
-    emit('ASSIGN', _literal(default, vtype), '_', vname)
-    declare_in_current_scope(vname, {'type': vtype, 'value': default, 'quad': True}, p.lineno(2))
+    default = default_value(ctx, vtype)
+    emit(ctx, 'ASSIGN', _literal(default, vtype), '_', vname)
+    declare_in_current_scope(ctx, vname, {'type': vtype, 'value': default, 'quad': True}, p.lineno(2))
 
 def p_decl_type_list(p):
     '''decl_stmt : type id_list'''
+    ctx = p.parser.ctx
     vtype  = p[1]
     names  = p[2]
     for name in names:
-        default = default_value(vtype)
-        emit('ASSIGN', _literal(default, vtype), '_', name)
-        declare_in_current_scope(name, {'type': vtype, 'value': default, 'quad': True})
+        default = default_value(ctx, vtype)
+        emit(ctx, 'ASSIGN', _literal(default, vtype), '_', name)
+        declare_in_current_scope(ctx, name, {'type': vtype, 'value': default, 'quad': True})
 
 def p_decl_record_assign(p):
     '''decl_stmt : ID ID ASSIGN expr'''
+    ctx = p.parser.ctx
     vtype, vname = p[1], p[2]
     etype, eval_, _, eactual = p[4]
-    if vtype not in record_table:
-        report_error(f"El tipo '{vtype}' no ha sido declarado.", p.lineno(1))
+    if vtype not in ctx.record_table:
+        report_error(ctx, f"El tipo '{vtype}' no ha sido declarado.", p.lineno(1))
         return
     if etype != vtype:
-        report_error(f"No se puede asignar tipo '{etype}' a variable de tipo registro '{vtype}'.", p.lineno(3))
-    declare_in_current_scope(vname, {'type': vtype, 'value': eactual, 'quad': False}, p.lineno(2))
+        report_error(ctx, f"No se puede asignar tipo '{etype}' a variable de tipo registro '{vtype}'.", p.lineno(3))
+    declare_in_current_scope(ctx, vname, {'type': vtype, 'value': eactual, 'quad': False}, p.lineno(2))
 
 def p_decl_record_only(p):
     '''decl_stmt : ID ID'''
+    ctx = p.parser.ctx
     vtype, vname = p[1], p[2]
-    if vtype not in record_table:
-        report_error(f"El tipo '{vtype}' no ha sido declarado.", p.lineno(1))
+    if vtype not in ctx.record_table:
+        report_error(ctx, f"El tipo '{vtype}' no ha sido declarado.", p.lineno(1))
         return
-    default = default_value(vtype)
-    declare_in_current_scope(vname, {'type': vtype, 'value': default, 'quad': False}, p.lineno(2))
+    default = default_value(ctx, vtype)
+    declare_in_current_scope(ctx, vname, {'type': vtype, 'value': default, 'quad': False}, p.lineno(2))
 
 def p_id_list(p):
     '''id_list : id_list COMMA ID
@@ -547,51 +677,63 @@ def p_id_list(p):
 
 def p_assign_stmt(p):
     '''assign_stmt : lvalue ASSIGN expr'''
-    lname, ltype, lquad = p[1]
+    ctx = p.parser.ctx
+    lname, ltype, lquad, chain = p[1]
     etype, eval_, equad, eactual = p[3]
     if ltype is None:
         return
     if not can_convert(etype, ltype):
-        report_error(f"No se puede asignar '{etype}' a '{lname}' de tipo '{ltype}'.", p.lineno(2))
+        report_error(ctx, f"No se puede asignar '{etype}' a '{lname}' de tipo '{ltype}'.", p.lineno(2))
         return
-    cval, _ = apply_cast(eval_, etype, ltype)
+    cval = _cast_operand(ctx, eval_, etype, ltype, eactual)
     actual = _convert_actual_value(eactual, etype, ltype)
     if lquad and equad:
-        emit('ASSIGN', cval, '_', lname)
+        emit(ctx, 'ASSIGN', cval, '_', lname)
     # Actualizar valor si es variable simple en algún scope
-    sym = lookup_symbol(lname)
+    sym = lookup_symbol(ctx, lname)
     if sym:
         sym['value'] = actual
         sym['quad'] = lquad and equad
+        sym['foldable'] = _is_foldable(ctx, eval_)
+        if _in_control_flow(ctx):
+            sym['stable'] = False
     elif '.' in lname:
-        _update_record_value(lname, actual, ltype)
+        _update_record_value(ctx, lname, chain, actual, ltype)
+
+# Un lvalue es (ruta, tipo, quad, posiciones): 'posiciones' es la cadena de
+# índices de campo desde la variable raíz ('()' para la propia variable,
+# None si la ruta no es válida), así que leer o actualizar el valor conocido
+# de 'a.b.c' no vuelve a resolver nombres de campo.
 
 def p_lvalue_id(p):
     '''lvalue : ID'''
-    sym = lookup_symbol(p[1])
+    ctx = p.parser.ctx
+    sym = lookup_symbol(ctx, p[1])
     if sym is None:
-        report_error(f"La variable '{p[1]}' no ha sido declarada.", p.lineno(1))
-        p[0] = (p[1], None, False)
+        report_error(ctx, f"La variable '{p[1]}' no ha sido declarada.", p.lineno(1))
+        p[0] = (p[1], None, False, None)
     else:
-        p[0] = (p[1], sym['type'], sym.get('quad', sym['type'] in BASIC_TYPES))
+        p[0] = (p[1], sym['type'], sym.get('quad', sym['type'] in BASIC_TYPES), ())
 
 def p_lvalue_dot(p):
     '''lvalue : lvalue DOT ID'''
-    lname, ltype, _ = p[1]
+    ctx = p.parser.ctx
+    lname, ltype, _, chain = p[1]
     fname = p[3]
     if ltype is None:
-        p[0] = (f"{lname}.{fname}", None, False)
+        p[0] = (f"{lname}.{fname}", None, False, None)
         return
-    if ltype not in record_table:
-        report_error(f"'{lname}' (tipo '{ltype}') no es un registro.")
-        p[0] = (f"{lname}.{fname}", None, False)
+    layout = ctx.record_layouts.get(ltype)
+    if layout is None:
+        report_error(ctx, f"'{lname}' (tipo '{ltype}') no es un registro.")
+        p[0] = (f"{lname}.{fname}", None, False, None)
         return
-    matched = next((f for f in record_table[ltype] if f['name'] == fname), None)
-    if matched is None:
-        report_error(f"El registro '{ltype}' no tiene el campo '{fname}'.")
-        p[0] = (f"{lname}.{fname}", None, False)
+    ftype = layout.field(fname)
+    if ftype is None:
+        report_error(ctx, f"El registro '{ltype}' no tiene el campo '{fname}'.")
+        p[0] = (f"{lname}.{fname}", None, False, None)
     else:
-        p[0] = (f"{lname}.{fname}", matched['type'], False)
+        p[0] = (f"{lname}.{fname}", ftype, False, chain + (layout.index[fname],))
 
 # ---- Tipos ----
 
@@ -606,108 +748,114 @@ def p_type(p):
 
 def p_if_stmt_simple(p):
     '''if_stmt : IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACE'''
+    ctx = p.parser.ctx
     ctype, cval, cquad, _ = p[4]
-    label_end = new_label()
-    body_quartets = pop_quartet_buffer()
-    cond_quartets = pop_quartet_buffer()
-    pop_scope()
+    label_end = new_label(ctx)
+    body_quartets = pop_quartet_buffer(ctx)
+    cond_quartets = pop_quartet_buffer(ctx)
+    pop_scope(ctx)
     if ctype != 'boolean':
-        report_error(f"Condición del 'if' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
+        report_error(ctx, f"Condición del 'if' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
     if cquad:
-        append_quartets(cond_quartets)
-        emit('JUMPF', cval, label_end, '_')
-        append_quartets(body_quartets)
-        emit('LABEL', label_end, '_', '_')
+        append_quartets(ctx, cond_quartets)
+        emit(ctx, 'JUMPF', cval, label_end, '_')
+        append_quartets(ctx, body_quartets)
+        emit(ctx, 'LABEL', label_end, '_', '_')
 
 def p_if_stmt_else(p):
     '''if_stmt : IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACE ELSE block_open stmt_block RBRACE'''
+    ctx = p.parser.ctx
     ctype, cval, cquad, _ = p[4]
-    label_else = new_label()
-    label_end  = new_label()
-    else_quartets = pop_quartet_buffer()
-    if_quartets = pop_quartet_buffer()
-    cond_quartets = pop_quartet_buffer()
-    pop_scope()  # scope del else
-    pop_scope()  # scope del if
+    label_else = new_label(ctx)
+    label_end  = new_label(ctx)
+    else_quartets = pop_quartet_buffer(ctx)
+    if_quartets = pop_quartet_buffer(ctx)
+    cond_quartets = pop_quartet_buffer(ctx)
+    pop_scope(ctx)  # scope del else
+    pop_scope(ctx)  # scope del if
     if ctype != 'boolean':
-        report_error(f"Condición del 'if-else' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
+        report_error(ctx, f"Condición del 'if-else' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
     if cquad:
-        append_quartets(cond_quartets)
-        emit('JUMPF', cval, label_else, '_')
-        append_quartets(if_quartets)
-        emit('JUMP',  label_end, '_', '_')
-        emit('LABEL', label_else, '_', '_')
-        append_quartets(else_quartets)
-        emit('LABEL', label_end,  '_', '_')
+        append_quartets(ctx, cond_quartets)
+        emit(ctx, 'JUMPF', cval, label_else, '_')
+        append_quartets(ctx, if_quartets)
+        emit(ctx, 'JUMP',  label_end, '_', '_')
+        emit(ctx, 'LABEL', label_else, '_', '_')
+        append_quartets(ctx, else_quartets)
+        emit(ctx, 'LABEL', label_end,  '_', '_')
 
 def p_while_stmt(p):
     '''while_stmt : WHILE LPAREN cond_open expr RPAREN loop_enter block_open stmt_block RBRACE loop_exit'''
+    ctx = p.parser.ctx
     ctype, cval, cquad, _ = p[4]
-    label_start = new_label()
+    label_start = new_label(ctx)
     label_end   = p[6]
-    body_quartets = pop_quartet_buffer()
-    cond_quartets = pop_quartet_buffer()
-    pop_scope()
+    body_quartets = pop_quartet_buffer(ctx)
+    cond_quartets = pop_quartet_buffer(ctx)
+    pop_scope(ctx)
     if ctype != 'boolean':
-        report_error(f"Condición del 'while' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
+        report_error(ctx, f"Condición del 'while' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(1))
     if cquad:
-        emit('LABEL', label_start, '_', '_')
-        append_quartets(cond_quartets)
-        emit('JUMPF', cval, label_end, '_')
-        append_quartets(body_quartets)
-        emit('JUMP',  label_start, '_', '_')
-        emit('LABEL', label_end,   '_', '_')
+        emit(ctx, 'LABEL', label_start, '_', '_')
+        append_quartets(ctx, cond_quartets)
+        emit(ctx, 'JUMPF', cval, label_end, '_')
+        append_quartets(ctx, body_quartets)
+        emit(ctx, 'JUMP',  label_start, '_', '_')
+        emit(ctx, 'LABEL', label_end,   '_', '_')
 
 def p_do_while_stmt(p):
     '''do_while_stmt : DO loop_enter block_open stmt_block RBRACE WHILE LPAREN cond_open expr RPAREN loop_exit'''
+    ctx = p.parser.ctx
     ctype, cval, cquad, _ = p[9]
-    label_start = new_label()
+    label_start = new_label(ctx)
     label_end = p[2]
-    cond_quartets = pop_quartet_buffer()
-    body_quartets = pop_quartet_buffer()
-    pop_scope()
+    cond_quartets = pop_quartet_buffer(ctx)
+    body_quartets = pop_quartet_buffer(ctx)
+    pop_scope(ctx)
     if ctype != 'boolean':
-        report_error(f"Condición del 'do-while' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(6))
+        report_error(ctx, f"Condición del 'do-while' debe ser 'boolean', se encontró '{ctype}'.", p.lineno(6))
     if cquad:
-        emit('LABEL', label_start, '_', '_')
-        append_quartets(body_quartets)
-        append_quartets(cond_quartets)
-        emit('JUMPT', cval, label_start, '_')
-        emit('LABEL', label_end, '_', '_')
+        emit(ctx, 'LABEL', label_start, '_', '_')
+        append_quartets(ctx, body_quartets)
+        append_quartets(ctx, cond_quartets)
+        emit(ctx, 'JUMPT', cval, label_start, '_')
+        emit(ctx, 'LABEL', label_end, '_', '_')
 
 def p_break_stmt(p):
     '''break_stmt : BREAK SEMICOLON'''
-    if loop_depth <= 0:
-        report_error("La sentencia 'break' solo puede aparecer dentro de un bucle.", p.lineno(1))
-    elif emit_enabled_stack[-1]:
-        emit('JUMP', loop_end_label_stack[-1], '_', '_')
+    ctx = p.parser.ctx
+    if ctx.loop_depth <= 0:
+        report_error(ctx, "La sentencia 'break' solo puede aparecer dentro de un bucle.", p.lineno(1))
+    elif ctx.emit_enabled_stack[-1]:
+        emit(ctx, 'JUMP', ctx.loop_end_label_stack[-1], '_', '_')
 
 def p_return_stmt(p):
     '''return_stmt : RETURN expr SEMICOLON'''
-    global current_function_has_return
+    ctx = p.parser.ctx
     etype, _, _, _ = p[2]
 
-    if current_return_type is None:
-        report_error("La sentencia 'return' solo puede aparecer dentro de una función.", p.lineno(1))
+    if ctx.current_return_type is None:
+        report_error(ctx, "La sentencia 'return' solo puede aparecer dentro de una función.", p.lineno(1))
         return
 
-    if current_return_type == 'void':
-        report_error("Una función de tipo 'void' no puede devolver un valor.", p.lineno(1))
+    if ctx.current_return_type == 'void':
+        report_error(ctx, "Una función de tipo 'void' no puede devolver un valor.", p.lineno(1))
         return
 
-    if not can_convert(etype, current_return_type):
-        report_error(
-            f"No se puede devolver '{etype}' en una función de tipo '{current_return_type}'.",
+    if not can_convert(etype, ctx.current_return_type):
+        report_error(ctx, 
+            f"No se puede devolver '{etype}' en una función de tipo '{ctx.current_return_type}'.",
             p.lineno(1))
         return
 
-    current_function_has_return = True
+    ctx.current_function_has_return = True
 
 def p_print_stmt(p):
     '''print_stmt : PRINT LPAREN expr RPAREN SEMICOLON'''
+    ctx = p.parser.ctx
     _, val, qok, _ = p[3]
     if qok:
-        emit('PRINT', val, '_', '_')
+        emit(ctx, 'PRINT', val, '_', '_')
 
 # ---- Expresiones binarias ----
 
@@ -717,31 +865,32 @@ LOGIC_OP = {'&&': 'AND', '||': 'OR'}
 
 def p_expr_plus(p):
     '''expr : expr PLUS expr'''
-    p[0] = _arith(p[1], '+', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _arith(ctx, p[1], '+', p[3], p.lineno(2))
 
 def p_expr_minus(p):
     '''expr : expr MINUS expr'''
-    p[0] = _arith(p[1], '-', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _arith(ctx, p[1], '-', p[3], p.lineno(2))
 
 def p_expr_mult(p):
     '''expr : expr MULT expr'''
-    p[0] = _arith(p[1], '*', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _arith(ctx, p[1], '*', p[3], p.lineno(2))
 
 def p_expr_div(p):
     '''expr : expr DIV expr'''
-    p[0] = _arith(p[1], '/', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _arith(ctx, p[1], '/', p[3], p.lineno(2))
 
-def _arith(left, op, right, lineno):
+def _arith(ctx, left, op, right, lineno):
     t1, v1, q1, a1 = left
     t2, v2, q2, a2 = right
     allowed = ('int', 'float') if op in ('*', '/') else ('int', 'float', 'char')
     common  = unify_types(t1, t2)
     if common is None or common not in allowed:
-        report_error(f"Operación '{op}' no permitida entre '{t1}' y '{t2}'.", lineno)
-        return _expr_result('int', new_temp(), False, None)
-    v1c, _ = apply_cast(v1, t1, common)
-    v2c, _ = apply_cast(v2, t2, common)
-    t = new_temp()
+        report_error(ctx, f"Operación '{op}' no permitida entre '{t1}' y '{t2}'.", lineno)
+        return _expr_result('int', new_temp(ctx), False, None)
     qok = q1 and q2
     a1c = _convert_actual_value(a1, t1, common)
     a2c = _convert_actual_value(a2, t2, common)
@@ -755,31 +904,41 @@ def _arith(left, op, right, lineno):
             actual = a1c * a2c
         elif op == '/':
             actual = a1c / a2c if common == 'float' else a1c // a2c
+    if qok and _can_fold(ctx, actual, common, v1, v2):
+        return _expr_result(common, _fold_operand(actual, common), qok, actual)
+    v1c = _cast_operand(ctx, v1, t1, common, a1)
+    v2c = _cast_operand(ctx, v2, t2, common, a2)
+    t = new_temp(ctx)
     if qok:
-        emit(ARITH_OP[op], v1c, v2c, t)
+        emit(ctx, ARITH_OP[op], v1c, v2c, t)
     return _expr_result(common, t, qok, actual)
 
 def p_expr_gt(p):
     '''expr : expr GT expr'''
-    p[0] = _compare(p[1], '>', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _compare(ctx, p[1], '>', p[3], p.lineno(2))
 
 def p_expr_ge(p):
     '''expr : expr GE expr'''
-    p[0] = _compare(p[1], '>=', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _compare(ctx, p[1], '>=', p[3], p.lineno(2))
 
 def p_expr_lt(p):
     '''expr : expr LT expr'''
-    p[0] = _compare(p[1], '<', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _compare(ctx, p[1], '<', p[3], p.lineno(2))
 
 def p_expr_le(p):
     '''expr : expr LE expr'''
-    p[0] = _compare(p[1], '<=', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _compare(ctx, p[1], '<=', p[3], p.lineno(2))
 
 def p_expr_eq(p):
     '''expr : expr EQ expr'''
-    p[0] = _compare(p[1], '==', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _compare(ctx, p[1], '==', p[3], p.lineno(2))
 
-def _compare(left, op, right, lineno):
+def _compare(ctx, left, op, right, lineno):
     t1, v1, q1, a1 = left
     t2, v2, q2, a2 = right
     allowed = ('int', 'float', 'char', 'boolean') if op == '==' else ('int', 'float', 'char')
@@ -788,11 +947,8 @@ def _compare(left, op, right, lineno):
     else:
         common = unify_types(t1, t2)
     if common is None or common not in allowed:
-        report_error(f"Operación '{op}' no permitida entre '{t1}' y '{t2}'.", lineno)
-        return _expr_result('boolean', new_temp(), False, None)
-    v1c, _ = apply_cast(v1, t1, common)
-    v2c, _ = apply_cast(v2, t2, common)
-    t = new_temp()
+        report_error(ctx, f"Operación '{op}' no permitida entre '{t1}' y '{t2}'.", lineno)
+        return _expr_result('boolean', new_temp(ctx), False, None)
     qok = q1 and q2
     a1c = _convert_actual_value(a1, t1, common)
     a2c = _convert_actual_value(a2, t2, common)
@@ -808,71 +964,92 @@ def _compare(left, op, right, lineno):
             actual = a1c <= a2c
         elif op == '==':
             actual = a1c == a2c
+    if qok and _can_fold(ctx, actual, 'boolean', v1, v2):
+        return _expr_result('boolean', actual, qok, actual)
+    v1c = _cast_operand(ctx, v1, t1, common, a1)
+    v2c = _cast_operand(ctx, v2, t2, common, a2)
+    t = new_temp(ctx)
     if qok:
-        emit(COMP_OP[op], v1c, v2c, t)
+        emit(ctx, COMP_OP[op], v1c, v2c, t)
     return _expr_result('boolean', t, qok, actual)
 
 def p_expr_and(p):
     '''expr : expr AND expr'''
-    p[0] = _logic(p[1], '&&', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _logic(ctx, p[1], '&&', p[3], p.lineno(2))
 
 def p_expr_or(p):
     '''expr : expr OR expr'''
-    p[0] = _logic(p[1], '||', p[3], p.lineno(2))
+    ctx = p.parser.ctx
+    p[0] = _logic(ctx, p[1], '||', p[3], p.lineno(2))
 
-def _logic(left, op, right, lineno):
+def _logic(ctx, left, op, right, lineno):
     t1, v1, q1, a1 = left
     t2, v2, q2, a2 = right
     if t1 != 'boolean' or t2 != 'boolean':
-        report_error(f"Operación '{op}' solo entre 'boolean', encontrado '{t1}' y '{t2}'.", lineno)
-        return _expr_result('boolean', new_temp(), False, None)
-    t = new_temp()
+        report_error(ctx, f"Operación '{op}' solo entre 'boolean', encontrado '{t1}' y '{t2}'.", lineno)
+        return _expr_result('boolean', new_temp(ctx), False, None)
     qok = q1 and q2
     actual = None
     if a1 is not None and a2 is not None:
         actual = a1 and a2 if op == '&&' else a1 or a2
+    if qok and _can_fold(ctx, actual, 'boolean', v1, v2):
+        return _expr_result('boolean', actual, qok, actual)
+    t = new_temp(ctx)
     if qok:
-        emit(LOGIC_OP[op], v1, v2, t)
+        emit(ctx, LOGIC_OP[op], v1, v2, t)
     return _expr_result('boolean', t, qok, actual)
 
 # ---- Expresiones unarias ----
 
 def p_expr_uminus(p):
     '''expr : MINUS expr %prec UMINUS'''
+    ctx = p.parser.ctx
     etype, eval_, qok, actual = p[2]
     if etype not in ('int', 'float', 'char'):
-        report_error(f"Operador '-' unario no permitido para tipo '{etype}'.", p.lineno(1))
+        report_error(ctx, f"Operador '-' unario no permitido para tipo '{etype}'.", p.lineno(1))
         p[0] = _expr_result(etype, eval_, False, None)
         return
-    t = new_temp()
-    if qok:
-        emit('UMINUS', eval_, '_', t)
     actual_value = None if actual is None else -actual
+    if qok and _can_fold(ctx, actual_value, etype, eval_):
+        p[0] = _expr_result(etype, _fold_operand(actual_value, etype), qok, actual_value)
+        return
+    t = new_temp(ctx)
+    if qok:
+        emit(ctx, 'UMINUS', eval_, '_', t)
     p[0] = _expr_result(etype, t, qok, actual_value)
 
 def p_expr_uplus(p):
     '''expr : PLUS expr %prec UPLUS'''
+    ctx = p.parser.ctx
     etype, eval_, qok, actual = p[2]
     if etype not in ('int', 'float', 'char'):
-        report_error(f"Operador '+' unario no permitido para tipo '{etype}'.", p.lineno(1))
+        report_error(ctx, f"Operador '+' unario no permitido para tipo '{etype}'.", p.lineno(1))
         p[0] = _expr_result(etype, eval_, False, None)
         return
-    t = new_temp()
+    if qok and _can_fold(ctx, actual, etype, eval_):
+        p[0] = _expr_result(etype, _fold_operand(actual, etype), qok, actual)
+        return
+    t = new_temp(ctx)
     if qok:
-        emit('UPLUS', eval_, '_', t)
+        emit(ctx, 'UPLUS', eval_, '_', t)
     p[0] = _expr_result(etype, t, qok, actual)
 
 def p_expr_not(p):
     '''expr : NOT expr'''
+    ctx = p.parser.ctx
     etype, eval_, qok, actual = p[2]
     if etype != 'boolean':
-        report_error(f"Operador '!' solo para 'boolean', encontrado '{etype}'.", p.lineno(1))
+        report_error(ctx, f"Operador '!' solo para 'boolean', encontrado '{etype}'.", p.lineno(1))
         p[0] = _expr_result('boolean', eval_, False, None)
         return
-    t = new_temp()
-    if qok:
-        emit('NOT', eval_, '_', t)
     actual_value = None if actual is None else (not actual)
+    if qok and _can_fold(ctx, actual_value, 'boolean', eval_):
+        p[0] = _expr_result('boolean', actual_value, qok, actual_value)
+        return
+    t = new_temp(ctx)
+    if qok:
+        emit(ctx, 'NOT', eval_, '_', t)
     p[0] = _expr_result('boolean', t, qok, actual_value)
 
 # ---- Agrupación ----
@@ -885,79 +1062,87 @@ def p_expr_paren(p):
 
 def p_expr_new(p):
     '''expr : NEW ID LPAREN arg_list RPAREN'''
+    ctx = p.parser.ctx
     rname = p[2]
     args  = p[4]
-    if rname not in record_table:
-        report_error(f"El registro '{rname}' no ha sido declarado.", p.lineno(2))
+    layout = ctx.record_layouts.get(rname)
+    if layout is None:
+        report_error(ctx, f"El registro '{rname}' no ha sido declarado.", p.lineno(2))
         p[0] = _expr_result(rname, {}, False, {})
         return
-    fields = record_table[rname]
+    fields = layout.fields
     if len(args) != len(fields):
-        report_error(
+        report_error(ctx, 
             f"Constructor de '{rname}' espera {len(fields)} argumento(s), se pasaron {len(args)}.",
             p.lineno(2))
-    instance = {}
-    for i, field in enumerate(fields):
+    instance = layout.empty_value()
+    index = layout.index
+    for i, (fname, ftype) in enumerate(fields):
         if i < len(args):
             atype, aval, _, aactual = args[i]
-            if not can_convert(atype, field['type']):
-                report_error(
-                    f"Campo '{field['name']}' de '{rname}' es '{field['type']}', se pasó '{atype}'.",
+            if not can_convert(atype, ftype):
+                report_error(ctx, 
+                    f"Campo '{fname}' de '{rname}' es '{ftype}', se pasó '{atype}'.",
                     p.lineno(2))
-            instance[field['name']] = _convert_actual_value(aactual, atype, field['type'])
+            instance[index[fname]] = _convert_actual_value(aactual, atype, ftype)
         else:
-            instance[field['name']] = default_value(field['type'])
+            instance[index[fname]] = default_value(ctx, ftype)
     p[0] = _expr_result(rname, instance, False, instance)
 
 # ---- Llamada a función ----
 
 def p_expr_call(p):
     '''expr : ID LPAREN arg_list RPAREN'''
+    ctx = p.parser.ctx
     fname = p[1]
     args  = p[3]
-    if fname not in function_table:
-        report_error(f"La función '{fname}' no ha sido declarada.", p.lineno(1))
-        p[0] = _expr_result('int', new_temp(), False, None)
+    if fname not in ctx.function_table:
+        report_error(ctx, f"La función '{fname}' no ha sido declarada.", p.lineno(1))
+        p[0] = _expr_result('int', new_temp(ctx), False, None)
         return
     arg_types = [a[0] for a in args]
-    sig = _resolve_overload(fname, arg_types, p.lineno(1))
+    sig = _resolve_overload(ctx, fname, arg_types, p.lineno(1))
     if sig is None:
-        p[0] = _expr_result('int', new_temp(), False, None)
+        p[0] = _expr_result('int', new_temp(ctx), False, None)
         return
-    t = new_temp()
+    t = new_temp(ctx)
     p[0] = _expr_result(sig['return_type'], t, False, None)
 
-def _resolve_overload(fname, arg_types, lineno):
-    sigs = function_table[fname]
+def _resolve_overload(ctx, fname, arg_types, lineno):
+    entry = ctx.overload_index[fname]
+    key = tuple(arg_types)
     # Búsqueda exacta (sin conversión)
-    for sig in sigs:
-        if [p['type'] for p in sig['params']] == arg_types:
-            return sig
-    # Búsqueda con conversión automática
-    candidates = [
-        sig for sig in sigs
-        if len(sig['params']) == len(arg_types)
-        and all(can_convert(at, pt)
-                for at, pt in zip(arg_types, [p['type'] for p in sig['params']]))
-    ]
-    if len(candidates) == 1:
-        return candidates[0]
-    if len(candidates) > 1:
-        report_error(f"Llamada ambigua a '{fname}' con argumentos {arg_types}.", lineno)
-        return candidates[0]
-    report_error(f"No hay firma de '{fname}' compatible con argumentos {arg_types}.", lineno)
+    sig = entry['exact'].get(key)
+    if sig is not None:
+        return sig
+    # Búsqueda con conversión automática, entre las firmas de la misma aridad;
+    # el resultado se memoriza, pero los errores se notifican en cada llamada
+    found = entry['memo'].get(key)
+    if found is None:
+        candidates = [
+            sig for sig in entry['arity'].get(len(key), ())
+            if all(map(can_convert, key, [p['type'] for p in sig['params']]))
+        ]
+        found = entry['memo'][key] = (candidates[0] if candidates else None, len(candidates))
+    sig, count = found
+    if count == 1:
+        return sig
+    if count > 1:
+        report_error(ctx, f"Llamada ambigua a '{fname}' con argumentos {arg_types}.", lineno)
+        return sig
+    report_error(ctx, f"No hay firma de '{fname}' compatible con argumentos {arg_types}.", lineno)
     return None
 
 # ---- lvalue como expresión ----
 
 def p_expr_lvalue(p):
     '''expr : lvalue'''
-    lname, ltype, lquad = p[1]
+    ctx = p.parser.ctx
+    lname, ltype, lquad, chain = p[1]
     if ltype is None:
         p[0] = _expr_result('int', lname, False, None)
     else:
-        actual = _get_lvalue_actual(lname)
-        p[0] = _expr_result(ltype, lname, lquad, actual)
+        p[0] = _expr_result(ltype, lname, lquad, _get_lvalue_actual(ctx, lname, chain))
 
 # ---- Literales ----
 
@@ -971,7 +1156,7 @@ def p_expr_float(p):
 
 def p_expr_char(p):
     '''expr : CHAR_VALUE'''
-    p[0] = _expr_result('char', p[1], True, p[1])
+    p[0] = _expr_result('char', Char(p[1]), True, p[1])
 
 def p_expr_true(p):
     '''expr : TRUE'''
@@ -999,134 +1184,210 @@ def p_arg_list_empty(p):
 
 def p_cond_open(p):
     '''cond_open : '''
-    push_quartet_buffer()
+    ctx = p.parser.ctx
+    push_quartet_buffer(ctx)
 
 # ---- Marcadores auxiliares de contexto ----
 
 def p_loop_enter(p):
     '''loop_enter : '''
-    global loop_depth
-    loop_depth += 1
-    label_end = new_label()
-    loop_end_label_stack.append(label_end)
+    ctx = p.parser.ctx
+    ctx.loop_depth += 1
+    label_end = new_label(ctx)
+    ctx.loop_end_label_stack.append(label_end)
     p[0] = label_end
 
 def p_loop_exit(p):
     '''loop_exit : '''
-    global loop_depth
-    loop_depth -= 1
-    if loop_end_label_stack:
-        loop_end_label_stack.pop()
+    ctx = p.parser.ctx
+    ctx.loop_depth -= 1
+    if ctx.loop_end_label_stack:
+        ctx.loop_end_label_stack.pop()
 
 # ---- Error sintáctico ----
 
 def p_error(p):
-    global has_errors
-    has_errors = True
+    # PLY exige p_error pero no le pasa el parser, así que no hay forma de
+    # llegar al contexto: cada compilación sustituye errorfunc por
+    # _syntax_error ligado al suyo (ver new_parser).
+    raise RuntimeError("p_error llamado fuera de una compilación")
+
+def _syntax_error(ctx, p):
+    ctx.has_errors = True
     if p:
-        print(f"[ERROR SINTÁCTICO] Token '{p.type}' inesperado en la línea {p.lineno}")
+        print(f"[ERROR SINTÁCTICO] Token '{p.type}' inesperado en la línea {p.lineno}", file=ctx.out)
     else:
-        print("[ERROR SINTÁCTICO] Error al final del fichero")
+        print("[ERROR SINTÁCTICO] Error al final del fichero", file=ctx.out)
 
 # =============================================================================
 # CONSTRUCCIÓN DEL PARSER
 # =============================================================================
 
-parser = yacc.yacc()
+# Arranque rápido: se cargan las tablas de parsetab.py sin volcar parser.out.
+# PLY comprueba la firma de la gramática y solo las regenera si ha cambiado.
+# Con LAVA_GRAMMAR_DEBUG=1 se ignora la tabla guardada para validar toda la
+# gramática, regenerar parsetab.py y escribir parser.out.
+if GRAMMAR_DEBUG:
+    _saved_tab = sys.modules.get('parsetab')
+    sys.modules['parsetab'] = None     # 'import parsetab' falla -> regenerar
+    try:
+        parser = yacc.yacc(debug=True)
+    finally:
+        if _saved_tab is None:
+            sys.modules.pop('parsetab', None)
+        else:
+            sys.modules['parsetab'] = _saved_tab
+else:
+    parser = yacc.yacc(debug=False)
+
+
+def new_parser(ctx, fast_lexer=False):
+    """
+    Parser y lexer propios para una compilación. Comparten las tablas LALR y
+    las expresiones regulares con los globales, pero no la pila de análisis
+    ni la posición de lectura. fast_lexer usa fastlex.FastLexer en lugar del
+    lexer de PLY.
+    """
+    cparser = copy.copy(parser)
+    cparser.ctx = ctx
+    cparser.errorfunc = partial(_syntax_error, ctx)
+    if fast_lexer:
+        from fastlex import FastLexer
+        clexer = FastLexer()
+    else:
+        clexer = base_lexer.clone()
+    clexer.ctx = ctx
+    clexer.out = ctx.out
+    return cparser, clexer
 
 # =============================================================================
 # FUNCIÓN PRINCIPAL DE ANÁLISIS
 # =============================================================================
 
-def analyze(source, input_filename):
+def compile_source(source, input_filename, opt_level=0, binary=False, stream=False, out=None,
+                   fast_lexer=False, write_outputs=True):
     """
     Analiza el código fuente completo (léxico + sintáctico + semántico).
     Genera los archivos de salida si no hay errores.
-    Devuelve True si el análisis fue correcto, False si hubo errores.
+    opt_level >= 1 pliega las subexpresiones y casts de valor conocido.
+    opt_level >= 2 aplica además la optimización de mirilla y reutiliza los
+    temporales según su intervalo de vida.
+    binary=True escribe también los cuartetos en formato .quartets.bin.
+    stream=True escribe los cuartetos de nivel superior según se generan
+    (incompatible con opt_level >= 2 y con binary, que necesitan el programa
+    completo en memoria).
+    out recibe los diagnósticos (por defecto, la salida estándar).
+    fast_lexer=True analiza con el lexer de expresión maestra (fastlex).
+    write_outputs=False compila solo en memoria (sin ficheros de salida; los
+    cuartetos quedan en ctx.quartets), p. ej. para ejecutarlos.
+    Devuelve el CompilerContext de la compilación.
+    """
+    if stream and (opt_level >= 2 or binary):
+        raise ValueError("El modo streaming no admite -O2 ni salida binaria.")
+    if stream and not write_outputs:
+        raise ValueError("El modo streaming escribe los cuartetos en fichero.")
+
+    base = input_filename.rsplit('.', 1)[0]
+    ctx = CompilerContext(opt_level, base + '.quartets' if stream else None, out)
+    cparser, clexer = new_parser(ctx, fast_lexer)
+    reset_lexer(clexer, source)
+
+    try:
+        cparser.parse(source, lexer=clexer)
+    except BaseException:
+        if stream:
+            ctx.quartets.discard()
+        raise
+    if stream and ctx.has_errors:
+        ctx.quartets.discard()
+
+    if not ctx.has_errors:
+        finish_compilation(ctx, input_filename, binary, write_outputs)
+
+    return ctx
+
+def finish_compilation(ctx, input_filename, binary=False, write_outputs=True):
+    """
+    Optimiza (-O2) y escribe las salidas de una compilación sin errores. En
+    modo streaming los cuartetos ya están escritos y solo se confirman.
     """
-    global symbol_table, scope_stack, record_table, function_table
-    global quartets, quartet_buffers, emit_enabled_stack, _temp_counter, _label_counter
-    global has_errors, semantic_errors, current_return_type, pending_function_return_type
-    global current_function_has_return, _pending_params, loop_depth, loop_end_label_stack
-
-    # Reset completo del estado
-    symbol_table      = {}
-    scope_stack       = []
-    record_table      = {}
-    function_table    = {}
-    quartets          = []
-    quartet_buffers   = [quartets]
-    emit_enabled_stack = [True]
-    _temp_counter     = 0
-    _label_counter    = 0
-    has_errors        = False
-    semantic_errors   = []
-    current_return_type = None
-    pending_function_return_type = None
-    current_function_has_return = False
-    _pending_params   = []
-    loop_depth        = 0
-    loop_end_label_stack = []
-
-    from lexer import lexer
-    lexer.source = source
-    lexer.lineno = 1
-
-    parser.parse(source, lexer=lexer)
-
-    if not has_errors:
-        _write_symbols(input_filename)
-        _write_records(input_filename)
-        _write_functions(input_filename)
-        _write_quartets(input_filename)
-
-    return not has_errors
+    if ctx.optimization_level >= 2:
+        _optimize_quartets(ctx)
+    if not write_outputs:
+        return
+    _write_symbols(ctx, input_filename)
+    _write_records(ctx, input_filename)
+    _write_functions(ctx, input_filename)
+    if isinstance(ctx.quartets, QuartetStream):
+        ctx.quartets.commit()
+    else:
+        _write_quartets(ctx, input_filename)
+    if binary:
+        _write_quartets_binary(ctx, input_filename)
+
+def analyze(source, input_filename, opt_level=0, binary=False, stream=False, out=None,
+            fast_lexer=False):
+    """Como compile_source; devuelve True si el análisis fue correcto."""
+    ctx = compile_source(source, input_filename, opt_level, binary, stream, out, fast_lexer)
+    return not ctx.has_errors
+
+def _optimize_quartets(ctx):
+    from peephole import peephole
+    from liveness import recycle_temps
+    before = len(ctx.quartets)
+    rows = peephole(ctx.quartets.rows())
+    print(f"[OPTIMIZACIÓN] Cuartetos: {before} -> {len(rows)}", file=ctx.out)
+    rows, ntemps = recycle_temps(rows)
+    print(f"[OPTIMIZACIÓN] Temporales: {ctx.temp_counter} -> {ntemps}", file=ctx.out)
+    ctx.quartets.replace(rows)
 
 # =============================================================================
 # ESCRITURA DE ARCHIVOS DE SALIDA
 # =============================================================================
 
-def _has_control_or_functions():
-    return bool(function_table) or any(
-        q[0] in ('JUMP', 'JUMPT', 'JUMPF') for q in quartets
-    )
+def _has_control_or_functions(ctx):
+    return bool(ctx.function_table) or ctx.quartets.has_jumps()
 
 def _format_value(value, vtype):
     if vtype == 'boolean': return 'true' if value else 'false'
     if vtype == 'char':    return repr(value) if value else "''"
-    if isinstance(value, dict):
+    if isinstance(value, RecordValue):
         inner = ','.join(f"{k}:{_format_value(v, '')}" for k, v in value.items())
         return '{' + inner + '}'
     return str(value)
 
-def _write_symbols(filename):
+def _write_symbols(ctx, filename):
     base = filename.rsplit('.', 1)[0]
-    complex_prog = _has_control_or_functions()
+    complex_prog = _has_control_or_functions(ctx)
     with open(base + '.symbols', 'w', encoding='utf-8') as f:
-        for name, info in symbol_table.items():
+        for name, info in ctx.symbol_table.items():
             if complex_prog:
                 f.write(f"{name}:{info['type']}\n")
             else:
                 val = _format_value(info['value'], info['type'])
                 f.write(f"{name}:{info['type']},{val}\n")
 
-def _write_records(filename):
+def _write_records(ctx, filename):
     base = filename.rsplit('.', 1)[0]
     with open(base + '.records', 'w', encoding='utf-8') as f:
-        for rname, fields in record_table.items():
+        for rname, fields in ctx.record_table.items():
             fstr = ','.join(f"{fd['name']}:{fd['type']}" for fd in fields)
             f.write(f"{rname}:[{fstr}]\n")
 
-def _write_functions(filename):
+def _write_functions(ctx, filename):
     base = filename.rsplit('.', 1)[0]
     with open(base + '.functions', 'w', encoding='utf-8') as f:
-        for fname, sigs in function_table.items():
+        for fname, sigs in ctx.function_table.items():
             for sig in sigs:
                 pstr = ', '.join(f"{p['name']}:{p['type']}" for p in sig['params'])
                 f.write(f"{fname}:[{pstr}],{sig['return_type']}\n")
 
-def _write_quartets(filename):
+def _write_quartets(ctx, filename):
     base = filename.rsplit('.', 1)[0]
     with open(base + '.quartets', 'w', encoding='utf-8') as f:
-        for q in quartets:
-            f.write(','.join(q) + '\n')
+        ctx.quartets.write_text(f)
+
+def _write_quartets_binary(ctx, filename):
+    from quartet_binary import write_binary
+    base = filename.rsplit('.', 1)[0]
+    write_binary(ctx.quartets, base + '.quartets.bin')
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'leftORleftANDleftEQleftGTGELTLEleftPLUSMINUSleftMULTDIVrightUMINUSUPLUSNOTleftDOTAND ASSIGN BOOLEAN BREAK CHAR CHAR_VALUE COMMA DIV DO DOT ELSE EQ FALSE FLOAT FLOAT_VALUE GE GT ID IF INT INT_VALUE LBRACE LE LPAREN LT MINUS MULT NEW NOT OR PLUS PRINT RBRACE RECORD RETURN RPAREN SEMICOLON TRUE VOID WHILEprogram : statement_liststatement_list : statement_list statementstatement_list : statement_list function_defstatement_list : statement_list record_defstatement_list : statement_list if_stmtstatement_list : statement_list while_stmtstatement_list : statement_list do_while_stmtstatement_list : statement_list print_stmtstatement_list : record_def : RECORD ID LPAREN field_list RPAREN SEMICOLONfield_list : field_list COMMA fieldfield_list : fieldfield : type IDfield : ID IDfunction_def : type ID LPAREN param_list RPAREN func_open stmt_block RBRACEfunction_def : VOID ID LPAREN param_list RPAREN func_open stmt_block RBRACEfunction_def : ID ID LPAREN param_list RPAREN func_open stmt_block RBRACEfunc_open : LBRACEblock_open : LBRACEparam_list : param_list COMMA paramparam_list : paramparam_list : param : type IDparam : ID IDstmt_block : stmt_block inner_statementstmt_block : inner_statement : statement\n                       | if_stmt\n                       | while_stmt\n                       | do_while_stmt\n                       | break_stmt\n                       | return_stmt\n                       | print_stmtstatement : decl_stmt SEMICOLONstatement : assign_stmt SEMICOLONstatement : expr SEMICOLONstatement : SEMICOLONdecl_stmt : type ID ASSIGN exprdecl_stmt : type IDdecl_stmt : type id_listdecl_stmt : ID ID ASSIGN exprdecl_stmt : ID IDid_list : id_list COMMA ID\n               | ID COMMA IDassign_stmt : lvalue ASSIGN exprlvalue : IDlvalue : lvalue DOT IDtype : INT\n            | FLOAT\n            | CHAR\n            | BOOLEANif_stmt : IF LPAREN expr RPAREN block_open stmt_block RBRACEif_stmt : IF LPAREN expr RPAREN block_open stmt_block RBRACE ELSE block_open stmt_block RBRACEwhile_stmt : WHILE LPAREN expr RPAREN block_open stmt_block RBRACEdo_while_stmt : DO block_open stmt_block RBRACE WHILE LPAREN expr RPARENbreak_stmt : BREAK SEMICOLONreturn_stmt : RETURN expr SEMICOLONprint_stmt : PRINT LPAREN expr RPAREN SEMICOLONexpr : expr PLUS exprexpr : expr MINUS exprexpr : expr MULT exprexpr : expr DIV exprexpr : expr GT exprexpr : expr GE exprexpr : expr LT exprexpr : expr LE exprexpr : expr EQ exprexpr : expr AND exprexpr : expr OR exprexpr : MINUS expr %prec UMINUSexpr : PLUS expr %prec UPLUSexpr : NOT exprexpr : LPAREN expr RPARENexpr : NEW ID LPAREN arg_list RPARENexpr : ID LPAREN arg_list RPARENexpr : lvalueexpr : INT_VALUEexpr : FLOAT_VALUEexpr : CHAR_VALUEexpr : TRUEexpr : FALSEarg_list : arg_list COMMA exprarg_list : exprarg_list : '
+_lr_signature = 'leftORleftANDleftEQleftGTGELTLEleftPLUSMINUSleftMULTDIVrightUMINUSUPLUSNOTleftDOTAND ASSIGN BOOLEAN BREAK CHAR CHAR_VALUE COMMA DIV DO DOT ELSE EQ FALSE FLOAT FLOAT_VALUE GE GT ID IF INT INT_VALUE LBRACE LE LPAREN LT MINUS MULT NEW NOT OR PLUS PRINT RBRACE RECORD RETURN RPAREN SEMICOLON TRUE VOID WHILEprogram : statement_liststatement_list : statement_list statementstatement_list : statement_list function_defstatement_list : statement_list record_defstatement_list : statement_list if_stmtstatement_list : statement_list while_stmtstatement_list : statement_list do_while_stmtstatement_list : statement_list print_stmtstatement_list : record_def : RECORD ID LPAREN field_list RPAREN SEMICOLONfield_list : field_list COMMA fieldfield_list : fieldfield : type IDfield : ID IDfunction_def : type ID LPAREN param_list RPAREN function_prep_basic func_open stmt_block RBRACEfunction_def : VOID ID LPAREN param_list RPAREN function_prep_void func_open stmt_block RBRACEfunction_def : ID ID LPAREN param_list RPAREN function_prep_record func_open stmt_block RBRACEfunction_prep_basic : function_prep_void : function_prep_record : func_open : LBRACEblock_open : LBRACEparam_list : param_list COMMA paramparam_list : paramparam_list : param : type IDparam : ID IDstmt_block : stmt_block inner_statementstmt_block : inner_statement : statement\n                       | if_stmt\n                       | while_stmt\n                       | do_while_stmt\n                       | break_stmt\n                       | return_stmt\n                       | print_stmtstatement : decl_stmt SEMICOLONstatement : assign_stmt SEMICOLONstatement : expr SEMICOLONstatement : SEMICOLONdecl_stmt : type ID ASSIGN exprdecl_stmt : type IDdecl_stmt : type id_listdecl_stmt : ID ID ASSIGN exprdecl_stmt : ID IDid_list : id_list COMMA ID\n               | ID COMMA IDassign_stmt : lvalue ASSIGN exprlvalue : IDlvalue : lvalue DOT IDtype : INT\n            | FLOAT\n            | CHAR\n            | BOOLEANif_stmt : IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACEif_stmt : IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACE ELSE block_open stmt_block RBRACEwhile_stmt : WHILE LPAREN cond_open expr RPAREN loop_enter block_open stmt_block RBRACE loop_exitdo_while_stmt : DO loop_enter block_open stmt_block RBRACE WHILE LPAREN cond_open expr RPAREN loop_exitbreak_stmt : BREAK SEMICOLONreturn_stmt : RETURN expr SEMICOLONprint_stmt : PRINT LPAREN expr RPAREN SEMICOLONexpr : expr PLUS exprexpr : expr MINUS exprexpr : expr MULT exprexpr : expr DIV exprexpr : expr GT exprexpr : expr GE exprexpr : expr LT exprexpr : expr LE exprexpr : expr EQ exprexpr : expr AND exprexpr : expr OR exprexpr : MINUS expr %prec UMINUSexpr : PLUS expr %prec UPLUSexpr : NOT exprexpr : LPAREN expr RPARENexpr : NEW ID LPAREN arg_list RPARENexpr : ID LPAREN arg_list RPARENexpr : lvalueexpr : INT_VALUEexpr : FLOAT_VALUEexpr : CHAR_VALUEexpr : TRUEexpr : FALSEarg_list : arg_list COMMA exprarg_list : exprarg_list : cond_open : loop_enter : loop_exit : '
     
-_lr_action_items = {'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,23,28,29,30,31,32,37,38,39,51,52,53,56,57,62,63,67,68,69,71,72,73,74,75,76,77,78,79,80,81,90,95,97,98,104,105,106,108,109,119,120,121,122,123,124,125,126,127,130,131,141,144,145,147,148,149,150,151,152,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,11,-2,-3,-4,-5,-6,-7,-8,37,-37,38,39,-46,-76,-77,-78,-79,-80,-81,-34,-35,-36,-39,-40,-42,-46,-76,-26,-19,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-73,11,-45,-47,-38,-44,-43,-41,-75,-25,-27,-28,-29,-30,-31,-32,-33,147,-46,151,158,-26,-26,-56,163,-39,-42,-58,-74,-26,-18,-26,-26,-10,11,11,-57,11,11,11,-52,-54,-15,-17,-16,-55,-26,11,-53,]),'VOID':([0,2,3,4,5,6,7,8,9,11,37,38,39,151,158,167,168,170,171,172,174,177,],[-9,17,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-58,-10,-52,-54,-15,-17,-16,-55,-53,]),'ID':([0,2,3,4,5,6,7,8,9,11,14,15,16,17,18,24,25,26,27,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,66,82,83,84,85,86,87,91,92,95,99,100,101,110,112,115,119,120,121,122,123,124,125,126,128,129,130,136,142,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,15,-2,-3,-4,-5,-6,-7,-8,-37,51,53,56,58,59,56,56,56,70,-48,-49,-50,-51,-34,-35,-36,56,56,56,56,56,56,56,56,56,56,56,56,56,56,-26,-19,56,56,98,101,56,105,106,101,56,101,112,130,56,133,134,56,140,143,-25,-27,-28,-29,-30,-31,-32,-33,56,149,150,101,112,-26,-26,-56,-58,-26,-18,-26,-26,-10,130,130,56,-57,130,130,130,-52,-54,-15,-17,-16,-55,-26,130,-53,]),'RECORD':([0,2,3,4,5,6,7,8,9,11,37,38,39,151,158,167,168,170,171,172,174,177,],[-9,18,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-58,-10,-52,-54,-15,-17,-16,-55,-53,]),'IF':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,19,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,19,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,-10,19,19,-57,19,19,19,-52,-54,-15,-17,-16,-55,-26,19,-53,]),'WHILE':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,95,118,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,20,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,20,146,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,-10,20,20,-57,20,20,20,-52,-54,-15,-17,-16,-55,-26,20,-53,]),'DO':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,21,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,21,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,-10,21,21,-57,21,21,21,-52,-54,-15,-17,-16,-55,-26,21,-53,]),'PRINT':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,22,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,22,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,-10,22,22,-57,22,22,22,-52,-54,-15,-17,-16,-55,-26,22,-53,]),'MINUS':([0,2,3,4,5,6,7,8,9,11,13,15,16,23,24,25,26,28,29,30,31,32,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,56,57,60,61,62,63,64,65,67,68,69,71,72,73,74,75,76,77,78,79,80,81,83,87,89,90,93,94,95,96,97,98,99,104,108,109,110,119,120,121,122,123,124,125,126,128,130,138,144,145,147,148,151,152,153,154,156,157,158,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,],[-9,25,-2,-3,-4,-5,-6,-7,-8,-37,41,-46,25,-76,25,25,25,-77,-78,-79,-80,-81,-34,-35,-36,25,25,25,25,25,25,25,25,25,25,25,25,41,-46,-76,25,25,-26,-19,25,25,-71,-70,-72,-59,-60,-61,-62,41,41,41,41,41,41,41,25,25,41,-73,41,41,25,41,41,-47,25,41,41,-75,25,-25,-27,-28,-29,-30,-31,-32,-33,25,-46,41,-26,-26,-56,41,-58,-74,-26,-18,-26,-26,-10,25,25,25,-57,25,25,25,-52,-54,41,-15,-17,-16,-55,-26,25,-53,]),'PLUS':([0,2,3,4,5,6,7,8,9,11,13,15,16,23,24,25,26,28,29,30,31,32,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,56,57,60,61,62,63,64,65,67,68,69,71,72,73,74,75,76,77,78,79,80,81,83,87,89,90,93,94,95,96,97,98,99,104,108,109,110,119,120,121,122,123,124,125,126,128,130,138,144,145,147,148,151,152,153,154,156,157,158,160,161,162,163,164,165,166,167,168,169,170,171,172,174,175,176,177,],[-9,24,-2,-3,-4,-5,-6,-7,-8,-37,40,-46,24,-76,24,24,24,-77,-78,-79,-80,-81,-34,-35,-36,24,24,24,24,24,24,24,24,24,24,24,24,40,-46,-76,24,24,-26,-19,24,24,-71,-70,-72,-59,-60,-61,-62,40,40,40,40,40,40,40,24,24,40,-73,40,40,24,40,40,-47,24,40,40,-75,24,-25,-27,-28,-29,-30,-31,-32,-33,24,-46,40,-26,-26,-56,40,-58,-74,-26,-18,-26,-26,-10,24,24,24,-57,24,24,24,-52,-54,40,-15,-17,-16,-55,-26,24,-53,]),'NOT':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,26,-2,-3,-4,-5,-6,-7,-8,-37,26,26,26,26,-34,-35,-36,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-26,-19,26,26,26,26,26,26,26,-25,-27,-28,-29,-30,-31,-32,-33,26,-26,-26,-56,-58,-26,-18,-26,-26,-10,26,26,26,-57,26,26,26,-52,-54,-15,-17,-16,-55,-26,26,-53,]),'LPAREN':([0,2,3,4,5,6,7,8,9,11,15,16,19,20,22,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,54,56,58,59,60,61,62,63,64,65,70,83,87,95,99,110,119,120,121,122,123,124,125,126,128,130,144,145,146,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,16,-2,-3,-4,-5,-6,-7,-8,-37,54,16,60,61,64,16,16,16,-34,-35,-36,16,16,16,16,16,16,16,16,16,16,16,82,86,16,54,91,92,16,16,-26,-19,16,16,99,16,16,16,16,16,-25,-27,-28,-29,-30,-31,-32,-33,16,54,-26,-26,162,-56,-58,-26,-18,-26,-26,-10,16,16,16,-57,16,16,16,-52,-54,-15,-17,-16,-55,-26,16,-53,]),'NEW':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,27,-2,-3,-4,-5,-6,-7,-8,-37,27,27,27,27,-34,-35,-36,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-26,-19,27,27,27,27,27,27,27,-25,-27,-28,-29,-30,-31,-32,-33,27,-26,-26,-56,-58,-26,-18,-26,-26,-10,27,27,27,-57,27,27,27,-52,-54,-15,-17,-16,-55,-26,27,-53,]),'INT_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,28,-2,-3,-4,-5,-6,-7,-8,-37,28,28,28,28,-34,-35,-36,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-26,-19,28,28,28,28,28,28,28,-25,-27,-28,-29,-30,-31,-32,-33,28,-26,-26,-56,-58,-26,-18,-26,-26,-10,28,28,28,-57,28,28,28,-52,-54,-15,-17,-16,-55,-26,28,-53,]),'FLOAT_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,29,-2,-3,-4,-5,-6,-7,-8,-37,29,29,29,29,-34,-35,-36,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-26,-19,29,29,29,29,29,29,29,-25,-27,-28,-29,-30,-31,-32,-33,29,-26,-26,-56,-58,-26,-18,-26,-26,-10,29,29,29,-57,29,29,29,-52,-54,-15,-17,-16,-55,-26,29,-53,]),'CHAR_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,30,-2,-3,-4,-5,-6,-7,-8,-37,30,30,30,30,-34,-35,-36,30,30,30,30,30,30,30,30,30,30,30,30,30,30,-26,-19,30,30,30,30,30,30,30,-25,-27,-28,-29,-30,-31,-32,-33,30,-26,-26,-56,-58,-26,-18,-26,-26,-10,30,30,30,-57,30,30,30,-52,-54,-15,-17,-16,-55,-26,30,-53,]),'TRUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,31,-2,-3,-4,-5,-6,-7,-8,-37,31,31,31,31,-34,-35,-36,31,31,31,31,31,31,31,31,31,31,31,31,31,31,-26,-19,31,31,31,31,31,31,31,-25,-27,-28,-29,-30,-31,-32,-33,31,-26,-26,-56,-58,-26,-18,-26,-26,-10,31,31,31,-57,31,31,31,-52,-54,-15,-17,-16,-55,-26,31,-53,]),'FALSE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,62,63,64,65,83,87,95,99,110,119,120,121,122,123,124,125,126,128,144,145,147,151,153,154,156,157,158,160,161,162,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,32,-2,-3,-4,-5,-6,-7,-8,-37,32,32,32,32,-34,-35,-36,32,32,32,32,32,32,32,32,32,32,32,32,32,32,-26,-19,32,32,32,32,32,32,32,-25,-27,-28,-29,-30,-31,-32,-33,32,-26,-26,-56,-58,-26,-18,-26,-26,-10,32,32,32,-57,32,32,32,-52,-54,-15,-17,-16,-55,-26,32,-53,]),'INT':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,82,86,91,92,95,119,120,121,122,123,124,125,126,136,142,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,33,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,33,33,33,33,33,-25,-27,-28,-29,-30,-31,-32,-33,33,33,-26,-26,-56,-58,-26,-18,-26,-26,-10,33,33,-57,33,33,33,-52,-54,-15,-17,-16,-55,-26,33,-53,]),'FLOAT':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,82,86,91,92,95,119,120,121,122,123,124,125,126,136,142,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,34,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,34,34,34,34,34,-25,-27,-28,-29,-30,-31,-32,-33,34,34,-26,-26,-56,-58,-26,-18,-26,-26,-10,34,34,-57,34,34,34,-52,-54,-15,-17,-16,-55,-26,34,-53,]),'CHAR':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,82,86,91,92,95,119,120,121,122,123,124,125,126,136,142,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,35,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,35,35,35,35,35,-25,-27,-28,-29,-30,-31,-32,-33,35,35,-26,-26,-56,-58,-26,-18,-26,-26,-10,35,35,-57,35,35,35,-52,-54,-15,-17,-16,-55,-26,35,-53,]),'BOOLEAN':([0,2,3,4,5,6,7,8,9,11,37,38,39,62,63,82,86,91,92,95,119,120,121,122,123,124,125,126,136,142,144,145,147,151,153,154,156,157,158,160,161,163,164,165,166,167,168,170,171,172,174,175,176,177,],[-9,36,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-26,-19,36,36,36,36,36,-25,-27,-28,-29,-30,-31,-32,-33,36,36,-26,-26,-56,-58,-26,-18,-26,-26,-10,36,36,-57,36,36,36,-52,-54,-15,-17,-16,-55,-26,36,-53,]),'$end':([0,1,2,3,4,5,6,7,8,9,11,37,38,39,151,158,167,168,170,171,172,174,177,],[-9,0,-1,-2,-3,-4,-5,-6,-7,-8,-37,-34,-35,-36,-58,-10,-52,-54,-15,-17,-16,-55,-53,]),'RBRACE':([11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,160,161,163,164,165,166,167,168,174,175,176,177,],[-37,-34,-35,-36,-26,-19,118,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,167,168,-57,170,171,172,-52,-54,-55,-26,177,-53,]),'BREAK':([11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,160,161,163,164,165,166,167,168,174,175,176,177,],[-37,-34,-35,-36,-26,-19,127,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,127,127,-57,127,127,127,-52,-54,-55,-26,127,-53,]),'RETURN':([11,37,38,39,62,63,95,119,120,121,122,123,124,125,126,144,145,147,151,153,154,156,157,160,161,163,164,165,166,167,168,174,175,176,177,],[-37,-34,-35,-36,-26,-19,128,-25,-27,-28,-29,-30,-31,-32,-33,-26,-26,-56,-58,-26,-18,-26,-26,128,128,-57,128,128,128,-52,-54,-55,-26,128,-53,]),'MULT':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[42,-46,-76,-77,-78,-79,-80,-81,42,-46,-76,-71,-70,-72,42,42,-61,-62,42,42,42,42,42,42,42,42,-73,42,42,42,42,-47,42,42,-75,-46,42,42,-74,42,]),'DIV':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[43,-46,-76,-77,-78,-79,-80,-81,43,-46,-76,-71,-70,-72,43,43,-61,-62,43,43,43,43,43,43,43,43,-73,43,43,43,43,-47,43,43,-75,-46,43,43,-74,43,]),'GT':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[44,-46,-76,-77,-78,-79,-80,-81,44,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,44,44,44,44,-73,44,44,44,44,-47,44,44,-75,-46,44,44,-74,44,]),'GE':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[45,-46,-76,-77,-78,-79,-80,-81,45,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,45,45,45,45,-73,45,45,45,45,-47,45,45,-75,-46,45,45,-74,45,]),'LT':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[46,-46,-76,-77,-78,-79,-80,-81,46,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,46,46,46,46,-73,46,46,46,46,-47,46,46,-75,-46,46,46,-74,46,]),'LE':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[47,-46,-76,-77,-78,-79,-80,-81,47,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,47,47,47,47,-73,47,47,47,47,-47,47,47,-75,-46,47,47,-74,47,]),'EQ':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[48,-46,-76,-77,-78,-79,-80,-81,48,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,48,48,48,-73,48,48,48,48,-47,48,48,-75,-46,48,48,-74,48,]),'AND':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[49,-46,-76,-77,-78,-79,-80,-81,49,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,49,49,-73,49,49,49,49,-47,49,49,-75,-46,49,49,-74,49,]),'OR':([13,15,23,28,29,30,31,32,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,90,93,94,96,97,98,104,108,109,130,138,148,152,169,],[50,-46,-76,-77,-78,-79,-80,-81,50,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,50,-73,50,50,50,50,-47,50,50,-75,-46,50,50,-74,50,]),'ASSIGN':([15,23,51,53,98,130,149,150,],[-46,65,83,87,-47,-46,83,87,]),'DOT':([15,23,56,57,98,130,],[-46,66,-46,66,-47,-46,]),'LBRACE':([21,116,117,135,137,139,173,],[63,63,63,154,154,154,63,]),'RPAREN':([28,29,30,31,32,54,55,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,86,88,89,90,91,93,94,96,98,99,102,103,107,109,111,113,114,132,133,134,138,140,143,152,155,159,169,],[-77,-78,-79,-80,-81,-84,90,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-22,-22,109,-83,-73,-22,116,117,131,-47,-84,135,-21,137,-75,139,141,-12,152,-23,-24,-82,-14,-13,-74,-20,-11,174,]),'COMMA':([28,29,30,31,32,51,52,54,56,57,67,68,69,71,72,73,74,75,76,77,78,79,80,81,82,86,88,89,90,91,98,99,102,103,105,106,107,109,111,113,114,132,133,134,138,140,143,149,152,155,159,],[-77,-78,-79,-80,-81,84,85,-84,-46,-76,-71,-70,-72,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-22,-22,110,-83,-73,-22,-47,-84,136,-21,-44,-43,136,-75,136,142,-12,110,-23,-24,-82,-14,-13,84,-74,-20,-11,]),'ELSE':([167,],[173,]),}
+_lr_action_items = {'SEMICOLON':([0,2,3,4,5,6,7,8,9,10,11,12,13,15,23,28,29,30,31,32,37,38,39,51,52,53,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,89,94,95,97,98,104,105,106,108,109,118,119,129,135,136,137,138,139,140,141,142,143,146,147,148,153,155,158,159,160,161,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,11,-2,-3,-4,-5,-6,-7,-8,37,-40,38,39,-49,-79,-80,-81,-82,-83,-84,-37,-38,-39,-42,-43,-45,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-76,-29,-22,-48,-50,-41,-47,-46,-44,-78,11,147,153,-28,-30,-31,-32,-33,-34,-35,-36,158,-49,-61,-77,-10,-29,-59,169,-42,-45,-29,-21,-29,-29,11,-29,-60,11,11,11,-55,11,-15,-17,-16,-90,-29,-57,-90,11,-58,-56,]),'VOID':([0,2,3,4,5,6,7,8,9,11,37,38,39,147,153,173,176,177,178,180,183,184,186,187,],[-9,17,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-61,-10,-55,-15,-17,-16,-90,-57,-90,-58,-56,]),'ID':([0,2,3,4,5,6,7,8,9,11,14,15,16,17,18,24,25,26,27,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,65,81,82,83,84,85,86,90,91,92,93,94,95,99,100,101,110,112,115,118,124,130,135,136,137,138,139,140,141,142,144,145,146,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,15,-2,-3,-4,-5,-6,-7,-8,-40,51,53,56,58,59,56,56,56,69,-51,-52,-53,-54,-37,-38,-39,56,56,56,56,56,56,56,56,56,56,56,56,-88,-88,56,56,98,101,56,105,106,101,56,101,112,56,56,-29,-22,56,121,122,56,128,131,146,101,112,-28,-30,-31,-32,-33,-34,-35,-36,56,160,161,-61,-10,-29,-59,-29,-21,-29,-29,146,-29,-88,-60,146,146,146,-55,146,56,-15,-17,-16,-90,-29,-57,-90,146,-58,-56,]),'RECORD':([0,2,3,4,5,6,7,8,9,11,37,38,39,147,153,173,176,177,178,180,183,184,186,187,],[-9,18,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-61,-10,-55,-15,-17,-16,-90,-57,-90,-58,-56,]),'IF':([0,2,3,4,5,6,7,8,9,11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,19,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-29,-22,19,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,19,-29,-60,19,19,19,-55,19,-15,-17,-16,-90,-29,-57,-90,19,-58,-56,]),'WHILE':([0,2,3,4,5,6,7,8,9,11,37,38,39,94,95,118,134,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,20,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-29,-22,20,157,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,20,-29,-60,20,20,20,-55,20,-15,-17,-16,-90,-29,-57,-90,20,-58,-56,]),'DO':([0,2,3,4,5,6,7,8,9,11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,21,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-29,-22,21,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,21,-29,-60,21,21,21,-55,21,-15,-17,-16,-90,-29,-57,-90,21,-58,-56,]),'PRINT':([0,2,3,4,5,6,7,8,9,11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,22,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-29,-22,22,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,22,-29,-60,22,22,22,-55,22,-15,-17,-16,-90,-29,-57,-90,22,-58,-56,]),'MINUS':([0,2,3,4,5,6,7,8,9,11,13,15,16,23,24,25,26,28,29,30,31,32,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,56,57,60,61,63,64,66,67,68,70,71,72,73,74,75,76,77,78,79,80,82,86,88,89,92,93,94,95,96,97,98,99,104,108,109,110,116,117,118,126,135,136,137,138,139,140,141,142,144,146,147,148,153,155,158,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,182,183,184,185,186,187,],[-9,25,-2,-3,-4,-5,-6,-7,-8,-40,41,-49,25,-79,25,25,25,-80,-81,-82,-83,-84,-37,-38,-39,25,25,25,25,25,25,25,25,25,25,25,25,41,-49,-79,-88,-88,25,25,-74,-73,-75,-62,-63,-64,-65,41,41,41,41,41,41,41,25,25,41,-76,25,25,-29,-22,41,41,-50,25,41,41,-78,25,41,41,25,41,-28,-30,-31,-32,-33,-34,-35,-36,25,-49,-61,-77,-10,-29,-59,41,-29,-21,-29,-29,25,-29,-88,-60,25,25,25,-55,25,25,-15,-17,-16,-90,41,-29,-57,-90,25,-58,-56,]),'PLUS':([0,2,3,4,5,6,7,8,9,11,13,15,16,23,24,25,26,28,29,30,31,32,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,56,57,60,61,63,64,66,67,68,70,71,72,73,74,75,76,77,78,79,80,82,86,88,89,92,93,94,95,96,97,98,99,104,108,109,110,116,117,118,126,135,136,137,138,139,140,141,142,144,146,147,148,153,155,158,159,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,181,182,183,184,185,186,187,],[-9,24,-2,-3,-4,-5,-6,-7,-8,-40,40,-49,24,-79,24,24,24,-80,-81,-82,-83,-84,-37,-38,-39,24,24,24,24,24,24,24,24,24,24,24,24,40,-49,-79,-88,-88,24,24,-74,-73,-75,-62,-63,-64,-65,40,40,40,40,40,40,40,24,24,40,-76,24,24,-29,-22,40,40,-50,24,40,40,-78,24,40,40,24,40,-28,-30,-31,-32,-33,-34,-35,-36,24,-49,-61,-77,-10,-29,-59,40,-29,-21,-29,-29,24,-29,-88,-60,24,24,24,-55,24,24,-15,-17,-16,-90,40,-29,-57,-90,24,-58,-56,]),'NOT':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,26,-2,-3,-4,-5,-6,-7,-8,-40,26,26,26,26,-37,-38,-39,26,26,26,26,26,26,26,26,26,26,26,26,-88,-88,26,26,26,26,26,26,-29,-22,26,26,26,-28,-30,-31,-32,-33,-34,-35,-36,26,-61,-10,-29,-59,-29,-21,-29,-29,26,-29,-88,-60,26,26,26,-55,26,26,-15,-17,-16,-90,-29,-57,-90,26,-58,-56,]),'LPAREN':([0,2,3,4,5,6,7,8,9,11,15,16,19,20,22,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,53,54,56,58,59,60,61,63,64,69,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,146,147,153,155,157,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,16,-2,-3,-4,-5,-6,-7,-8,-40,54,16,60,61,63,16,16,16,-37,-38,-39,16,16,16,16,16,16,16,16,16,16,16,81,85,16,54,90,91,-88,-88,16,16,99,16,16,16,16,-29,-22,16,16,16,-28,-30,-31,-32,-33,-34,-35,-36,16,54,-61,-10,-29,168,-59,-29,-21,-29,-29,16,-29,-88,-60,16,16,16,-55,16,16,-15,-17,-16,-90,-29,-57,-90,16,-58,-56,]),'NEW':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,27,-2,-3,-4,-5,-6,-7,-8,-40,27,27,27,27,-37,-38,-39,27,27,27,27,27,27,27,27,27,27,27,27,-88,-88,27,27,27,27,27,27,-29,-22,27,27,27,-28,-30,-31,-32,-33,-34,-35,-36,27,-61,-10,-29,-59,-29,-21,-29,-29,27,-29,-88,-60,27,27,27,-55,27,27,-15,-17,-16,-90,-29,-57,-90,27,-58,-56,]),'INT_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,28,-2,-3,-4,-5,-6,-7,-8,-40,28,28,28,28,-37,-38,-39,28,28,28,28,28,28,28,28,28,28,28,28,-88,-88,28,28,28,28,28,28,-29,-22,28,28,28,-28,-30,-31,-32,-33,-34,-35,-36,28,-61,-10,-29,-59,-29,-21,-29,-29,28,-29,-88,-60,28,28,28,-55,28,28,-15,-17,-16,-90,-29,-57,-90,28,-58,-56,]),'FLOAT_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,29,-2,-3,-4,-5,-6,-7,-8,-40,29,29,29,29,-37,-38,-39,29,29,29,29,29,29,29,29,29,29,29,29,-88,-88,29,29,29,29,29,29,-29,-22,29,29,29,-28,-30,-31,-32,-33,-34,-35,-36,29,-61,-10,-29,-59,-29,-21,-29,-29,29,-29,-88,-60,29,29,29,-55,29,29,-15,-17,-16,-90,-29,-57,-90,29,-58,-56,]),'CHAR_VALUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,30,-2,-3,-4,-5,-6,-7,-8,-40,30,30,30,30,-37,-38,-39,30,30,30,30,30,30,30,30,30,30,30,30,-88,-88,30,30,30,30,30,30,-29,-22,30,30,30,-28,-30,-31,-32,-33,-34,-35,-36,30,-61,-10,-29,-59,-29,-21,-29,-29,30,-29,-88,-60,30,30,30,-55,30,30,-15,-17,-16,-90,-29,-57,-90,30,-58,-56,]),'TRUE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,31,-2,-3,-4,-5,-6,-7,-8,-40,31,31,31,31,-37,-38,-39,31,31,31,31,31,31,31,31,31,31,31,31,-88,-88,31,31,31,31,31,31,-29,-22,31,31,31,-28,-30,-31,-32,-33,-34,-35,-36,31,-61,-10,-29,-59,-29,-21,-29,-29,31,-29,-88,-60,31,31,31,-55,31,31,-15,-17,-16,-90,-29,-57,-90,31,-58,-56,]),'FALSE':([0,2,3,4,5,6,7,8,9,11,16,24,25,26,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,60,61,63,64,82,86,92,93,94,95,99,110,118,135,136,137,138,139,140,141,142,144,147,153,155,158,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,180,182,183,184,185,186,187,],[-9,32,-2,-3,-4,-5,-6,-7,-8,-40,32,32,32,32,-37,-38,-39,32,32,32,32,32,32,32,32,32,32,32,32,-88,-88,32,32,32,32,32,32,-29,-22,32,32,32,-28,-30,-31,-32,-33,-34,-35,-36,32,-61,-10,-29,-59,-29,-21,-29,-29,32,-29,-88,-60,32,32,32,-55,32,32,-15,-17,-16,-90,-29,-57,-90,32,-58,-56,]),'INT':([0,2,3,4,5,6,7,8,9,11,37,38,39,81,85,90,91,94,95,118,124,130,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,33,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,33,33,33,33,-29,-22,33,33,33,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,33,-29,-60,33,33,33,-55,33,-15,-17,-16,-90,-29,-57,-90,33,-58,-56,]),'FLOAT':([0,2,3,4,5,6,7,8,9,11,37,38,39,81,85,90,91,94,95,118,124,130,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,34,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,34,34,34,34,-29,-22,34,34,34,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,34,-29,-60,34,34,34,-55,34,-15,-17,-16,-90,-29,-57,-90,34,-58,-56,]),'CHAR':([0,2,3,4,5,6,7,8,9,11,37,38,39,81,85,90,91,94,95,118,124,130,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,35,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,35,35,35,35,-29,-22,35,35,35,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,35,-29,-60,35,35,35,-55,35,-15,-17,-16,-90,-29,-57,-90,35,-58,-56,]),'BOOLEAN':([0,2,3,4,5,6,7,8,9,11,37,38,39,81,85,90,91,94,95,118,124,130,135,136,137,138,139,140,141,142,147,153,155,158,162,163,164,165,166,167,169,170,171,172,173,174,176,177,178,180,182,183,184,185,186,187,],[-9,36,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,36,36,36,36,-29,-22,36,36,36,-28,-30,-31,-32,-33,-34,-35,-36,-61,-10,-29,-59,-29,-21,-29,-29,36,-29,-60,36,36,36,-55,36,-15,-17,-16,-90,-29,-57,-90,36,-58,-56,]),'$end':([0,1,2,3,4,5,6,7,8,9,11,37,38,39,147,153,173,176,177,178,180,183,184,186,187,],[-9,0,-1,-2,-3,-4,-5,-6,-7,-8,-40,-37,-38,-39,-61,-10,-55,-15,-17,-16,-90,-57,-90,-58,-56,]),'RBRACE':([11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,155,158,162,163,164,165,166,167,169,170,171,172,173,174,180,182,183,184,185,186,187,],[-40,-37,-38,-39,-29,-22,134,-28,-30,-31,-32,-33,-34,-35,-36,-61,-29,-59,-29,-21,-29,-29,173,-29,-60,176,177,178,-55,180,-90,-29,-57,-90,187,-58,-56,]),'BREAK':([11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,155,158,162,163,164,165,166,167,169,170,171,172,173,174,180,182,183,184,185,186,187,],[-40,-37,-38,-39,-29,-22,143,-28,-30,-31,-32,-33,-34,-35,-36,-61,-29,-59,-29,-21,-29,-29,143,-29,-60,143,143,143,-55,143,-90,-29,-57,-90,143,-58,-56,]),'RETURN':([11,37,38,39,94,95,118,135,136,137,138,139,140,141,142,147,155,158,162,163,164,165,166,167,169,170,171,172,173,174,180,182,183,184,185,186,187,],[-40,-37,-38,-39,-29,-22,144,-28,-30,-31,-32,-33,-34,-35,-36,-61,-29,-59,-29,-21,-29,-29,144,-29,-60,144,144,144,-55,144,-90,-29,-57,-90,144,-58,-56,]),'MULT':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[42,-49,-79,-80,-81,-82,-83,-84,42,-49,-79,-74,-73,-75,42,42,-64,-65,42,42,42,42,42,42,42,42,-76,42,42,-50,42,42,-78,42,42,42,-49,-77,42,42,]),'DIV':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[43,-49,-79,-80,-81,-82,-83,-84,43,-49,-79,-74,-73,-75,43,43,-64,-65,43,43,43,43,43,43,43,43,-76,43,43,-50,43,43,-78,43,43,43,-49,-77,43,43,]),'GT':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[44,-49,-79,-80,-81,-82,-83,-84,44,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,44,44,44,44,-76,44,44,-50,44,44,-78,44,44,44,-49,-77,44,44,]),'GE':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[45,-49,-79,-80,-81,-82,-83,-84,45,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,45,45,45,45,-76,45,45,-50,45,45,-78,45,45,45,-49,-77,45,45,]),'LT':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[46,-49,-79,-80,-81,-82,-83,-84,46,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,46,46,46,46,-76,46,46,-50,46,46,-78,46,46,46,-49,-77,46,46,]),'LE':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[47,-49,-79,-80,-81,-82,-83,-84,47,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,47,47,47,47,-76,47,47,-50,47,47,-78,47,47,47,-49,-77,47,47,]),'EQ':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[48,-49,-79,-80,-81,-82,-83,-84,48,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,48,48,48,-76,48,48,-50,48,48,-78,48,48,48,-49,-77,48,48,]),'AND':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[49,-49,-79,-80,-81,-82,-83,-84,49,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,49,49,-76,49,49,-50,49,49,-78,49,49,49,-49,-77,49,49,]),'OR':([13,15,23,28,29,30,31,32,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,89,96,97,98,104,108,109,116,117,126,146,148,159,181,],[50,-49,-79,-80,-81,-82,-83,-84,50,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,50,-76,50,50,-50,50,50,-78,50,50,50,-49,-77,50,50,]),'ASSIGN':([15,23,51,53,98,146,160,161,],[-49,64,82,86,-50,-49,82,86,]),'DOT':([15,23,56,57,98,146,],[-49,65,-49,65,-50,-49,]),'LBRACE':([21,62,123,125,127,132,133,149,151,152,156,179,],[-89,95,-18,-20,-19,95,-89,163,163,163,95,95,]),'RPAREN':([28,29,30,31,32,54,55,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,81,85,87,88,89,90,96,98,99,102,103,107,109,111,113,114,116,117,120,121,122,126,128,131,148,150,154,181,],[-80,-81,-82,-83,-84,-87,89,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-25,-25,109,-86,-76,-25,119,-50,-87,123,-24,125,-78,127,129,-12,132,133,148,-26,-27,-85,-14,-13,-77,-23,-11,184,]),'COMMA':([28,29,30,31,32,51,52,54,56,57,66,67,68,70,71,72,73,74,75,76,77,78,79,80,81,85,87,88,89,90,98,99,102,103,105,106,107,109,111,113,114,120,121,122,126,128,131,148,150,154,160,],[-80,-81,-82,-83,-84,83,84,-87,-49,-79,-74,-73,-75,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-25,-25,110,-86,-76,-25,-50,-87,124,-24,-47,-46,124,-78,124,130,-12,110,-26,-27,-85,-14,-13,-77,-23,-11,83,]),'ELSE':([173,],[179,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,],[2,]),'statement':([2,95,160,161,164,165,166,176,],[3,120,120,120,120,120,120,120,]),'function_def':([2,],[4,]),'record_def':([2,],[5,]),'if_stmt':([2,95,160,161,164,165,166,176,],[6,121,121,121,121,121,121,121,]),'while_stmt':([2,95,160,161,164,165,166,176,],[7,122,122,122,122,122,122,122,]),'do_while_stmt':([2,95,160,161,164,165,166,176,],[8,123,123,123,123,123,123,123,]),'print_stmt':([2,95,160,161,164,165,166,176,],[9,126,126,126,126,126,126,126,]),'decl_stmt':([2,95,160,161,164,165,166,176,],[10,10,10,10,10,10,10,10,]),'assign_stmt':([2,95,160,161,164,165,166,176,],[12,12,12,12,12,12,12,12,]),'expr':([2,16,24,25,26,40,41,42,43,44,45,46,47,48,49,50,54,60,61,64,65,83,87,95,99,110,128,160,161,162,164,165,166,176,],[13,55,67,68,69,71,72,73,74,75,76,77,78,79,80,81,89,93,94,96,97,104,108,13,89,138,148,13,13,169,13,13,13,13,]),'type':([2,82,86,91,92,95,136,142,160,161,164,165,166,176,],[14,100,100,100,115,129,100,115,129,129,129,129,129,129,]),'lvalue':([2,16,24,25,26,40,41,42,43,44,45,46,47,48,49,50,54,60,61,64,65,83,87,95,99,110,128,160,161,162,164,165,166,176,],[23,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,23,57,57,57,23,23,57,23,23,23,23,]),'id_list':([14,129,],[52,52,]),'block_open':([21,116,117,173,],[62,144,145,175,]),'arg_list':([54,99,],[88,132,]),'stmt_block':([62,144,145,153,156,157,175,],[95,160,161,164,165,166,176,]),'param_list':([82,86,91,],[102,107,111,]),'param':([82,86,91,136,],[103,103,103,155,]),'field_list':([92,],[113,]),'field':([92,142,],[114,159,]),'inner_statement':([95,160,161,164,165,166,176,],[119,119,119,119,119,119,119,]),'break_stmt':([95,160,161,164,165,166,176,],[124,124,124,124,124,124,124,]),'return_stmt':([95,160,161,164,165,166,176,],[125,125,125,125,125,125,125,]),'func_open':([135,137,139,],[153,156,157,]),}
+_lr_goto_items = {'program':([0,],[1,]),'statement_list':([0,],[2,]),'statement':([2,118,166,170,171,172,174,185,],[3,136,136,136,136,136,136,136,]),'function_def':([2,],[4,]),'record_def':([2,],[5,]),'if_stmt':([2,118,166,170,171,172,174,185,],[6,137,137,137,137,137,137,137,]),'while_stmt':([2,118,166,170,171,172,174,185,],[7,138,138,138,138,138,138,138,]),'do_while_stmt':([2,118,166,170,171,172,174,185,],[8,139,139,139,139,139,139,139,]),'print_stmt':([2,118,166,170,171,172,174,185,],[9,142,142,142,142,142,142,142,]),'decl_stmt':([2,118,166,170,171,172,174,185,],[10,10,10,10,10,10,10,10,]),'assign_stmt':([2,118,166,170,171,172,174,185,],[12,12,12,12,12,12,12,12,]),'expr':([2,16,24,25,26,40,41,42,43,44,45,46,47,48,49,50,54,63,64,82,86,92,93,99,110,118,144,166,170,171,172,174,175,185,],[13,55,66,67,68,70,71,72,73,74,75,76,77,78,79,80,88,96,97,104,108,116,117,88,126,13,159,13,13,13,13,13,181,13,]),'type':([2,81,85,90,91,118,124,130,166,170,171,172,174,185,],[14,100,100,100,115,145,100,115,145,145,145,145,145,145,]),'lvalue':([2,16,24,25,26,40,41,42,43,44,45,46,47,48,49,50,54,63,64,82,86,92,93,99,110,118,144,166,170,171,172,174,175,185,],[23,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,23,57,23,23,23,23,23,57,23,]),'id_list':([14,145,],[52,52,]),'loop_enter':([21,133,],[62,156,]),'arg_list':([54,99,],[87,120,]),'cond_open':([60,61,168,],[92,93,175,]),'block_open':([62,132,156,179,],[94,155,167,182,]),'param_list':([81,85,90,],[102,107,111,]),'param':([81,85,90,124,],[103,103,103,150,]),'field_list':([91,],[113,]),'field':([91,130,],[114,154,]),'stmt_block':([94,155,162,164,165,167,182,],[118,166,170,171,172,174,185,]),'inner_statement':([118,166,170,171,172,174,185,],[135,135,135,135,135,135,135,]),'break_stmt':([118,166,170,171,172,174,185,],[140,140,140,140,140,140,140,]),'return_stmt':([118,166,170,171,172,174,185,],[141,141,141,141,141,141,141,]),'function_prep_basic':([123,],[149,]),'function_prep_record':([125,],[151,]),'function_prep_void':([127,],[152,]),'func_open':([149,151,152,],[162,164,165,]),'loop_exit':([180,184,],[183,186,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,88 +27,94 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> statement_list','program',1,'p_program','parser.py',185),
-  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list_stmt','parser.py',189),
-  ('statement_list -> statement_list function_def','statement_list',2,'p_statement_list_func','parser.py',193),
-  ('statement_list -> statement_list record_def','statement_list',2,'p_statement_list_record','parser.py',197),
-  ('statement_list -> statement_list if_stmt','statement_list',2,'p_statement_list_if','parser.py',201),
-  ('statement_list -> statement_list while_stmt','statement_list',2,'p_statement_list_while','parser.py',205),
-  ('statement_list -> statement_list do_while_stmt','statement_list',2,'p_statement_list_dowhile','parser.py',209),
-  ('statement_list -> statement_list print_stmt','statement_list',2,'p_statement_list_print','parser.py',213),
-  ('statement_list -> <empty>','statement_list',0,'p_statement_list_empty','parser.py',217),
-  ('record_def -> RECORD ID LPAREN field_list RPAREN SEMICOLON','record_def',6,'p_record_def','parser.py',223),
-  ('field_list -> field_list COMMA field','field_list',3,'p_field_list_multi','parser.py',232),
-  ('field_list -> field','field_list',1,'p_field_list_single','parser.py',236),
-  ('field -> type ID','field',2,'p_field_basic','parser.py',240),
-  ('field -> ID ID','field',2,'p_field_record','parser.py',244),
-  ('function_def -> type ID LPAREN param_list RPAREN func_open stmt_block RBRACE','function_def',8,'p_function_def_basic','parser.py',252),
-  ('function_def -> VOID ID LPAREN param_list RPAREN func_open stmt_block RBRACE','function_def',8,'p_function_def_void','parser.py',257),
-  ('function_def -> ID ID LPAREN param_list RPAREN func_open stmt_block RBRACE','function_def',8,'p_function_def_record','parser.py',262),
-  ('func_open -> LBRACE','func_open',1,'p_func_open','parser.py',270),
-  ('block_open -> LBRACE','block_open',1,'p_block_open','parser.py',277),
-  ('param_list -> param_list COMMA param','param_list',3,'p_param_list_multi','parser.py',282),
-  ('param_list -> param','param_list',1,'p_param_list_single','parser.py',288),
-  ('param_list -> <empty>','param_list',0,'p_param_list_empty','parser.py',294),
-  ('param -> type ID','param',2,'p_param_basic','parser.py',300),
-  ('param -> ID ID','param',2,'p_param_record','parser.py',304),
-  ('stmt_block -> stmt_block inner_statement','stmt_block',2,'p_stmt_block_multi','parser.py',329),
-  ('stmt_block -> <empty>','stmt_block',0,'p_stmt_block_empty','parser.py',333),
-  ('inner_statement -> statement','inner_statement',1,'p_inner_statement','parser.py',337),
-  ('inner_statement -> if_stmt','inner_statement',1,'p_inner_statement','parser.py',338),
-  ('inner_statement -> while_stmt','inner_statement',1,'p_inner_statement','parser.py',339),
-  ('inner_statement -> do_while_stmt','inner_statement',1,'p_inner_statement','parser.py',340),
-  ('inner_statement -> break_stmt','inner_statement',1,'p_inner_statement','parser.py',341),
-  ('inner_statement -> return_stmt','inner_statement',1,'p_inner_statement','parser.py',342),
-  ('inner_statement -> print_stmt','inner_statement',1,'p_inner_statement','parser.py',343),
-  ('statement -> decl_stmt SEMICOLON','statement',2,'p_statement_decl','parser.py',349),
-  ('statement -> assign_stmt SEMICOLON','statement',2,'p_statement_assign','parser.py',353),
-  ('statement -> expr SEMICOLON','statement',2,'p_statement_expr','parser.py',357),
-  ('statement -> SEMICOLON','statement',1,'p_statement_semi','parser.py',361),
-  ('decl_stmt -> type ID ASSIGN expr','decl_stmt',4,'p_decl_type_assign','parser.py',367),
-  ('decl_stmt -> type ID','decl_stmt',2,'p_decl_type_only','parser.py',379),
-  ('decl_stmt -> type id_list','decl_stmt',2,'p_decl_type_list','parser.py',386),
-  ('decl_stmt -> ID ID ASSIGN expr','decl_stmt',4,'p_decl_record_assign','parser.py',395),
-  ('decl_stmt -> ID ID','decl_stmt',2,'p_decl_record_only','parser.py',406),
-  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','parser.py',415),
-  ('id_list -> ID COMMA ID','id_list',3,'p_id_list','parser.py',416),
-  ('assign_stmt -> lvalue ASSIGN expr','assign_stmt',3,'p_assign_stmt','parser.py',425),
-  ('lvalue -> ID','lvalue',1,'p_lvalue_id','parser.py',441),
-  ('lvalue -> lvalue DOT ID','lvalue',3,'p_lvalue_dot','parser.py',450),
-  ('type -> INT','type',1,'p_type','parser.py',470),
-  ('type -> FLOAT','type',1,'p_type','parser.py',471),
-  ('type -> CHAR','type',1,'p_type','parser.py',472),
-  ('type -> BOOLEAN','type',1,'p_type','parser.py',473),
-  ('if_stmt -> IF LPAREN expr RPAREN block_open stmt_block RBRACE','if_stmt',7,'p_if_stmt_simple','parser.py',479),
-  ('if_stmt -> IF LPAREN expr RPAREN block_open stmt_block RBRACE ELSE block_open stmt_block RBRACE','if_stmt',11,'p_if_stmt_else','parser.py',489),
-  ('while_stmt -> WHILE LPAREN expr RPAREN block_open stmt_block RBRACE','while_stmt',7,'p_while_stmt','parser.py',503),
-  ('do_while_stmt -> DO block_open stmt_block RBRACE WHILE LPAREN expr RPAREN','do_while_stmt',8,'p_do_while_stmt','parser.py',516),
-  ('break_stmt -> BREAK SEMICOLON','break_stmt',2,'p_break_stmt','parser.py',526),
-  ('return_stmt -> RETURN expr SEMICOLON','return_stmt',3,'p_return_stmt','parser.py',530),
-  ('print_stmt -> PRINT LPAREN expr RPAREN SEMICOLON','print_stmt',5,'p_print_stmt','parser.py',536),
-  ('expr -> expr PLUS expr','expr',3,'p_expr_plus','parser.py',547),
-  ('expr -> expr MINUS expr','expr',3,'p_expr_minus','parser.py',551),
-  ('expr -> expr MULT expr','expr',3,'p_expr_mult','parser.py',555),
-  ('expr -> expr DIV expr','expr',3,'p_expr_div','parser.py',559),
-  ('expr -> expr GT expr','expr',3,'p_expr_gt','parser.py',577),
-  ('expr -> expr GE expr','expr',3,'p_expr_ge','parser.py',581),
-  ('expr -> expr LT expr','expr',3,'p_expr_lt','parser.py',585),
-  ('expr -> expr LE expr','expr',3,'p_expr_le','parser.py',589),
-  ('expr -> expr EQ expr','expr',3,'p_expr_eq','parser.py',593),
-  ('expr -> expr AND expr','expr',3,'p_expr_and','parser.py',614),
-  ('expr -> expr OR expr','expr',3,'p_expr_or','parser.py',618),
-  ('expr -> MINUS expr','expr',2,'p_expr_uminus','parser.py',634),
-  ('expr -> PLUS expr','expr',2,'p_expr_uplus','parser.py',645),
-  ('expr -> NOT expr','expr',2,'p_expr_not','parser.py',656),
-  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_paren','parser.py',669),
-  ('expr -> NEW ID LPAREN arg_list RPAREN','expr',5,'p_expr_new','parser.py',675),
-  ('expr -> ID LPAREN arg_list RPAREN','expr',4,'p_expr_call','parser.py',703),
-  ('expr -> lvalue','expr',1,'p_expr_lvalue','parser.py',743),
-  ('expr -> INT_VALUE','expr',1,'p_expr_int','parser.py',750),
-  ('expr -> FLOAT_VALUE','expr',1,'p_expr_float','parser.py',754),
-  ('expr -> CHAR_VALUE','expr',1,'p_expr_char','parser.py',758),
-  ('expr -> TRUE','expr',1,'p_expr_true','parser.py',762),
-  ('expr -> FALSE','expr',1,'p_expr_false','parser.py',766),
-  ('arg_list -> arg_list COMMA expr','arg_list',3,'p_arg_list_multi','parser.py',772),
-  ('arg_list -> expr','arg_list',1,'p_arg_list_single','parser.py',776),
-  ('arg_list -> <empty>','arg_list',0,'p_arg_list_empty','parser.py',780),
+  ('program -> statement_list','program',1,'p_program','parser.py',364),
+  ('statement_list -> statement_list statement','statement_list',2,'p_statement_list_stmt','parser.py',368),
+  ('statement_list -> statement_list function_def','statement_list',2,'p_statement_list_func','parser.py',372),
+  ('statement_list -> statement_list record_def','statement_list',2,'p_statement_list_record','parser.py',376),
+  ('statement_list -> statement_list if_stmt','statement_list',2,'p_statement_list_if','parser.py',380),
+  ('statement_list -> statement_list while_stmt','statement_list',2,'p_statement_list_while','parser.py',384),
+  ('statement_list -> statement_list do_while_stmt','statement_list',2,'p_statement_list_dowhile','parser.py',388),
+  ('statement_list -> statement_list print_stmt','statement_list',2,'p_statement_list_print','parser.py',392),
+  ('statement_list -> <empty>','statement_list',0,'p_statement_list_empty','parser.py',396),
+  ('record_def -> RECORD ID LPAREN field_list RPAREN SEMICOLON','record_def',6,'p_record_def','parser.py',402),
+  ('field_list -> field_list COMMA field','field_list',3,'p_field_list_multi','parser.py',417),
+  ('field_list -> field','field_list',1,'p_field_list_single','parser.py',421),
+  ('field -> type ID','field',2,'p_field_basic','parser.py',425),
+  ('field -> ID ID','field',2,'p_field_record','parser.py',429),
+  ('function_def -> type ID LPAREN param_list RPAREN function_prep_basic func_open stmt_block RBRACE','function_def',9,'p_function_def_basic','parser.py',438),
+  ('function_def -> VOID ID LPAREN param_list RPAREN function_prep_void func_open stmt_block RBRACE','function_def',9,'p_function_def_void','parser.py',447),
+  ('function_def -> ID ID LPAREN param_list RPAREN function_prep_record func_open stmt_block RBRACE','function_def',9,'p_function_def_record','parser.py',456),
+  ('function_prep_basic -> <empty>','function_prep_basic',0,'p_function_prep_basic','parser.py',468),
+  ('function_prep_void -> <empty>','function_prep_void',0,'p_function_prep_void','parser.py',473),
+  ('function_prep_record -> <empty>','function_prep_record',0,'p_function_prep_record','parser.py',478),
+  ('func_open -> LBRACE','func_open',1,'p_func_open','parser.py',483),
+  ('block_open -> LBRACE','block_open',1,'p_block_open','parser.py',495),
+  ('param_list -> param_list COMMA param','param_list',3,'p_param_list_multi','parser.py',502),
+  ('param_list -> param','param_list',1,'p_param_list_single','parser.py',508),
+  ('param_list -> <empty>','param_list',0,'p_param_list_empty','parser.py',514),
+  ('param -> type ID','param',2,'p_param_basic','parser.py',520),
+  ('param -> ID ID','param',2,'p_param_record','parser.py',524),
+  ('stmt_block -> stmt_block inner_statement','stmt_block',2,'p_stmt_block_multi','parser.py',573),
+  ('stmt_block -> <empty>','stmt_block',0,'p_stmt_block_empty','parser.py',577),
+  ('inner_statement -> statement','inner_statement',1,'p_inner_statement','parser.py',581),
+  ('inner_statement -> if_stmt','inner_statement',1,'p_inner_statement','parser.py',582),
+  ('inner_statement -> while_stmt','inner_statement',1,'p_inner_statement','parser.py',583),
+  ('inner_statement -> do_while_stmt','inner_statement',1,'p_inner_statement','parser.py',584),
+  ('inner_statement -> break_stmt','inner_statement',1,'p_inner_statement','parser.py',585),
+  ('inner_statement -> return_stmt','inner_statement',1,'p_inner_statement','parser.py',586),
+  ('inner_statement -> print_stmt','inner_statement',1,'p_inner_statement','parser.py',587),
+  ('statement -> decl_stmt SEMICOLON','statement',2,'p_statement_decl','parser.py',593),
+  ('statement -> assign_stmt SEMICOLON','statement',2,'p_statement_assign','parser.py',597),
+  ('statement -> expr SEMICOLON','statement',2,'p_statement_expr','parser.py',601),
+  ('statement -> SEMICOLON','statement',1,'p_statement_semi','parser.py',605),
+  ('decl_stmt -> type ID ASSIGN expr','decl_stmt',4,'p_decl_type_assign','parser.py',611),
+  ('decl_stmt -> type ID','decl_stmt',2,'p_decl_type_only','parser.py',629),
+  ('decl_stmt -> type id_list','decl_stmt',2,'p_decl_type_list','parser.py',637),
+  ('decl_stmt -> ID ID ASSIGN expr','decl_stmt',4,'p_decl_record_assign','parser.py',647),
+  ('decl_stmt -> ID ID','decl_stmt',2,'p_decl_record_only','parser.py',659),
+  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','parser.py',669),
+  ('id_list -> ID COMMA ID','id_list',3,'p_id_list','parser.py',670),
+  ('assign_stmt -> lvalue ASSIGN expr','assign_stmt',3,'p_assign_stmt','parser.py',679),
+  ('lvalue -> ID','lvalue',1,'p_lvalue_id','parser.py',709),
+  ('lvalue -> lvalue DOT ID','lvalue',3,'p_lvalue_dot','parser.py',719),
+  ('type -> INT','type',1,'p_type','parser.py',741),
+  ('type -> FLOAT','type',1,'p_type','parser.py',742),
+  ('type -> CHAR','type',1,'p_type','parser.py',743),
+  ('type -> BOOLEAN','type',1,'p_type','parser.py',744),
+  ('if_stmt -> IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACE','if_stmt',8,'p_if_stmt_simple','parser.py',750),
+  ('if_stmt -> IF LPAREN cond_open expr RPAREN block_open stmt_block RBRACE ELSE block_open stmt_block RBRACE','if_stmt',12,'p_if_stmt_else','parser.py',766),
+  ('while_stmt -> WHILE LPAREN cond_open expr RPAREN loop_enter block_open stmt_block RBRACE loop_exit','while_stmt',10,'p_while_stmt','parser.py',788),
+  ('do_while_stmt -> DO loop_enter block_open stmt_block RBRACE WHILE LPAREN cond_open expr RPAREN loop_exit','do_while_stmt',11,'p_do_while_stmt','parser.py',807),
+  ('break_stmt -> BREAK SEMICOLON','break_stmt',2,'p_break_stmt','parser.py',825),
+  ('return_stmt -> RETURN expr SEMICOLON','return_stmt',3,'p_return_stmt','parser.py',833),
+  ('print_stmt -> PRINT LPAREN expr RPAREN SEMICOLON','print_stmt',5,'p_print_stmt','parser.py',854),
+  ('expr -> expr PLUS expr','expr',3,'p_expr_plus','parser.py',867),
+  ('expr -> expr MINUS expr','expr',3,'p_expr_minus','parser.py',872),
+  ('expr -> expr MULT expr','expr',3,'p_expr_mult','parser.py',877),
+  ('expr -> expr DIV expr','expr',3,'p_expr_div','parser.py',882),
+  ('expr -> expr GT expr','expr',3,'p_expr_gt','parser.py',917),
+  ('expr -> expr GE expr','expr',3,'p_expr_ge','parser.py',922),
+  ('expr -> expr LT expr','expr',3,'p_expr_lt','parser.py',927),
+  ('expr -> expr LE expr','expr',3,'p_expr_le','parser.py',932),
+  ('expr -> expr EQ expr','expr',3,'p_expr_eq','parser.py',937),
+  ('expr -> expr AND expr','expr',3,'p_expr_and','parser.py',977),
+  ('expr -> expr OR expr','expr',3,'p_expr_or','parser.py',982),
+  ('expr -> MINUS expr','expr',2,'p_expr_uminus','parser.py',1006),
+  ('expr -> PLUS expr','expr',2,'p_expr_uplus','parser.py',1023),
+  ('expr -> NOT expr','expr',2,'p_expr_not','parser.py',1039),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_paren','parser.py',1058),
+  ('expr -> NEW ID LPAREN arg_list RPAREN','expr',5,'p_expr_new','parser.py',1064),
+  ('expr -> ID LPAREN arg_list RPAREN','expr',4,'p_expr_call','parser.py',1095),
+  ('expr -> lvalue','expr',1,'p_expr_lvalue','parser.py',1139),
+  ('expr -> INT_VALUE','expr',1,'p_expr_int','parser.py',1150),
+  ('expr -> FLOAT_VALUE','expr',1,'p_expr_float','parser.py',1154),
+  ('expr -> CHAR_VALUE','expr',1,'p_expr_char','parser.py',1158),
+  ('expr -> TRUE','expr',1,'p_expr_true','parser.py',1162),
+  ('expr -> FALSE','expr',1,'p_expr_false','parser.py',1166),
+  ('arg_list -> arg_list COMMA expr','arg_list',3,'p_arg_list_multi','parser.py',1172),
+  ('arg_list -> expr','arg_list',1,'p_arg_list_single','parser.py',1176),
+  ('arg_list -> <empty>','arg_list',0,'p_arg_list_empty','parser.py',1180),
+  ('cond_open -> <empty>','cond_open',0,'p_cond_open','parser.py',1186),
+  ('loop_enter -> <empty>','loop_enter',0,'p_loop_enter','parser.py',1193),
+  ('loop_exit -> <empty>','loop_exit',0,'p_loop_exit','parser.py',1201),
 ]
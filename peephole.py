@@ -0,0 +1,65 @@
+# =============================================================================
+# OPTIMIZACIÓN DE MIRILLA (PEEPHOLE) SOBRE EL FLUJO DE CUARTETOS
+# =============================================================================
+#
+# Se aplica sobre la lista final de cuartetos (tuplas op, arg1, arg2, res, con
+# operandos tipados o en texto), antes de escribirla. Supone que cada temporal
+# @Tn se define una única vez, que es lo que garantiza new_temp(); por eso
+# debe ejecutarse antes de cualquier reutilización de temporales.
+#
+# Reglas:
+#   OP a,b,@Tn   + ASSIGN,@Tn,_,v   ->  OP a,b,v          (@Tn de un solo uso)
+#   CHAR_TO_INT a,_,@T1 + INT_TO_FLOAT @T1,_,@T2  ->  CHAR_TO_FLOAT a,_,@T2
+#   ASSIGN,v,_,v                    ->  (se elimina)
+
+# Operaciones que no escriben un valor en el campo resultado
+NO_RESULT_OPS = {'LABEL', 'JUMP', 'JUMPF', 'JUMPT', 'PRINT'}
+
+
+def is_temp(operand):
+    return isinstance(operand, str) and operand.startswith('@T')
+
+
+def _is_self_assign(op, arg1, result):
+    # type() y no isinstance(): un literal Char('x') no es la variable x
+    return op == 'ASSIGN' and type(arg1) is str and arg1 == result
+
+
+def _use_counts(quartets):
+    uses = {}
+    for _, arg1, arg2, _ in quartets:
+        if is_temp(arg1):
+            uses[arg1] = uses.get(arg1, 0) + 1
+        if is_temp(arg2):
+            uses[arg2] = uses.get(arg2, 0) + 1
+    return uses
+
+
+def peephole(quartets):
+    """Devuelve una nueva lista de cuartetos optimizada."""
+    uses = _use_counts(quartets)
+    out = []
+    for q in quartets:
+        op, arg1, arg2, result = q
+        prev = out[-1] if out else None
+
+        if (op == 'ASSIGN' and prev is not None and is_temp(arg1)
+                and uses.get(arg1) == 1 and prev[3] == arg1
+                and prev[0] not in NO_RESULT_OPS):
+            # Redirige el temporal de un solo uso a su destino final
+            out[-1] = q = (prev[0], prev[1], prev[2], result)
+            op, arg1, arg2, result = q
+            if _is_self_assign(op, arg1, result):
+                out.pop()
+            continue
+
+        if (op == 'INT_TO_FLOAT' and prev is not None and prev[0] == 'CHAR_TO_INT'
+                and is_temp(arg1) and uses.get(arg1) == 1 and prev[3] == arg1):
+            out[-1] = ('CHAR_TO_FLOAT', prev[1], '_', result)
+            continue
+
+        if _is_self_assign(op, arg1, result):
+            continue
+
+        out.append(q)
+    return out
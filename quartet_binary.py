@@ -0,0 +1,184 @@
+import mmap
+import struct
+
+from quartet_store import OPCODES, NONE, VAR, LABEL, INT, FLOAT, BOOL, CHAR, Char
+
+# =============================================================================
+# FORMATO BINARIO .quartets.bin
+# =============================================================================
+#
+# Pensado para abrirse con mmap y acceder a cualquier cuarteto sin leer ni
+# analizar el resto del fichero. Todo en little-endian:
+#
+#   cabecera (48 bytes)
+#     magic 'LVQ1', versión u16, nº de opcodes u16, nº de operandos u32,
+#     reservado u32, nº de cuartetos u64, y los desplazamientos u64 de la
+#     tabla de operandos, de las instrucciones y del pool de cadenas.
+#   tabla de operandos (pool de constantes), 16 bytes por entrada
+#     tipo u8, relleno, y 8 bytes de carga: int64 (INT, BOOL), double (FLOAT)
+#     o (desplazamiento u32, longitud u32) en el pool de cadenas (VAR, LABEL,
+#     CHAR y enteros que no caben en 64 bits).
+#   instrucciones, 16 bytes por cuarteto
+#     opcode u8, relleno, arg1 i32, arg2 i32, result i32. Un id >= 0 indexa la
+#     tabla de operandos; un id negativo -n es el temporal @Tn.
+#   pool de cadenas (símbolos) en UTF-8.
+
+MAGIC = b'LVQ1'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIQQQQ')
+ENTRY_INT = struct.Struct('<B7xq')
+ENTRY_FLOAT = struct.Struct('<B7xd')
+ENTRY_STR = struct.Struct('<B3xII')
+CODE = struct.Struct('<B3xiii')
+
+# Tipo interno del fichero para enteros fuera del rango int64
+_BIGINT = 0x80
+
+_STRING_KINDS = (VAR, LABEL, CHAR)
+
+
+class QuartetFileError(Exception):
+    pass
+
+
+# =============================================================================
+# ESCRITURA
+# =============================================================================
+
+def write_binary(buffer, path):
+    """Escribe un QuartetBuffer en formato .quartets.bin."""
+    table = buffer.table
+    strings = bytearray()
+
+    def add_string(text):
+        data = text.encode('utf-8')
+        offset = len(strings)
+        strings.extend(data)
+        return offset, len(data)
+
+    entries = bytearray(16 * len(table))
+    for oid, (kind, value) in enumerate(zip(table.kinds, table.values)):
+        pos = 16 * oid
+        if kind in _STRING_KINDS:
+            ENTRY_STR.pack_into(entries, pos, kind, *add_string(value))
+        elif kind == FLOAT:
+            ENTRY_FLOAT.pack_into(entries, pos, kind, value)
+        elif kind in (INT, BOOL):
+            if -(1 << 63) <= value < (1 << 63):
+                ENTRY_INT.pack_into(entries, pos, kind, int(value))
+            else:
+                ENTRY_STR.pack_into(entries, pos, _BIGINT, *add_string(str(value)))
+        else:
+            ENTRY_INT.pack_into(entries, pos, NONE, 0)
+
+    n = len(buffer)
+    code = bytearray(CODE.size * n)
+    pack = CODE.pack_into
+    pos = 0
+    for op, a, b, r in zip(buffer.ops, buffer.arg1, buffer.arg2, buffer.result):
+        pack(code, pos, op, a, b, r)
+        pos += CODE.size
+
+    operands_off = HEADER.size
+    code_off = operands_off + len(entries)
+    strings_off = code_off + len(code)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(OPCODES), len(table), 0,
+                            n, operands_off, code_off, strings_off))
+        f.write(entries)
+        f.write(code)
+        f.write(strings)
+
+
+# =============================================================================
+# LECTURA (mmap, acceso aleatorio sin copia)
+# =============================================================================
+
+class QuartetFile:
+    """
+    Vista de solo lectura de un .quartets.bin. Abrirla cuesta lo mismo sea cual
+    sea el tamaño: solo se lee la cabecera. Cada cuarteto se decodifica al
+    accederlo, como tupla (op, arg1, arg2, res) con operandos tipados igual
+    que QuartetBuffer.rows().
+    """
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise QuartetFileError(f"'{path}' está vacío.") from None
+        if len(self._mm) < HEADER.size:
+            self.close()
+            raise QuartetFileError(f"'{path}' no es un fichero .quartets.bin.")
+        (magic, version, nopcodes, self._noperands, _, self._n,
+         self._operands_off, self._code_off, self._strings_off) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or nopcodes != len(OPCODES):
+            self.close()
+            raise QuartetFileError(f"'{path}' no es un .quartets.bin compatible.")
+        self._cache = {}
+
+    def close(self):
+        if getattr(self, '_mm', None) is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._n
+
+    def _string(self, offset, length):
+        start = self._strings_off + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def operand(self, oid):
+        if oid < 0:
+            return f"@T{-oid}"
+        value = self._cache.get(oid)
+        if value is not None:
+            return value
+        if oid >= self._noperands:
+            raise QuartetFileError(f"Operando {oid} fuera de rango.")
+        pos = self._operands_off + 16 * oid
+        kind = self._mm[pos]
+        if kind == FLOAT:
+            value = ENTRY_FLOAT.unpack_from(self._mm, pos)[1]
+        elif kind == INT:
+            value = ENTRY_INT.unpack_from(self._mm, pos)[1]
+        elif kind == BOOL:
+            value = bool(ENTRY_INT.unpack_from(self._mm, pos)[1])
+        elif kind == _BIGINT:
+            value = int(self._string(*ENTRY_STR.unpack_from(self._mm, pos)[1:]))
+        elif kind in _STRING_KINDS:
+            value = self._string(*ENTRY_STR.unpack_from(self._mm, pos)[1:])
+            if kind == CHAR:
+                value = Char(value)
+        else:
+            value = '_'
+        self._cache[oid] = value
+        return value
+
+    def raw(self, i):
+        """Registro sin decodificar: (opcode, arg1, arg2, result) como enteros."""
+        if not 0 <= i < self._n:
+            raise IndexError(i)
+        return CODE.unpack_from(self._mm, self._code_off + CODE.size * i)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._n
+        op, a, b, r = self.raw(i)
+        operand = self.operand
+        return (OPCODES[op], operand(a), operand(b), operand(r))
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
@@ -0,0 +1,268 @@
+import os
+from array import array
+
+# =============================================================================
+# ALMACÉN COMPACTO DE CUARTETOS
+# =============================================================================
+#
+# En lugar de tuplas de cuatro cadenas, cada cuarteto se guarda como cuatro
+# enteros en columnas paralelas:
+#   ops     array('B')  código de operación (índice en OPCODES)
+#   arg1    array('i')  id de operando
+#   arg2    array('i')  id de operando
+#   result  array('i')  id de operando
+# Los operandos se internan una sola vez en una OperandTable compartida por
+# todos los buffers de una compilación. Los temporales, que son casi todos
+# distintos, no ocupan entrada en la tabla: @Tn (n >= 1) se codifica como -n.
+# El texto solo se genera al escribir.
+
+OPCODES = [
+    'ASSIGN',
+    'ADD', 'SUB', 'MUL', 'DIV',
+    'GT', 'GTE', 'LT', 'LTE', 'EQ',
+    'AND', 'OR', 'NOT',
+    'UMINUS', 'UPLUS',
+    'CHAR_TO_INT', 'INT_TO_FLOAT', 'CHAR_TO_FLOAT',
+    'JUMP', 'JUMPF', 'JUMPT', 'LABEL',
+    'PRINT', 'CALL',
+]
+OPCODE_INDEX = {name: i for i, name in enumerate(OPCODES)}
+_JUMP_NAMES = ('JUMP', 'JUMPF', 'JUMPT')
+JUMP_OPCODES = frozenset(OPCODE_INDEX[op] for op in _JUMP_NAMES)
+
+# Tipos de operando
+NONE, VAR, TEMP, LABEL, INT, FLOAT, BOOL, CHAR = range(8)
+
+
+class Char(str):
+    """Literal char: se distingue así de un nombre de variable de un carácter."""
+    __slots__ = ()
+
+
+def classify(value):
+    """Tipo de operando de un valor tal y como lo recibe emit()."""
+    if value is True or value is False: return BOOL
+    if isinstance(value, Char):         return CHAR
+    if isinstance(value, int):          return INT
+    if isinstance(value, float):        return FLOAT
+    if value == '_':                    return NONE
+    if value.startswith('@T'):          return TEMP
+    if value.startswith('@L'):          return LABEL
+    return VAR
+
+
+def render(kind, value):
+    """Texto de un operando en el formato .quartets."""
+    if kind == BOOL: return 'true' if value else 'false'
+    if kind == CHAR: return f"'{value}'"
+    return str(value)
+
+
+class OperandTable:
+    """Tabla de operandos internados: valor tipado -> id (>= 0)."""
+
+    def __init__(self):
+        self.kinds = array('B', [NONE])
+        self.values = ['_']
+        # Un diccionario por clase de Python: 1, 1.0, True y Char('a') frente
+        # a la variable 'a' no colisionan.
+        self._index = {str: {'_': 0}, Char: {}, int: {}, float: {}, bool: {}}
+        self._texts = []
+
+    def __len__(self):
+        return len(self.values)
+
+    def intern(self, value):
+        cls = value.__class__
+        if cls is str and value.startswith('@T'):
+            return -int(value[2:])
+        index = self._index[cls]
+        oid = index.get(value)
+        if oid is None:
+            oid = index[value] = len(self.values)
+            self.kinds.append(classify(value))
+            self.values.append(value)
+        return oid
+
+    def value(self, oid):
+        return self.values[oid] if oid >= 0 else f"@T{-oid}"
+
+    def text(self, oid):
+        return render(self.kinds[oid], self.values[oid]) if oid >= 0 else f"@T{-oid}"
+
+    def texts(self):
+        """Texto de cada operando de la tabla (se amplía según se internan más)."""
+        cache = self._texts
+        kinds, values = self.kinds, self.values
+        for i in range(len(cache), len(values)):
+            cache.append(render(kinds[i], values[i]))
+        return cache
+
+
+class _Chunk:
+    """Tramo de cuartetos en columnas; los tramos se enlazan en una lista."""
+    __slots__ = ('ops', 'arg1', 'arg2', 'result', 'next')
+
+    def __init__(self):
+        self.ops = array('B')
+        self.arg1 = array('i')
+        self.arg2 = array('i')
+        self.result = array('i')
+        self.next = None
+
+
+class QuartetBuffer:
+    """
+    Secuencia de cuartetos en columnas paralelas sobre una OperandTable.
+
+    Internamente es una lista enlazada de tramos (_Chunk). extend() engancha
+    los tramos del otro buffer en O(1) en lugar de copiarlos, así que cerrar
+    un bloque no vuelve a copiar lo que ya contenían los bloques anidados.
+    Las columnas ops/arg1/arg2/result se aplanan a un único tramo la primera
+    vez que se consultan (normalmente solo al escribir la salida).
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self._head = self._tail = _Chunk()
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, op, arg1='_', arg2='_', result='_'):
+        intern = self.table.intern
+        tail = self._tail
+        tail.ops.append(OPCODE_INDEX[op])
+        tail.arg1.append(intern(arg1))
+        tail.arg2.append(intern(arg2))
+        tail.result.append(intern(result))
+        self._count += 1
+
+    def extend(self, other):
+        """Mueve (sin copiar) los cuartetos de 'other' al final; 'other' queda vacío."""
+        if other is self or not other._count:
+            return
+        self._tail.next = other._head
+        self._tail = other._tail
+        self._count += other._count
+        other._head = other._tail = _Chunk()
+        other._count = 0
+
+    def clear(self):
+        self._head = self._tail = _Chunk()
+        self._count = 0
+
+    def _flatten(self):
+        head = self._head
+        if head.next is None:
+            return head
+        flat = _Chunk()
+        chunk = head
+        while chunk is not None:
+            flat.ops.extend(chunk.ops)
+            flat.arg1.extend(chunk.arg1)
+            flat.arg2.extend(chunk.arg2)
+            flat.result.extend(chunk.result)
+            chunk = chunk.next
+        self._head = self._tail = flat
+        return flat
+
+    @property
+    def ops(self):
+        return self._flatten().ops
+
+    @property
+    def arg1(self):
+        return self._flatten().arg1
+
+    @property
+    def arg2(self):
+        return self._flatten().arg2
+
+    @property
+    def result(self):
+        return self._flatten().result
+
+    def has_jumps(self):
+        return any(op in JUMP_OPCODES for op in self.ops)
+
+    # ---- Vistas ----
+
+    def rows(self):
+        """Cuartetos como tuplas (op, arg1, arg2, res) con operandos tipados."""
+        value = self.table.value
+        return [(OPCODES[op], value(a), value(b), value(r))
+                for op, a, b, r in zip(self.ops, self.arg1, self.arg2, self.result)]
+
+    def replace(self, rows):
+        self.clear()
+        for row in rows:
+            self.append(*row)
+
+    def write_text(self, f):
+        texts = self.table.texts()
+        def text(oid):
+            return texts[oid] if oid >= 0 else f"@T{-oid}"
+        chunk = self._head
+        while chunk is not None:
+            for op, a, b, r in zip(chunk.ops, chunk.arg1, chunk.arg2, chunk.result):
+                f.write(f"{OPCODES[op]},{text(a)},{text(b)},{text(r)}\n")
+            chunk = chunk.next
+
+
+class QuartetStream(QuartetBuffer):
+    """
+    Buffer de nivel superior para compilar en streaming: cada cuarteto que
+    llega aquí ya es definitivo, así que se escribe enseguida a un fichero
+    temporal con escritura en bloques y se libera. En memoria solo quedan los
+    buffers de control de flujo todavía abiertos. commit() publica el fichero
+    de forma atómica; discard() lo elimina.
+    """
+
+    def __init__(self, table, path, buffer_size=1 << 20):
+        super().__init__(table)
+        self.path = path
+        self._tmp_path = path + '.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8', buffering=buffer_size)
+        self._written = 0
+        self._jumps = False
+
+    def __len__(self):
+        return self._written
+
+    def append(self, op, arg1='_', arg2='_', result='_'):
+        table = self.table
+        a, b, r = table.intern(arg1), table.intern(arg2), table.intern(result)
+        texts = table.texts()
+        self._file.write(f"{op},{texts[a] if a >= 0 else f'@T{-a}'},"
+                         f"{texts[b] if b >= 0 else f'@T{-b}'},"
+                         f"{texts[r] if r >= 0 else f'@T{-r}'}\n")
+        if op in _JUMP_NAMES:
+            self._jumps = True
+        self._written += 1
+
+    def extend(self, other):
+        """Escribe los cuartetos de un bloque ya cerrado; 'other' queda vacío."""
+        if not other._count:
+            return
+        chunk = other._head
+        while chunk is not None:
+            if not self._jumps and not JUMP_OPCODES.isdisjoint(chunk.ops):
+                self._jumps = True
+            chunk = chunk.next
+        other.write_text(self._file)
+        self._written += other._count
+        other.clear()
+
+    def has_jumps(self):
+        return self._jumps
+
+    def commit(self):
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
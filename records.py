@@ -0,0 +1,84 @@
+from types import MappingProxyType
+
+# =============================================================================
+# DISPOSICIÓN PRECALCULADA DE LOS REGISTROS
+# =============================================================================
+#
+# Al declarar un registro se calcula una vez su RecordLayout:
+#   - index: nombre de campo -> posición, y types: nombre -> tipo, para
+#     resolver r.campo sin recorrer la lista de campos (el parser encadena
+#     las posiciones de 'a.b.c' una vez, al reducir cada lvalue);
+#   - template: el valor por defecto, inmutable, del que new_value() saca
+#     copias: una copia plana de los campos básicos más una copia de cada
+#     registro anidado.
+# Los registros anidados de un campo ya tienen su disposición (un campo solo
+# puede ser de un registro declarado antes), así que se reutiliza.
+#
+# Los valores de registro son RecordValue: una lista con un elemento por
+# campo (por posición, sin claves) y una referencia a la tupla de nombres,
+# compartida por todos los valores del mismo registro. Un registro anidado
+# es otro RecordValue, no se aplana en el de fuera: una asignación entre
+# registros comparte el objeto (b = a, new R(a), r.p = a) y eso se ve en
+# los valores que se escriben en .symbols.
+
+BASIC_DEFAULTS = MappingProxyType({'int': 0, 'float': 0.0, 'char': '', 'boolean': False})
+
+
+class RecordValue(list):
+    """Valor de un registro: los campos por posición; names, sus nombres."""
+
+    __slots__ = ('names',)
+
+    def __init__(self, names, values):
+        super().__init__(values)
+        self.names = names
+
+    def items(self):
+        return zip(self.names, self)
+
+
+class RecordLayout:
+    """Disposición de un registro: campos, rutas anidadas y valor por defecto."""
+
+    __slots__ = ('name', 'fields', 'names', 'index', 'types', 'nested', 'template')
+
+    def __init__(self, name, fields, layouts):
+        """fields: [{'name', 'type'}, ...]; layouts: disposiciones ya calculadas."""
+        self.name = name
+        self.fields = tuple((f['name'], f['type']) for f in fields)
+        # Un campo repetido ocupa una sola posición (la de su primera aparición)
+        self.types = {}
+        for fname, ftype in self.fields:
+            self.types.setdefault(fname, ftype)
+        self.names = tuple(self.types)
+        self.index = {fname: i for i, fname in enumerate(self.names)}
+
+        # Con campos repetidos, el valor es el del último (y el tipo, el del
+        # primero), igual que al asignar los campos uno a uno
+        template = [None] * len(self.names)
+        nested = {}
+        for fname, ftype in self.fields:
+            i = self.index[fname]
+            inner = layouts.get(ftype)
+            if inner is None:
+                template[i] = BASIC_DEFAULTS.get(ftype)
+                nested.pop(i, None)
+            else:
+                nested[i] = inner
+        self.nested = tuple(nested.items())
+        self.template = tuple(template)
+
+    def field(self, fname):
+        """Tipo del campo 'fname', o None si el registro no lo tiene."""
+        return self.types.get(fname)
+
+    def new_value(self):
+        """Copia nueva del valor por defecto (los registros anidados, también nuevos)."""
+        value = RecordValue(self.names, self.template)
+        for i, inner in self.nested:
+            value[i] = inner.new_value()
+        return value
+
+    def empty_value(self):
+        """Valor con todos los campos a None, para rellenarlo campo a campo."""
+        return RecordValue(self.names, (None,) * len(self.names))
@@ -0,0 +1,54 @@
+# =============================================================================
+# SCOPES LOCALES SOBRE UNA SOLA TABLA HASH
+# =============================================================================
+#
+# En lugar de una pila de diccionarios (buscar recorre todos los scopes de
+# dentro hacia fuera), ScopeMap guarda para cada nombre solo su declaración
+# visible, enlazada con la que oculta:
+#   bindings[nombre] = (info, profundidad, declaración ocultada o None)
+# y, por scope abierto, la lista de nombres que declaró (undo). Buscar es
+# una consulta al diccionario, sea cual sea la profundidad; cerrar un scope
+# deshace solo sus propias declaraciones, restaurando la cadena de cada
+# nombre. La tabla global sigue siendo symbol_table, fuera de ScopeMap.
+
+
+class ScopeMap:
+    """Pila de scopes locales con búsqueda O(1) y cierre O(declarados)."""
+
+    __slots__ = ('bindings', 'undo')
+
+    def __init__(self):
+        self.bindings = {}
+        self.undo = []
+
+    def __len__(self):
+        return len(self.undo)
+
+    def push(self):
+        self.undo.append([])
+
+    def pop(self):
+        if not self.undo:
+            return
+        bindings = self.bindings
+        for name in reversed(self.undo.pop()):
+            shadowed = bindings[name][2]
+            if shadowed is None:
+                del bindings[name]
+            else:
+                bindings[name] = shadowed
+
+    def get(self, name):
+        """Declaración visible de 'name' en los scopes locales, o None."""
+        entry = self.bindings.get(name)
+        return None if entry is None else entry[0]
+
+    def declared_here(self, name):
+        """True si 'name' ya está declarado en el scope más interno."""
+        entry = self.bindings.get(name)
+        return entry is not None and entry[1] == len(self.undo)
+
+    def declare(self, name, info):
+        """Declara 'name' en el scope más interno (debe haber uno abierto)."""
+        self.bindings[name] = (info, len(self.undo), self.bindings.get(name))
+        self.undo[-1].append(name)
@@ -0,0 +1,30 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import batch  # noqa: E402
+
+
+class RunBatchTest(unittest.TestCase):
+
+    def test_exception_in_one_file_is_a_failed_result(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, source in (('a.lava', "int a = 1/0;\n"), ('b.lava', "int b = 2;\n")):
+                with open(os.path.join(tmp, name), 'w', encoding='utf-8') as f:
+                    f.write(source)
+            out = io.StringIO()
+            results = batch.run_batch([tmp], jobs=2, out=out)
+
+        self.assertEqual([os.path.basename(r[0]) for r in results], ['a.lava', 'b.lava'])
+        self.assertFalse(results[0][1])
+        self.assertIn('division', results[0][2])
+        self.assertTrue(results[1][1])
+        self.assertIn('1 correctos, 1 con errores', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cfg import ControlFlowGraph  # noqa: E402
+
+
+def walk_dominates(cfg, a, b):
+    """Definición directa: a está en la cadena de dominadores inmediatos de b."""
+    while b >= 0:
+        if a == b:
+            return True
+        b = cfg.idom[b]
+    return False
+
+
+def random_quartets(rnd):
+    labels = rnd.randint(1, 10)
+    quartets = []
+    for _ in range(rnd.randint(1, 40)):
+        k = rnd.random()
+        label = f"@L{rnd.randint(1, labels)}"
+        if k < 0.25:
+            quartets.append(('LABEL', label, '_', '_'))
+        elif k < 0.35:
+            quartets.append(('JUMP', label, '_', '_'))
+        elif k < 0.5:
+            quartets.append(('JUMPF', 'c', label, '_'))
+        else:
+            quartets.append(('ASSIGN', 1, '_', 'x'))
+    return quartets
+
+
+class DominatesTest(unittest.TestCase):
+
+    def test_intervals_match_idom_chain(self):
+        for seed in range(200):
+            cfg = ControlFlowGraph(random_quartets(random.Random(seed)))
+            for a in range(len(cfg)):
+                for b in range(len(cfg)):
+                    self.assertEqual(cfg.dominates(a, b), walk_dominates(cfg, a, b),
+                                     (seed, a, b))
+
+    def test_unreachable_block(self):
+        cfg = ControlFlowGraph([('JUMP', '@L1', '_', '_'), ('ASSIGN', 1, '_', 'x'),
+                                ('LABEL', '@L1', '_', '_')])
+        self.assertEqual(len(cfg), 3)
+        self.assertTrue(cfg.dominates(1, 1))
+        self.assertFalse(cfg.dominates(0, 1))
+        self.assertFalse(cfg.dominates(1, 2))
+        self.assertTrue(cfg.dominates(0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+# Compila dos versiones de un fichero con la caché incremental en un proceso
+# limpio y lista los módulos del paquete que se han cargado
+LOADED_MODULES = r"""
+import io, os, sys, tempfile
+sys.path.insert(0, ROOT)
+from compile_cache import CompileCache
+with tempfile.TemporaryDirectory() as tmp:
+    cache = CompileCache(os.path.join(tmp, 'cache'))
+    path = os.path.join(tmp, 'x.lava')
+    for source in ("int a = 1;\n", "int a = 2;\nint b = a;\n"):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        cache.analyze(source, path, out=io.StringIO(), incremental=True)
+for m in list(sys.modules.values()):
+    f = getattr(m, '__file__', None)
+    if f and os.path.dirname(os.path.abspath(f)) == ROOT:
+        print(os.path.basename(f))
+"""
+
+
+class CompilerVersionTest(unittest.TestCase):
+
+    def test_every_compiler_module_is_hashed(self):
+        sys.path.insert(0, ROOT)
+        import compile_cache
+        result = subprocess.run([sys.executable, '-c', f"ROOT = {ROOT!r}\n" + LOADED_MODULES],
+                                capture_output=True, text=True, check=True)
+        loaded = set(result.stdout.split())
+        self.assertIn('incremental.py', loaded)
+        self.assertLessEqual(loaded, set(compile_cache.COMPILER_FILES))
+
+
+class EvictionTest(unittest.TestCase):
+
+    def compile_all(self, cache, tmp, first, count):
+        path = os.path.join(tmp, 'x.lava')
+        for i in range(first, first + count):
+            source = f"int a = {i};\n"
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(source)
+            cache.analyze(source, path, out=io.StringIO())
+
+    def test_scans_only_when_over_limit(self):
+        sys.path.insert(0, ROOT)
+        from compile_cache import CompileCache
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = CompileCache(os.path.join(tmp, 'cache'), max_bytes=10 ** 9)
+            self.compile_all(cache, tmp, 0, 1)      # sin índice: un recorrido
+            with mock.patch.object(CompileCache, '_entries', autospec=True,
+                                   side_effect=CompileCache._entries) as entries:
+                self.compile_all(cache, tmp, 1, 20)
+                self.assertEqual(entries.call_count, 0)
+                total = cache._read_total()
+                self.assertEqual(total, sum(size for _, size, _ in cache._entries()))
+                # Con un límite menor que el total, el siguiente guardado expulsa
+                cache.max_bytes = total // 2
+                entries.reset_mock()
+                self.compile_all(cache, tmp, 21, 1)
+                self.assertGreater(entries.call_count, 0)
+                self.assertGreater(cache.evictions, 0)
+                remaining = sum(size for _, size, _ in cache._entries())
+                self.assertEqual(cache._read_total(), remaining)
+                self.assertLessEqual(remaining, cache.max_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
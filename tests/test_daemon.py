@@ -0,0 +1,46 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import daemon  # noqa: E402
+
+
+class ServeStdioTest(unittest.TestCase):
+
+    def test_crashing_request_does_not_stop_the_loop(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            requests = [
+                {'id': 1, 'source': "int a = 1/0;\n", 'output': os.path.join(tmp, 'a.lava')},
+                {'id': 2, 'source': "int b = 2;\n", 'output': os.path.join(tmp, 'b.lava')},
+            ]
+            infile = io.StringIO(''.join(json.dumps(r) + '\n' for r in requests))
+            outfile = io.StringIO()
+            daemon.serve_stdio(infile, outfile)
+            replies = [json.loads(line) for line in outfile.getvalue().splitlines()]
+
+        self.assertEqual([r['id'] for r in replies], [1, 2])
+        self.assertFalse(replies[0]['ok'])
+        self.assertIn('error', replies[0])
+        self.assertTrue(replies[1]['ok'])
+
+    def test_boolean_opt_level_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            requests = [{'id': i, 'source': "int a = 1;\n", 'opt_level': level,
+                         'output': os.path.join(tmp, 'a.lava')}
+                        for i, level in enumerate((True, False, 1.0, 2))]
+            infile = io.StringIO(''.join(json.dumps(r) + '\n' for r in requests))
+            outfile = io.StringIO()
+            daemon.serve_stdio(infile, outfile)
+            replies = [json.loads(line) for line in outfile.getvalue().splitlines()]
+
+        self.assertEqual([r['ok'] for r in replies], [False, False, False, True])
+        self.assertIn('optimización', replies[0]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser  # noqa: E402
+
+
+def compile_outputs(source, opt_level):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x.lava')
+        assert lava_parser.analyze(source, path, opt_level, out=io.StringIO())
+        outputs = {}
+        for ext in ('symbols', 'quartets'):
+            with open(os.path.join(tmp, 'x.' + ext), encoding='utf-8') as f:
+                outputs[ext] = f.read()
+        return outputs
+
+
+class FoldingTest(unittest.TestCase):
+
+    def test_symbols_without_jumps_match_O0(self):
+        # El 'if' sobre un campo de registro no genera cuartetos: el programa
+        # no tiene saltos y .symbols muestra valores en ambos niveles
+        source = ("record R(boolean a, int n);\nR r = new R(true, 4);\nint x = 1;\n"
+                  "if (r.a) { x = 2; }\nint y = x + 1;\nint z = y * 2;\n")
+        o0 = compile_outputs(source, 0)
+        o1 = compile_outputs(source, 1)
+        self.assertEqual(o1['symbols'], o0['symbols'])
+        self.assertIn('y:int,3', o1['symbols'])
+        # x se reasignó dentro del 'if': ni x ni lo que se calcula con x se pliega
+        self.assertNotIn('ASSIGN,3,_,y', o1['quartets'])
+        self.assertNotIn('ASSIGN,6,_,z', o1['quartets'])
+
+    def test_straight_line_values_still_fold(self):
+        o1 = compile_outputs("int x = 1;\nint y = x + 1;\nint z = y * 2;\n", 1)
+        self.assertEqual(o1['quartets'], "ASSIGN,1,_,x\nASSIGN,2,_,y\nASSIGN,4,_,z\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
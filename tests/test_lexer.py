@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import fastlex  # noqa: E402
+import tokenfile  # noqa: E402
+from lexer import lexer, reset_lexer  # noqa: E402
+
+
+def ply_tokens(source):
+    lexobj = lexer.clone()
+    reset_lexer(lexobj, source)
+    return list(tokenfile.iter_tokens(lexobj))
+
+
+def engines(source):
+    return {
+        'ply': ply_tokens(source),
+        'fast': list(fastlex.iter_tokens(source)),
+        'bytes': list(fastlex.iter_tokens(source.encode('utf-8'))),
+    }
+
+
+class ColumnsTest(unittest.TestCase):
+
+    def test_columns_after_newline_char_literal(self):
+        # La columna se cuenta desde el último '\n' del texto, aunque esté
+        # dentro del literal (y la línea no avanza)
+        source = "char c = '\n'; int x = 1;\nchar d = 'ñ'; char e = '\n';x"
+        for name, tokens in engines(source).items():
+            with self.subTest(engine=name):
+                self.assertEqual(tokens[4], ('SEMICOLON', ';', 1, 1, 2))
+                self.assertEqual(tokens[5], ('INT', 'int', 1, 3, 6))
+                self.assertEqual(tokens[-2:], [('SEMICOLON', ';', 2, 1, 2), ('ID', 'x', 2, 2, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'main.py')
+
+
+def write_source(tmp, source):
+    path = os.path.join(tmp, 'x.lava')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return path
+
+
+class RunTest(unittest.TestCase):
+
+    def test_stdout_is_only_program_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_source(tmp, "int a = 1;\nint b = a + 2;\nprint(b);\n")
+            result = subprocess.run([sys.executable, MAIN, '-O2', '--run', path],
+                                    capture_output=True, text=True, cwd=tmp)
+            self.assertEqual(result.returncode, 0)
+            self.assertEqual(result.stdout, "3\n")
+            self.assertIn('[OPTIMIZACIÓN]', result.stderr)
+
+    def test_source_runs_without_output_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_source(tmp, "int a = 1;\nprint(a);\nint b = @;\n")
+            result = subprocess.run([sys.executable, MAIN, '--run', path],
+                                    capture_output=True, text=True, cwd=tmp)
+            self.assertEqual(result.returncode, 1)
+            self.assertEqual(result.stdout, "")
+            self.assertIn('Carácter ilegal', result.stderr)
+
+            write_source(tmp, "int a = 1;\nprint(a);\n")
+            result = subprocess.run([sys.executable, MAIN, '--run', path],
+                                    capture_output=True, text=True, cwd=tmp)
+            self.assertEqual(result.stdout, "1\n")
+            self.assertEqual(os.listdir(tmp), ['x.lava'])
+
+
+class StreamFlagsTest(unittest.TestCase):
+
+    def test_stream_rejects_incremental(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_source(tmp, "int a = 1;\n")
+            result = subprocess.run([sys.executable, MAIN, '--incremental', '--stream', path],
+                                    capture_output=True, text=True, cwd=tmp)
+            self.assertEqual(result.returncode, 1)
+            self.assertIn('--stream no admite --incremental', result.stdout)
+            self.assertFalse(os.path.exists(os.path.join(tmp, 'x.quartets')))
+
+
+if __name__ == '__main__':
+    unittest.main()
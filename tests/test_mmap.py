@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MAIN = os.path.join(ROOT, 'main.py')
+
+SOURCES = {
+    'cr': b"int a = 1;\rint b = @;\rchar c = 'x';\r",
+    'mixed': b"int a = 1;\r\nint b = 2;\rchar c = '\r';\nint d = @;\n",
+    'crlf': b"int a = 1;\r\nchar c = '\r\n';\r\nint d = @;\r\n",
+    'crlf_ok': b"int a = 1;\r\nchar c = 'z';\r\nint d = a + 2;\r\n",
+}
+
+
+def run(flags, path):
+    result = subprocess.run([sys.executable, MAIN, *flags, path],
+                            capture_output=True, text=True, cwd=os.path.dirname(path))
+    return result.stdout
+
+
+class CarriageReturnTest(unittest.TestCase):
+    """--mmap da las mismas líneas y valores que la lectura en modo texto."""
+
+    def test_diagnostics_and_outputs_match_text_mode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, data in SOURCES.items():
+                path = os.path.join(tmp, name + '.lava')
+                with open(path, 'wb') as f:
+                    f.write(data)
+                outputs = {}
+                for flags in ((), ('--fast',), ('--mmap',)):
+                    diagnostics = run(flags, path)
+                    files = {}
+                    for ext in ('symbols', 'quartets'):
+                        out_path = os.path.join(tmp, f"{name}.{ext}")
+                        if os.path.exists(out_path):
+                            with open(out_path, encoding='utf-8') as f:
+                                files[ext] = f.read()
+                            os.remove(out_path)
+                    run(flags + ('--token',), path)
+                    with open(os.path.join(tmp, name + '.token'), encoding='utf-8') as f:
+                        files['token'] = f.read()
+                    outputs[flags] = (diagnostics, files)
+                with self.subTest(source=name):
+                    self.assertEqual(outputs[('--mmap',)], outputs[()])
+                    self.assertEqual(outputs[('--fast',)], outputs[()])
+
+    def test_lone_cr_is_a_line_break(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cr.lava')
+            with open(path, 'wb') as f:
+                f.write(SOURCES['cr'])
+            self.assertIn("Carácter ilegal '@' en la línea 2", run(('--mmap',), path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import parser as lava_parser  # noqa: E402
+from vm import QuartetVM, VMError, load_quartets  # noqa: E402
+
+
+def run_text(source, opt_level=0):
+    """Compila, ejecuta el .quartets en texto y devuelve lo que imprime."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'x.lava')
+        assert lava_parser.analyze(source, path, opt_level, out=io.StringIO())
+        out = io.StringIO()
+        QuartetVM(load_quartets(os.path.join(tmp, 'x.quartets')), out=out).run()
+        return out.getvalue()
+
+
+class TextQuartetsTest(unittest.TestCase):
+
+    def test_char_literal_named_like_a_variable(self):
+        source = ("char c = 'b';\nint ci = c + 1;\nboolean b = true;\n"
+                  "print(ci);\nprint(b);\n")
+        for opt_level in (0, 1, 2):
+            with self.subTest(opt_level=opt_level):
+                self.assertEqual(run_text(source, opt_level), "99\ntrue\n")
+
+    def test_comma_literal(self):
+        source = "char cc = ',';\nboolean e = cc == ',';\nprint(e);\nprint(cc);\n"
+        self.assertEqual(run_text(source), "true\n,\n")
+
+    def test_char_conversion_of_unset_value(self):
+        for op in ('CHAR_TO_INT', 'CHAR_TO_FLOAT'):
+            with self.subTest(op=op):
+                vm = QuartetVM([(op, 'c', '_', '@T1'), ('PRINT', '@T1', '_', '_')],
+                               out=io.StringIO())
+                with self.assertRaisesRegex(VMError, 'sin inicializar'):
+                    vm.run()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+import struct
+import sys
+from array import array
+from itertools import islice
+
+# =============================================================================
+# VOLCADO DE TOKENS: .token (texto) Y .token.bin (columnas)
+# =============================================================================
+#
+# iter_tokens() recorre el lexer y produce tuplas
+#   (tipo, lexema, línea, columna_inicio, columna_fin)
+# que se escriben en texto con escrituras grandes (write_text) o en el
+# formato binario .token.bin (write_binary), que se carga sin analizar texto
+# con TokenFile.
+#
+# Formato .token.bin, little-endian:
+#   cabecera (64 bytes)
+#     magic 'LVK1', versión u16, relleno u16, nº de tokens u64, nº de tipos
+#     u32, nº de lexemas u32, y los desplazamientos u64 de cada sección.
+#   nombres de tipo   UTF-8 separados por '\n' (el índice es el id de tipo)
+#   types             u8  por token: id de tipo
+#   lines             u32 por token
+#   col_starts        u32 por token
+#   col_ends          u32 por token
+#   lexeme_ids        u32 por token: índice en la tabla de lexemas
+#   lexeme_offsets    u32 por lexema + 1: inicio de cada lexema en el pool
+#   pool              lexemas distintos en UTF-8, concatenados
+# Las secciones numéricas empiezan en múltiplos de 4.
+
+MAGIC = b'LVK1'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQIIQQQQQQQQ')
+
+TEXT_BATCH = 8192
+TEXT_LINE = '%s, %s, %d, %d, %d\n'
+
+
+class TokenFileError(Exception):
+    pass
+
+
+def iter_tokens(lexobj):
+    """Tokens del lexer (ya preparado con reset_lexer) como tuplas."""
+    while True:
+        tok = lexobj.token()
+        if not tok:
+            return
+        lexeme = str(getattr(tok, 'raw_value', tok.value))
+        if hasattr(tok, 'col_start'):
+            col_start, col_end = tok.col_start, tok.col_end
+        else:
+            # Tokens de reglas de cadena: no llevan .lexer, pero acaban de
+            # reconocerse, así que vale el inicio de línea actual
+            col_start = tok.lexpos - lexobj.line_start
+            col_end = col_start + len(lexeme)
+        yield tok.type, lexeme, tok.lineno, col_start, col_end
+
+
+# =============================================================================
+# ESCRITURA
+# =============================================================================
+
+def write_text(tokens, path):
+    """Formato .token: una línea 'TIPO, lexema, línea, inicio, fin' por token."""
+    line = TEXT_LINE.__mod__
+    tokens = iter(tokens)
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        while True:
+            batch = ''.join(map(line, islice(tokens, TEXT_BATCH)))
+            if not batch:
+                break
+            f.write(batch)
+
+
+def _le_bytes(arr):
+    if sys.byteorder == 'big':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _pad4(data):
+    return data + bytes(-len(data) % 4)
+
+
+def write_binary(tokens, path):
+    """Formato .token.bin (ver la cabecera del módulo)."""
+    type_index = {}
+    lexeme_index = {}
+    types = array('B')
+    lines, col_starts, col_ends, lexeme_ids = (array('I') for _ in range(4))
+    for tok_type, lexeme, line, col_start, col_end in tokens:
+        tid = type_index.get(tok_type)
+        if tid is None:
+            tid = type_index[tok_type] = len(type_index)
+        lid = lexeme_index.get(lexeme)
+        if lid is None:
+            lid = lexeme_index[lexeme] = len(lexeme_index)
+        types.append(tid)
+        lines.append(line)
+        col_starts.append(col_start)
+        col_ends.append(col_end)
+        lexeme_ids.append(lid)
+
+    pool = bytearray()
+    offsets = array('I', [0])
+    for lexeme in lexeme_index:
+        pool += lexeme.encode('utf-8')
+        offsets.append(len(pool))
+
+    sections = [
+        _pad4('\n'.join(type_index).encode('utf-8')),
+        _pad4(types.tobytes()),
+        _le_bytes(lines),
+        _le_bytes(col_starts),
+        _le_bytes(col_ends),
+        _le_bytes(lexeme_ids),
+        _le_bytes(offsets),
+        bytes(pool),
+    ]
+    section_offsets = []
+    pos = HEADER.size
+    for data in sections:
+        section_offsets.append(pos)
+        pos += len(data)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(types), len(type_index),
+                            len(lexeme_index), *section_offsets))
+        for data in sections:
+            f.write(data)
+
+
+# =============================================================================
+# LECTURA
+# =============================================================================
+
+class TokenFile:
+    """
+    Contenido de un .token.bin. Las columnas (types, lines, col_starts,
+    col_ends, lexeme_ids) son array; type_names y lexemes, listas de str.
+    Indexar devuelve la misma tupla que iter_tokens().
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise TokenFileError(f"'{path}' no es un fichero .token.bin.")
+        (magic, version, _, n, ntypes, nlexemes,
+         names_off, types_off, lines_off, starts_off, ends_off,
+         ids_off, offsets_off, pool_off) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise TokenFileError(f"'{path}' no es un .token.bin compatible.")
+
+        def column(typecode, offset, count):
+            arr = array(typecode)
+            arr.frombytes(data[offset:offset + arr.itemsize * count])
+            if sys.byteorder == 'big':
+                arr.byteswap()
+            return arr
+
+        names = data[names_off:types_off].rstrip(b'\0').decode('utf-8')
+        self.type_names = names.split('\n') if ntypes else []
+        self.types = column('B', types_off, n)
+        self.lines = column('I', lines_off, n)
+        self.col_starts = column('I', starts_off, n)
+        self.col_ends = column('I', ends_off, n)
+        self.lexeme_ids = column('I', ids_off, n)
+        offsets = column('I', offsets_off, nlexemes + 1)
+        pool = data[pool_off:]
+        self.lexemes = [pool[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(nlexemes)]
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, i):
+        return (self.type_names[self.types[i]], self.lexemes[self.lexeme_ids[i]],
+                self.lines[i], self.col_starts[i], self.col_ends[i])
+
+    def __iter__(self):
+        names, lexemes = self.type_names, self.lexemes
+        for tid, lid, line, start, end in zip(self.types, self.lexeme_ids, self.lines,
+                                              self.col_starts, self.col_ends):
+            yield names[tid], lexemes[lid], line, start, end
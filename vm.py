@@ -0,0 +1,283 @@
+import sys
+
+from liveness import recycle_temps
+from quartet_store import Char
+
+# =============================================================================
+# MÁQUINA VIRTUAL DE CUARTETOS
+# =============================================================================
+#
+# Ejecuta el programa de cuartetos generado por parser.analyze(). La carga se
+# hace una sola vez:
+#   - las etiquetas se resuelven a índices de instrucción (LABEL desaparece),
+#   - cada operando se decodifica a un slot del marco (variables, temporales y
+#     constantes ya tipadas comparten el mismo array),
+#   - cada operación se traduce a su manejador en la tabla HANDLERS,
+#   - los temporales se renumeran por intervalos de vida (liveness), así que el
+#     marco crece con el máximo de valores vivos y no con la longitud.
+# El bucle de ejecución solo indexa listas: no hay trabajo con cadenas.
+
+class VMError(Exception):
+    """Error de carga o de ejecución de un programa de cuartetos."""
+    pass
+
+
+# =============================================================================
+# LECTURA DE CUARTETOS EN TEXTO
+# =============================================================================
+
+def parse_quartet_line(line):
+    """Divide 'OP,arg1,arg2,res' tolerando el literal char ',' en arg1 o arg2."""
+    op, rest = line.split(',', 1)
+    args = []
+    for _ in range(2):
+        if rest.startswith("'") and rest[2:4] == "',":
+            arg, rest = rest[:3], rest[4:]
+        else:
+            arg, rest = rest.split(',', 1)
+        args.append(arg)
+    return (op, args[0], args[1], rest)
+
+
+def load_quartets(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [parse_quartet_line(line.rstrip('\n')) for line in f if line.strip()]
+
+
+# =============================================================================
+# DECODIFICACIÓN DE OPERANDOS
+# =============================================================================
+
+_UNSET = None
+_NUMERIC_START = set('-0123456789.')
+
+
+def _decode_constant(text):
+    """Devuelve (True, valor) si el operando es una constante literal."""
+    if text == 'true':  return True, True
+    if text == 'false': return True, False
+    if text == "''":    return True, ''
+    if len(text) == 3 and text[0] == text[2] == "'":
+        return True, text[1]
+    if text[0] in _NUMERIC_START:
+        try:
+            return True, int(text)
+        except ValueError:
+            pass
+        try:
+            return True, float(text)
+        except ValueError:
+            pass
+    return False, None
+
+
+def _show(value):
+    if value is True:  return 'true'
+    if value is False: return 'false'
+    return str(value)
+
+
+# =============================================================================
+# MANEJADORES
+# =============================================================================
+#
+# Firma común: (marco, a, b, r, siguiente) -> índice de la próxima instrucción.
+# a, b y r son slots del marco salvo en los saltos, donde el destino ya es un
+# índice de instrucción.
+
+def _op_assign(f, a, b, r, nxt):
+    f[r] = f[a]; return nxt
+
+def _op_add(f, a, b, r, nxt):
+    f[r] = f[a] + f[b]; return nxt
+
+def _op_sub(f, a, b, r, nxt):
+    f[r] = f[a] - f[b]; return nxt
+
+def _op_mul(f, a, b, r, nxt):
+    f[r] = f[a] * f[b]; return nxt
+
+def _op_div(f, a, b, r, nxt):
+    x = f[a]; y = f[b]
+    f[r] = x // y if type(x) is int and type(y) is int else x / y
+    return nxt
+
+def _op_gt(f, a, b, r, nxt):
+    f[r] = f[a] > f[b]; return nxt
+
+def _op_gte(f, a, b, r, nxt):
+    f[r] = f[a] >= f[b]; return nxt
+
+def _op_lt(f, a, b, r, nxt):
+    f[r] = f[a] < f[b]; return nxt
+
+def _op_lte(f, a, b, r, nxt):
+    f[r] = f[a] <= f[b]; return nxt
+
+def _op_eq(f, a, b, r, nxt):
+    f[r] = f[a] == f[b]; return nxt
+
+def _op_and(f, a, b, r, nxt):
+    f[r] = f[a] and f[b]; return nxt
+
+def _op_or(f, a, b, r, nxt):
+    f[r] = f[a] or f[b]; return nxt
+
+def _op_not(f, a, b, r, nxt):
+    f[r] = not f[a]; return nxt
+
+def _op_uminus(f, a, b, r, nxt):
+    f[r] = -f[a]; return nxt
+
+def _op_uplus(f, a, b, r, nxt):
+    f[r] = +f[a]; return nxt
+
+def _op_char_to_int(f, a, b, r, nxt):
+    v = f[a]
+    if v is _UNSET:
+        raise TypeError("valor sin inicializar")
+    f[r] = ord(v) if v else 0
+    return nxt
+
+def _op_int_to_float(f, a, b, r, nxt):
+    f[r] = float(f[a]); return nxt
+
+def _op_char_to_float(f, a, b, r, nxt):
+    v = f[a]
+    if v is _UNSET:
+        raise TypeError("valor sin inicializar")
+    f[r] = float(ord(v)) if v else 0.0
+    return nxt
+
+def _op_jump(f, a, b, r, nxt):
+    return a
+
+def _op_jumpf(f, a, b, r, nxt):
+    return nxt if f[a] else b
+
+def _op_jumpt(f, a, b, r, nxt):
+    return b if f[a] else nxt
+
+
+HANDLERS = {
+    'ASSIGN': _op_assign,
+    'ADD': _op_add, 'SUB': _op_sub, 'MUL': _op_mul, 'DIV': _op_div,
+    'GT': _op_gt, 'GTE': _op_gte, 'LT': _op_lt, 'LTE': _op_lte, 'EQ': _op_eq,
+    'AND': _op_and, 'OR': _op_or, 'NOT': _op_not,
+    'UMINUS': _op_uminus, 'UPLUS': _op_uplus,
+    'CHAR_TO_INT': _op_char_to_int, 'INT_TO_FLOAT': _op_int_to_float,
+    'CHAR_TO_FLOAT': _op_char_to_float,
+    'JUMP': _op_jump, 'JUMPF': _op_jumpf, 'JUMPT': _op_jumpt,
+}
+
+
+# =============================================================================
+# MÁQUINA VIRTUAL
+# =============================================================================
+
+class QuartetVM:
+    """
+    Carga una secuencia de cuartetos (op, arg1, arg2, res) y la ejecuta.
+    Con typed=False los operandos son el texto de un fichero .quartets; con
+    typed=True vienen de QuartetBuffer.rows() (constantes ya tipadas y Char
+    para los literales char), sin heurísticas de decodificación.
+    La salida de PRINT se escribe en 'out' (por defecto sys.stdout).
+    """
+
+    def __init__(self, quartets, out=None, typed=False):
+        self.out = out if out is not None else sys.stdout
+        self._typed = typed
+        self._slots = {}          # (tipo, operando) -> slot
+        self._template = []       # valores iniciales del marco
+        self._variables = {}      # nombre de variable -> slot
+        self._source = []         # cuarteto original de cada instrucción
+        self._code = []
+        quartets, self.temp_count = recycle_temps(list(quartets))
+        self._load(quartets)
+
+    # ---- Carga ----
+
+    def _load(self, quartets):
+        labels = {}
+        body = []
+        for q in quartets:
+            if q[0] == 'LABEL':
+                labels[q[1]] = len(body)
+            else:
+                body.append(q)
+
+        handlers = dict(HANDLERS)
+        handlers['PRINT'] = self._make_print()
+
+        code = self._code
+        for index, (op, arg1, arg2, result) in enumerate(body):
+            handler = handlers.get(op)
+            if handler is None:
+                raise VMError(f"Operación no soportada en el cuarteto {index + 1}: '{op}'.")
+            if op == 'JUMP':
+                a, b = self._target(labels, arg1), 0
+            elif op in ('JUMPF', 'JUMPT'):
+                a, b = self._slot(arg1), self._target(labels, arg2)
+            else:
+                a, b = self._slot(arg1), self._slot(arg2)
+            r = self._slot(result)
+            code.append((handler, a, b, r, index + 1))
+            self._source.append((op, arg1, arg2, result))
+
+    def _target(self, labels, name):
+        if name not in labels:
+            raise VMError(f"Etiqueta '{name}' no definida.")
+        return labels[name]
+
+    def _slot(self, text):
+        key = (type(text), text)
+        slot = self._slots.get(key)
+        if slot is not None:
+            return slot
+        slot = len(self._template)
+        self._slots[key] = slot
+        if isinstance(text, Char):
+            self._template.append(str(text))
+        elif not isinstance(text, str):
+            self._template.append(text)
+        elif text == '_':
+            self._template.append(_UNSET)
+        else:
+            # En texto los literales char van entre comillas ('b'), así que
+            # un nombre sin comillas siempre es una variable o un temporal
+            is_const, value = (False, None) if self._typed else _decode_constant(text)
+            self._template.append(value if is_const else _UNSET)
+            if not is_const and not text.startswith('@'):
+                self._variables[text] = slot
+        return slot
+
+    def _make_print(self):
+        write = self.out.write
+        def _op_print(f, a, b, r, nxt):
+            v = f[a]
+            if v is _UNSET:
+                raise TypeError("valor sin inicializar")
+            write(_show(v) + '\n')
+            return nxt
+        return _op_print
+
+    # ---- Ejecución ----
+
+    @property
+    def frame_size(self):
+        return len(self._template)
+
+    def run(self):
+        """Ejecuta el programa y devuelve {variable: valor final}."""
+        code = self._code
+        n = len(code)
+        f = list(self._template)
+        pc = 0
+        try:
+            while pc < n:
+                h, a, b, r, nxt = code[pc]
+                pc = h(f, a, b, r, nxt)
+        except (TypeError, ZeroDivisionError) as e:
+            quartet = ','.join(_show(x) for x in self._source[pc])
+            raise VMError(f"Instrucción {pc + 1} ({quartet}): {e}") from None
+        return {name: f[slot] for name, slot in self._variables.items()}